@@ -0,0 +1,7 @@
+"""
+운영용 일회성 커맨드 (python -m app.commands.<name>)
+"""
+from app.database.db import load_env
+
+# 커맨드 모듈이 import 시점에 읽는 환경 변수도 app/database/.env 를 따르도록 먼저 로드
+load_env()
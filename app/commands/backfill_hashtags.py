@@ -0,0 +1,61 @@
+"""
+기존 게시물의 posts.hashtags 로 post_hashtags 인덱스 테이블 채우기
+
+    python -m app.commands.backfill_hashtags [--batch-size 500]
+
+post_hashtags 테이블은 먼저 python -m app.commands.init_db 로 만든다
+"""
+import argparse
+import asyncio
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.database.db import session_factory
+from app import models  # pylint: disable=unused-import
+from app.models.post import Post as PostTable
+from app.services.post import sync_hashtag_index
+
+
+async def backfill_hashtags(db: AsyncSession, batch_size: int = 500) -> int:
+    """
+    게시물 id 순서대로 배치 단위로 해시태그 인덱스를 다시 맞춘다 (여러 번 돌려도 안전)
+    :return: 처리한 게시물 수
+    """
+    processed = 0
+    last_id = 0
+    while True:
+        posts: List[PostTable] = list((await db.scalars(
+            select(PostTable)
+            .options(selectinload(PostTable.hashtag_index))
+            .where(PostTable.id > last_id)
+            .order_by(PostTable.id)
+            .limit(batch_size)
+        )).all())
+        if not posts:
+            return processed
+        for post in posts:
+            sync_hashtag_index(post, post.hashtags or [])
+        await db.commit()
+        processed += len(posts)
+        last_id = posts[-1].id
+        db.expunge_all()
+
+
+async def run(batch_size: int) -> int:
+    async with session_factory()() as db:
+        return await backfill_hashtags(db, batch_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="post_hashtags 인덱스 백필")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"Backfilled hashtags for {asyncio.run(run(args.batch_size))} posts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+기존 게시물 이미지의 썸네일/WebP 변환본 만들기
+변환본이 없는 이미지마다 image_variant_jobs 에 작업을 넣고, --enqueue-only 가 아니면 여기서 바로 처리한다
+
+    python -m app.commands.generate_image_variants [--batch-size 100] [--enqueue-only]
+"""
+import argparse
+import asyncio
+from typing import List
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.db import session_factory
+from app import models  # pylint: disable=unused-import
+from app.models.post import Post as PostTable
+from app.models.variant import ImageVariantJob
+from app.services.image_variant import process_variant_jobs
+from app.utils import variants
+
+
+async def enqueue_missing_variants(db: AsyncSession, batch_size: int = 100) -> int:
+    """
+    게시물 id 순서대로 변환본이 없는 이미지의 작업 추가 (작업이 이미 있는 게시물은 건너뛴다)
+    :return: 추가한 작업 수
+    """
+    queued = 0
+    last_id = 0
+    while True:
+        posts: List[PostTable] = list((await db.scalars(
+            select(PostTable)
+            .where(PostTable.id > last_id, ~exists().where(ImageVariantJob.post_id == PostTable.id))
+            .order_by(PostTable.id)
+            .limit(batch_size)
+        )).all())
+        if not posts:
+            return queued
+        for post in posts:
+            ready = post.image_variants or []
+            for position, image_url in enumerate(post.image_urls or []):
+                if position >= len(ready) or not ready[position]:
+                    db.add(ImageVariantJob(post_id=post.id, position=position, image_url=image_url))
+                    queued += 1
+        await db.commit()
+        last_id = posts[-1].id
+        db.expunge_all()
+
+
+async def run(batch_size: int, enqueue_only: bool) -> int:
+    try:
+        async with session_factory()() as db:
+            queued = await enqueue_missing_variants(db, batch_size)
+            if not enqueue_only:
+                # 실패한 작업은 재시도 시각이 뒤로 밀려서 더 가져갈 게 없으면 끝난다 (남은 건 워커가 재시도)
+                while await process_variant_jobs(db, batch_size):
+                    pass
+            return queued
+    finally:
+        await variants.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지 변환본 생성")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--enqueue-only", action="store_true", help="작업만 넣고 처리는 앱의 워커에 맡긴다")
+    args = parser.parse_args()
+
+    print(f"Queued variants for {asyncio.run(run(args.batch_size, args.enqueue_only))} images")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+모델 기준으로 없는 테이블/인덱스 생성 (앱 시작 시에는 스키마를 건드리지 않는다)
+
+    python -m app.commands.init_db
+"""
+import asyncio
+
+from app.database import db
+from app import models  # pylint: disable=unused-import
+
+
+async def init_db() -> None:
+    """
+    Base.metadata.create_all (이미 있는 테이블은 그대로 둔다)
+    """
+    db.init_engines()
+    async with db.engine.begin() as conn:
+        await conn.run_sync(db.Base.metadata.create_all)
+    await db.dispose_engines()
+
+
+def main():
+    asyncio.run(init_db())
+    print("Database schema is up to date")
+
+
+if __name__ == "__main__":
+    main()
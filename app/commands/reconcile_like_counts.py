@@ -0,0 +1,48 @@
+"""
+posts.like_count 를 likes 테이블 기준으로 다시 맞추기 (카운터 드리프트 복구)
+
+    python -m app.commands.reconcile_like_counts
+"""
+import asyncio
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.db import session_factory
+from app import models  # pylint: disable=unused-import
+from app.models.post import Post as PostTable
+from app.models.post import Like as LikeTable
+
+
+async def reconcile_like_counts(db: AsyncSession) -> int:
+    """
+    실제 좋아요 수와 다른 게시물만 한 번의 UPDATE 로 고친다
+    :return: 고친 게시물 수
+    """
+    actual = (
+        # pylint: disable=not-callable
+        select(func.count(LikeTable.id))
+        .where(LikeTable.post_id == PostTable.id)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        update(PostTable)
+        .where(PostTable.like_count != actual)
+        .values(like_count=actual)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def run() -> int:
+    async with session_factory()() as db:
+        return await reconcile_like_counts(db)
+
+
+def main():
+    print(f"Reconciled like_count for {asyncio.run(run())} posts")
+
+
+if __name__ == "__main__":
+    main()
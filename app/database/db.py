@@ -1,22 +1,51 @@
 """
 database 터널링 & 세션 생성
+엔진, SSH 터널은 import 시점이 아니라 처음 쓸 때(또는 init_engines 호출 시) 만든다
 """
 import atexit
 import os
-
+from functools import lru_cache
 from dotenv import load_dotenv
 from fastapi import HTTPException
-from sshtunnel import SSHTunnelForwarder, BaseSSHTunnelForwarderError
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from app.database.pool import pool_options_from_env, instrument_pool
+from app.database.query_stats import instrument_queries
+
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+# init_engines 가 채우는 값 (None 이면 아직 안 만든 것, session_factory() 는 필요하면 만들어서 반환)
+# pylint: disable=invalid-name
+engine = None
+SessionLocal = None
+replica_engine = None
+ReadSessionLocal = None
+_tunnel = None
+# pylint: enable=invalid-name
+
 
-load_dotenv()
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """
+    app/database/.env 를 환경 변수로 읽는다 (이미 있는 값은 그대로, 한 번만)
+    """
+    load_dotenv(ENV_FILE)
+
+
+def _start_tunnel() -> None:
+    """
+    로컬 개발(ENV=local-dev)이면 DB 까지 SSH 터널을 연다
+    """
+    global _tunnel  # pylint: disable=global-statement
+    if _tunnel is not None or os.getenv("ENV") != "local-dev":
+        return
+    # pylint: disable=import-outside-toplevel
+    from sshtunnel import SSHTunnelForwarder, BaseSSHTunnelForwarderError
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-if os.getenv("ENV") == "local-dev":
     ssh_host = os.getenv("SSH_HOST")
     ssh_user = os.getenv("SSH_USER")
     db_host = os.getenv("DB_HOST")
@@ -38,21 +67,104 @@ if os.getenv("ENV") == "local-dev":
     except BaseSSHTunnelForwarderError as e:
         print(f"Error establishing SSH tunnel: {e}")
     atexit.register(server.stop)
+    _tunnel = server
+
+
+# 동기 드라이버 URL 이 들어와도 같은 DB 의 async 드라이버로 접속
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    postgresql:// -> postgresql+asyncpg://, sqlite:// -> sqlite+aiosqlite://
+    """
+    parsed = make_url(url)
+    if parsed.get_dialect().is_async:
+        return url
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {parsed.drivername}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def _create_engine(url: str, pool_prefix: str, name: str):
+    """
+    async 엔진 생성 + 풀/쿼리 계측
+    """
+    options = pool_options_from_env(url, prefix=pool_prefix)
+    created = create_async_engine(to_async_url(url), **options)
+    instrument_pool(created.sync_engine, name)
+    instrument_queries(created.sync_engine)
+    return created
+
+
+def init_engines() -> None:
+    """
+    primary / 복제본 엔진과 세션 팩토리 생성 (이미 만들었으면 아무것도 안 함)
+    접속은 하지 않는다 (첫 쿼리에서 풀이 연결)
+    """
+    global engine, SessionLocal, replica_engine, ReadSessionLocal  # pylint: disable=global-statement
+    if SessionLocal is not None:
+        return
+    load_env()
+    _start_tunnel()
+    # 풀 옵션은 DB_POOL_SIZE / DB_POOL_MAX_OVERFLOW / DB_POOL_TIMEOUT / DB_POOL_RECYCLE
+    # / DB_POOL_PRE_PING
+    engine = _create_engine(os.getenv("DATABASE_URL"), "DB_POOL", "primary")
+    SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    # 읽기 전용 복제본 (없으면 primary 로 읽는다), 풀 옵션은 DB_REPLICA_POOL_* 로 따로
+    replica_url = os.getenv("DATABASE_REPLICA_URL")
+    replica_engine = (_create_engine(replica_url, "DB_REPLICA_POOL", "replica")
+                      if replica_url else None)
+    ReadSessionLocal = (async_sessionmaker(replica_engine, autoflush=False, expire_on_commit=False)
+                        if replica_engine is not None else SessionLocal)
+
+
+async def dispose_engines() -> None:
+    """
+    엔진 커넥션 정리, SSH 터널 종료 (다음에 쓰면 다시 만든다)
+    """
+    global engine, SessionLocal, replica_engine, ReadSessionLocal, _tunnel  # pylint: disable=global-statement
+    created = (engine, replica_engine)
+    engine = SessionLocal = replica_engine = ReadSessionLocal = None
+    for created_engine in created:
+        if created_engine is not None:
+            await created_engine.dispose()
+    if _tunnel is not None:
+        _tunnel.stop()
+        _tunnel = None
+
+
+def session_factory() -> async_sessionmaker:
+    """
+    primary 세션 팩토리 (없으면 엔진부터 만든다)
+    """
+    init_engines()
+    return SessionLocal
+
+
+def read_session_factory() -> async_sessionmaker:
+    """
+    읽기 세션 팩토리 (복제본이 없으면 primary 와 같은 팩토리)
+    """
+    init_engines()
+    return ReadSessionLocal
+
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
-def get_db():
+async def get_db():
     """
     db 세션 생성
     """
-    db = SessionLocal()
-    try:
-        yield db
-    except SQLAlchemyError as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=str(e)) from e
-    finally:
-        db.close()
+    async with session_factory()() as db:
+        try:
+            yield db
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise HTTPException(status_code=500, detail=str(e)) from e
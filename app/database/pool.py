@@ -0,0 +1,92 @@
+"""
+커넥션 풀 설정 및 계측
+"""
+import os
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.utils.metrics import Counter, Gauge, Histogram
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "feed_db_pool_checkout_wait_seconds", "풀에서 커넥션을 받기까지 기다린 시간", ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+POOL_CHECKED_OUT = Gauge("feed_db_pool_checked_out", "현재 사용 중인 커넥션 수", ("pool",))
+POOL_SIZE = Gauge("feed_db_pool_size", "풀 크기 (overflow 제외)", ("pool",))
+POOL_OVERFLOW = Counter("feed_db_pool_overflow_total", "풀 크기를 넘어 새로 만든 커넥션 수", ("pool",))
+POOL_TIMEOUTS = Counter("feed_db_pool_timeouts_total", "풀 대기 시간 초과 횟수", ("pool",))
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def pool_options_from_env(url: str, prefix: str = "DB_POOL") -> Dict[str, Any]:
+    """
+    환경 변수로 풀 옵션 구성 (SQLite 는 드라이버 기본 풀을 그대로 사용)
+
+    {prefix}_SIZE, {prefix}_MAX_OVERFLOW, {prefix}_TIMEOUT(초),
+    {prefix}_RECYCLE(초, -1 이면 사용 안 함), {prefix}_PRE_PING(true/false)
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": InstrumentedPool,
+        "pool_size": int(os.getenv(f"{prefix}_SIZE", "5")),
+        "max_overflow": int(os.getenv(f"{prefix}_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv(f"{prefix}_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv(f"{prefix}_RECYCLE", "1800")),
+        "pool_pre_ping": _env_bool(f"{prefix}_PRE_PING", True),
+    }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    커넥션을 받기까지 기다린 시간을 재는 풀
+    풀 이벤트에는 '대기 시작' 시점이 없어서 _do_get 을 감싼다
+    """
+    metrics_name = "default"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            POOL_TIMEOUTS.inc(pool=self.metrics_name)
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started, pool=self.metrics_name)
+
+
+def instrument_pool(engine: Engine, name: str) -> None:
+    """
+    풀 이벤트로 사용 중 커넥션 수와 overflow 발생을 메트릭에 연결
+    """
+    pool = engine.pool
+    if isinstance(pool, InstrumentedPool):
+        pool.metrics_name = name
+        POOL_SIZE.set(pool.size(), pool=name)
+
+    checked_out = {"count": 0}
+    POOL_CHECKED_OUT.set_function(lambda: checked_out["count"], pool=name)
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+        # overflow() 는 풀 크기를 넘어 만든 커넥션 수 (풀이 덜 찼으면 음수)
+        if hasattr(pool, "overflow") and pool.overflow() > 0:
+            POOL_OVERFLOW.inc(pool=name)
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):  # pylint: disable=unused-argument
+        checked_out["count"] += 1
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+        checked_out["count"] -= 1
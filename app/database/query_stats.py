@@ -0,0 +1,91 @@
+"""
+요청 단위 SQL 쿼리 수 / DB 시간 집계
+"""
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    """
+    한 요청(또는 with track_queries() 구간) 동안 실행된 쿼리 수와 DB 시간
+    구간이 겹치면 바깥 구간에도 같이 더한다
+    """
+    __slots__ = ("count", "seconds", "statements", "keep_statements", "parent")
+
+    def __init__(self, keep_statements: bool = False, parent: Optional["QueryStats"] = None):
+        self.parent = parent
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: List[str] = []
+        self.keep_statements = keep_statements
+
+    @property
+    def milliseconds(self) -> float:
+        return round(self.seconds * 1000, 2)
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_stats() -> Optional[QueryStats]:
+    """
+    지금 집계 중인 QueryStats (집계 구간 밖이면 None)
+    """
+    return _current.get()
+
+
+@contextlib.contextmanager
+def track_queries(keep_statements: bool = False) -> Iterator[QueryStats]:
+    """
+    구간 안에서 instrument_queries 로 계측된 엔진이 실행한 쿼리를 센다
+    (SQLAlchemy async 는 같은 context 의 greenlet 에서 커서를 실행하므로 contextvar 가 그대로 보인다)
+    """
+    stats = QueryStats(keep_statements, parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument
+    if _current.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument
+    stats = _current.get()
+    started = conn.info.get("query_started")
+    if stats is None or not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    while stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        if stats.keep_statements:
+            stats.statements.append(statement)
+        stats = stats.parent
+
+
+def _handle_error(exception_context) -> None:
+    # 실패한 쿼리는 after_cursor_execute 가 불리지 않으니 시작 시각만 치운다
+    connection = exception_context.connection
+    started = connection.info.get("query_started") if connection else None
+    if started:
+        started.pop()
+
+
+def instrument_queries(engine: Engine) -> None:
+    """
+    커서 실행 이벤트로 쿼리 수와 DB 시간을 현재 QueryStats 에 더한다 (여러 번 불러도 한 번만 등록)
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,92 @@
+"""
+읽기/쓰기 세션 라우팅
+목록 조회는 복제본으로 보내고,
+방금 쓴 유저는 잠깐 동안 primary 에서 읽게 해서 자기가 쓴 내용을 바로 보게 한다
+프로세스 내 맵은 같은 워커로 온 요청에만 통하므로, 쓰기 응답에 쿠키도 내려서
+다른 워커/인스턴스로 간 다음 요청도 primary 에서 읽게 한다
+"""
+import os
+import time
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database import db
+from app.utils.cache import TTLCache
+from app.utils.metrics import Counter
+from app.utils.token import current_user
+
+DB_REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", "5"))
+
+STICKY_COOKIE = "feed_primary_until"
+
+READ_ROUTING = Counter("feed_db_read_routing_total", "읽기 세션을 보낸 곳", ("target",))
+
+
+class StickyPrimary:
+    """
+    최근에 쓴 유저 -> primary 에서 읽어야 하는 시각까지 (프로세스 내 TTL 맵)
+    다른 프로세스로 간 요청은 STICKY_COOKIE 로 판단한다
+    """
+    def __init__(self, window: float = DB_REPLICA_STICKY_SECONDS, maxsize: int = 100_000):
+        self.window = window
+        self._users: TTLCache[bool] = TTLCache(maxsize)
+
+    def mark(self, user_id: str) -> None:
+        self._users.put(user_id, True, self._users.clock() + self.window)
+
+    def is_sticky(self, user_id: str) -> bool:
+        return self._users.get(user_id) is not None
+
+    def clear(self) -> None:
+        self._users.clear()
+
+
+sticky_primary = StickyPrimary()
+
+
+async def _session(factory):
+    async with factory() as session:
+        try:
+            yield session
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+def _sticky_cookie(request: Request) -> bool:
+    """
+    쓰기 응답에서 내려준 쿠키의 시각(unix time)이 아직 안 지났는지
+    """
+    try:
+        return float(request.cookies.get(STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_db(request: Request, user_id: str = Depends(current_user)):
+    """
+    읽기 전용 세션 (복제본, 최근에 쓴 유저는 primary)
+    """
+    primary, replica = db.session_factory(), db.read_session_factory()
+    use_primary = replica is primary or sticky_primary.is_sticky(user_id) or _sticky_cookie(request)
+    READ_ROUTING.inc(target="primary" if use_primary else "replica")
+    async for session in _session(primary if use_primary else replica):
+        yield session
+
+
+async def get_write_db(response: Response, user_id: str = Depends(current_user)):
+    """
+    쓰기 세션 (primary), 요청 전후로 이 유저를 sticky 로 표시
+    응답이 나간 뒤에 바로 읽어도 복제 지연과 상관없이 primary 에서 읽게 된다
+    (프로세스 내 표시는 같은 프로세스에서만, 쿠키는 쿠키를 보내는 클라이언트에 한해 어디서나)
+    """
+    sticky_primary.mark(user_id)
+    # yield 뒤에서는 응답 헤더를 바꿀 수 없어서 쿠키는 요청 시작 기준 window 까지
+    response.set_cookie(
+        STICKY_COOKIE, f"{time.time() + sticky_primary.window:.3f}",
+        max_age=max(int(sticky_primary.window), 1), httponly=True, samesite="lax",
+    )
+    async for session in _session(db.session_factory()):
+        yield session
+    sticky_primary.mark(user_id)
@@ -2,19 +2,27 @@
 main.py
 """
 
+import asyncio
 import logging
 import os
-import uuid
+
 from fastapi import FastAPI, APIRouter
+from fastapi.responses import ORJSONResponse
 from fastapi_jwt_auth import AuthJWT
 from pydantic import BaseModel
 # from sqlalchemy import MetaData, Table, inspect
-from starlette_context import context
 from starlette_context.middleware import ContextMiddleware
-from starlette.responses import Response
+from starlette.responses import PlainTextResponse
 
 from app.database import db
 from app.routers import post, notification
+from app.services.cleanup import run_cleanup_sweeper
+from app.services.image_variant import run_variant_worker
+from app.services.leaderboard import run_refresher
+from app.services.outbox import run_outbox_worker
+from app.utils.access_log import AccessLogMiddleware
+from app.utils.metrics import REGISTRY
+from app.utils import variants
 # from app.models.notification import *
 # from app.models.post import *
 
@@ -41,9 +49,6 @@ def get_config():
 # table = Table('posts', metadata, autoload_with=db.engine)
 # table.drop(db.engine)
 
-# 테이블 생성 (만들 때 모델 import 하고 해야함)
-db.Base.metadata.create_all(bind=db.engine)
-
 # 테이블 확인용
 # inspector = inspect(db.engine)
 # print(inspector.get_columns("posts"))
@@ -56,39 +61,41 @@ app = FastAPI(
     openapi_url="/feed/openapi.json",
     docs_url="/feed/docs",
     redoc_url="/feed/redoc",
+    default_response_class=ORJSONResponse, # 나머지 응답도 stdlib json 대신 orjson 으로 인코딩
 )
 
 app.logger = logger
+app.state.background_tasks = []
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    """
+    엔진 생성 및 백그라운드 작업 시작 (인기 게시물 스냅샷 갱신, S3 정리 스위퍼, 아웃박스 워커, 이미지 변환본 워커)
+    테이블 생성은 python -m app.commands.init_db 로 따로 한다
+    """
+    session_factory = db.session_factory()
+    app.state.background_tasks.append(asyncio.create_task(run_refresher(session_factory)))
+    app.state.background_tasks.append(asyncio.create_task(run_cleanup_sweeper(session_factory)))
+    app.state.background_tasks.append(asyncio.create_task(run_outbox_worker(session_factory)))
+    app.state.background_tasks.append(asyncio.create_task(run_variant_worker(session_factory)))
 
 
-@app.middleware("http")
-async def http_log(request, call_next):
+@app.on_event("shutdown")
+async def stop_background_tasks():
     """
-    로그
-    :param request:
-    :param call_next:
-    :return:
+    백그라운드 작업 종료
     """
-    response = await call_next(request)
-    response_body = b''
-    log_uuid = str(uuid.uuid1())[:8]
-
-    async for chunk in response.body_iterator:
-        response_body += chunk
-    logger.info("Log ID : %s - Request URL : %s %s",
-                log_uuid, str(request.method), str(request.url))
-    if "request_body" in context:
-        logger.info("Log ID : %s - Request Body : %s", log_uuid, context["request_body"])
-    logger.info("Log ID : %s - Response Body : %s", log_uuid, response_body)
-    logger.info("Log ID : %s - Response Status Code : %s", log_uuid, str(response.status_code))
-
-    return Response(
-        content=response_body,
-        status_code=response.status_code,
-        headers=dict(response.headers),
-        media_type=response.media_type
-    )
+    for task in app.state.background_tasks:
+        task.cancel()
+    await asyncio.gather(*app.state.background_tasks, return_exceptions=True)
+    app.state.background_tasks.clear()
+    await variants.shutdown()
+    await db.dispose_engines()
 
+
+# 접근 로그 (본문은 LOG_BODY_SAMPLE_RATE(S) 비율로 LOG_BODY_MAX_BYTES 까지만)
+app.add_middleware(AccessLogMiddleware)
 app.add_middleware(ContextMiddleware)
 
 # AWS Load Balancer의 Health Check 처리
@@ -106,6 +113,14 @@ feed_router = APIRouter(
 )
 
 
+@feed_router.get("/metrics", response_class=PlainTextResponse, summary="Metrics")
+async def metrics():
+    """
+    Prometheus 텍스트 포맷 메트릭
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
 @feed_router.get("", response_model=dict, summary="Feed API List")
 async def get_feed_apis():
     """
@@ -118,11 +133,15 @@ async def get_feed_apis():
             "GET /feed/posts": "특정 유저의 전체 게시물 리스팅 API",
             "GET /feed/posts/hashtag/{hashtag}": "해시태그 게시물 리스팅 API",
             "POST /feed/posts": "게시물 생성 API",
+            "POST /feed/posts/multipart": "게시물 생성 API (multipart/form-data 이미지 업로드)",
             "PUT /feed/posts/{post_id}": "본인 게시물 수정 API",
             "DELETE /feed/posts/{post_id}": "게시물 삭제 API",
+            "POST /feed/posts/likes:batch": "게시물 좋아요 수 / 내가 눌렀는지 일괄 조회 API",
+            "GET /feed/posts/{post_id}/likes": "게시물 좋아요 누른 유저 리스팅 API",
             "POST /feed/posts/{post_id}/likes": "게시물 좋아요 API",
             "DELETE /feed/posts/{post_id}/likes": "게시물 좋아요 취소 API",
             "GET /feed/notifications": "전체 알림 리스트",
+            "GET /feed/metrics": "Prometheus 메트릭",
             "PUT /feed/notifications/{post_id}/read": "특정 알림을 읽음 상태로 변경"
         }
     }
@@ -3,11 +3,13 @@ models
 """
 from sqlalchemy.orm import relationship
 
-from app.models.post import Post, Like
+from app.models.post import Post
 from app.models.notification import Notification
+from app.models.cleanup import S3Cleanup  # pylint: disable=unused-import
+from app.models.outbox import OutboxEvent  # pylint: disable=unused-import
+from app.models.version import FeedVersion  # pylint: disable=unused-import
+from app.models.variant import ImageVariantJob  # pylint: disable=unused-import
 
 Post.noti = relationship("Notification", back_populates="post", cascade="all, delete-orphan")
-Like.noti = relationship("Notification", back_populates="like", cascade="all, delete-orphan")
 
 Notification.post = relationship('Post', back_populates='noti')
-Notification.like = relationship("Like", back_populates="noti")
@@ -0,0 +1,26 @@
+"""
+S3 오브젝트 정리 대기열 모델
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Index
+
+from app.database.db import Base
+from app.utils.clock import utcnow
+
+
+class S3Cleanup(Base):
+    """
+    삭제할 S3 오브젝트 키 (게시물 삭제와 같은 트랜잭션에서 기록, 스위퍼가 지운다)
+    """
+    __tablename__ = 's3_cleanup_queue'
+    __table_args__ = (
+        # 스위퍼가 재시도 시각이 지난 것만 오래된 순으로 가져간다
+        Index('ix_s3_cleanup_queue_next_attempt_at_id', 'next_attempt_at', 'id'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    object_key = Column(String, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0, server_default='0')
+    last_error = Column(String, nullable=True)
+    # 스위퍼가 비교하는 시각과 같은 기준(UTC)으로 파이썬에서 채운다 (DB 서버 시간대와 무관하게)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    next_attempt_at = Column(DateTime, nullable=False, default=utcnow)
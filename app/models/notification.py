@@ -1,11 +1,12 @@
 """
 알림 데이터베이스 모델
 """
-from datetime import datetime, UTC
-
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime
+from sqlalchemy import (
+    Column, Integer, String, Boolean, ForeignKey, DateTime, Index, UniqueConstraint
+)
 
 from app.database.db import Base
+from app.utils.clock import utcnow
 
 
 class Notification(Base):
@@ -13,11 +14,20 @@ class Notification(Base):
     알림 테이블 모델
     """
     __tablename__ = 'feed_notifications'
+    __table_args__ = (
+        # 유저별 게시물 단위로 한 행 (아웃박스 워커가 upsert)
+        UniqueConstraint('user_id', 'post_id', name='uq_feed_notifications_user_id_post_id'),
+        # 최근 활동순 알림 목록용
+        Index('ix_feed_notifications_user_id_created_at_post_id',
+              'user_id', 'created_at', 'post_id'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String, index=True)
     is_read = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.now(UTC))
+    created_at = Column(DateTime, default=utcnow)
 
     post_id = Column(Integer, ForeignKey('posts.id'))
-    like_id = Column(Integer, ForeignKey('likes.id'))
+    # 마지막으로 읽은 뒤 들어온 좋아요 수와 가장 최근에 좋아요한 유저
+    unread_count = Column(Integer, nullable=False, default=0, server_default='0')
+    last_actor_id = Column(String, nullable=True)
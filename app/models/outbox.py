@@ -0,0 +1,21 @@
+"""
+아웃박스 이벤트 모델
+"""
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.database.db import Base
+
+
+class OutboxEvent(Base):
+    """
+    좋아요 등 쓰기와 같은 트랜잭션에서 기록하는 이벤트 (워커가 알림으로 바꾸고 지운다)
+    """
+    __tablename__ = 'feed_outbox'
+
+    id = Column(Integer, primary_key=True)
+    event_type = Column(String, nullable=False)
+    post_id = Column(Integer, nullable=False)
+    like_id = Column(Integer, nullable=True)      # 좋아요가 취소되면 없어질 수 있어 FK 는 걸지 않는다
+    actor_id = Column(String, nullable=False)     # 좋아요 누른 유저
+    recipient_id = Column(String, nullable=False) # 알림 받을 유저 (게시물 작성자)
+    created_at = Column(DateTime, nullable=False)
@@ -2,32 +2,69 @@
 게시물 데이터베이스 모델
 """
 from datetime import datetime, UTC
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean
+from sqlalchemy import (
+    Column, Integer, String, ForeignKey, DateTime, Boolean, JSON, Index, UniqueConstraint
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.database.db import Base
 
+# 로컬 테스트(SQLite)에서도 테이블을 만들 수 있도록 JSON 으로 대체
+JSONType = JSONB().with_variant(JSON(), "sqlite")
+
 class Post(Base):
     """
     Post 테이블 모델
     """
     __tablename__ = 'posts'
+    __table_args__ = (
+        # 유저 피드 키셋 페이지네이션용 (user_id, uploaded_at, id)
+        Index('ix_posts_user_id_uploaded_at_id', 'user_id', 'uploaded_at', 'id'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String, index=True)
     content = Column(String, nullable=True)
     uploaded_at = Column(DateTime, default=datetime.now(UTC))
-    image_urls = Column(JSONB)
-    hashtags = Column(JSONB)
+    image_urls = Column(JSONType)
+    hashtags = Column(JSONType)
+    # likes 테이블에서 매번 COUNT 하지 않도록 비정규화한 좋아요 수 (toggle_post_like 에서 갱신)
+    like_count = Column(Integer, nullable=False, default=0, server_default='0', index=True)
+    # image_urls 와 같은 순서로 만들어진 변환본 URL ({"thumb": ..., "medium": ...}), 아직 없으면 null
+    image_variants = Column(JSONType, nullable=True)
 
     likes = relationship("Like", back_populates="post", cascade="all, delete-orphan")
+    hashtag_index = relationship("PostHashtag", back_populates="post", cascade="all, delete-orphan")
+
+class PostHashtag(Base):
+    """
+    해시태그 인덱스 테이블 모델 (posts.hashtags 를 정규화한 조회용 테이블)
+    """
+    __tablename__ = 'post_hashtags'
+    __table_args__ = (
+        # 해시태그 피드 키셋 페이지네이션용 (hashtag, uploaded_at, post_id)
+        Index('ix_post_hashtags_hashtag_uploaded_at_post_id', 'hashtag', 'uploaded_at', 'post_id'),
+    )
+
+    hashtag = Column(String, primary_key=True)
+    post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), primary_key=True)
+    uploaded_at = Column(DateTime, nullable=False)  # 정렬용으로 posts.uploaded_at 복사
+
+    post = relationship("Post", back_populates="hashtag_index")
 
 class Like(Base):
     """
     Like 테이블 모델
     """
     __tablename__ = 'likes'
+    __table_args__ = (
+        # 한 유저는 게시물에 좋아요를 한 번만 (동시에 눌러도 중복 행이 생기지 않도록)
+        # 게시물별 좋아요 수 / 내가 눌렀는지 일괄 조회도 이 인덱스만으로 처리
+        UniqueConstraint('post_id', 'user_id', name='uq_likes_post_id_user_id'),
+        # 게시물별 좋아요 순서대로 리스팅 / 앞쪽 N 명만 읽기용 (post_id, id)
+        Index('ix_likes_post_id_id', 'post_id', 'id'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey('posts.id'), index=True)
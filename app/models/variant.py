@@ -0,0 +1,33 @@
+"""
+이미지 변환본 생성 작업 모델
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+
+from app.database.db import Base
+from app.utils.clock import utcnow
+
+VARIANT_PENDING = "pending"
+VARIANT_FAILED = "failed"             # 재시도 횟수를 다 썼다
+VARIANT_UNSUPPORTED = "unsupported"   # 변환할 수 없는 형식 (재시도 안 함)
+
+
+class ImageVariantJob(Base):
+    """
+    게시물 이미지 하나의 변환본 생성 작업 (게시물 생성과 같은 트랜잭션에서 기록, 워커가 처리하고 지운다)
+    """
+    __tablename__ = 'image_variant_jobs'
+    __table_args__ = (
+        # 워커가 재시도 시각이 지난 대기 작업만 오래된 순으로 가져간다
+        Index('ix_image_variant_jobs_status_next_attempt_at_id', 'status', 'next_attempt_at', 'id'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'),
+                     nullable=False, index=True)
+    position = Column(Integer, nullable=False)  # posts.image_urls 안에서의 위치
+    image_url = Column(String, nullable=False)
+    status = Column(String, nullable=False, default=VARIANT_PENDING)
+    attempts = Column(Integer, nullable=False, default=0, server_default='0')
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    next_attempt_at = Column(DateTime, nullable=False, default=utcnow)
@@ -0,0 +1,17 @@
+"""
+피드 버전 모델
+"""
+from sqlalchemy import Column, Integer, String
+
+from app.database.db import Base
+
+
+class FeedVersion(Base):
+    """
+    목록별 버전 (유저 피드, 해시태그 피드, 알림함) - 쓰기마다 올리고 ETag 로 내려준다
+    """
+    __tablename__ = 'feed_versions'
+
+    # e.g. user:{social_id}, hashtag:{tag}, inbox:{social_id}
+    scope = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=1, server_default='1')
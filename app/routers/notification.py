@@ -1,15 +1,17 @@
 """
 피드의 알림 관련 API
 """
-from typing import List
-from fastapi import APIRouter, Depends
-from fastapi_jwt_auth import AuthJWT
-from sqlalchemy.orm import Session
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.db import get_db
+from app.database.routing import get_read_db, get_write_db
 from app.schemas import notification as noti_schema
 from app.services import notification as noti_service
-from app.utils.token import get_social_id
+from app.services.version import get_version, inbox_scope
+from app.utils.etag import make_etag, not_modified
+from app.utils.serialization import trusted_response
+from app.utils.token import current_user
 
 router = APIRouter(
     prefix="/notifications",
@@ -18,33 +20,41 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=List[noti_schema.NotiResponse])
-async def get_notifications(token: AuthJWT = Depends(), db: Session = Depends(get_db)):
+@router.get("", response_model=noti_schema.NotiPage)
+async def get_notifications(request: Request, response: Response,
+                            limit: int = Query(20, ge=1, le=100), cursor: Optional[str] = None,
+                            user_id: str = Depends(current_user),
+                            db: AsyncSession = Depends(get_read_db)):
     """
-    전체 알림 리스트
-    :param token:
+    전체 알림 리스트 (최근 활동순, 커서 페이지네이션)
+    If-None-Match 가 현재 ETag 와 같으면 목록을 조회하지 않고 304
+    :param request:
+    :param response:
+    :param limit: 한 페이지 알림 수
+    :param cursor: 이전 페이지 응답의 next_cursor
+    :param user_id: 토큰의 소셜 id
     :param db:
     :return:
     """
-    token.jwt_required()
-    user_id = get_social_id(token)
+    scope = inbox_scope(user_id)
+    etag = make_etag(scope, await get_version(db, scope), limit, cursor)
+    if (cached := not_modified(request, response, etag)) is not None:
+        return cached
 
-    return noti_service.get_notifications(user_id, db)
+    page = await noti_service.get_notifications(user_id, db, limit, cursor)
+    return trusted_response(page, response)
 
 
 @router.put("/{post_id}/read")
-async def mark_notification_as_read(post_id: int, token: AuthJWT = Depends(),
-                                    db: Session = Depends(get_db)):
+async def mark_notification_as_read(post_id: int, user_id: str = Depends(current_user),
+                                    db: AsyncSession = Depends(get_write_db)):
     """
     특정 알림을 읽음 상태로 변경
     :param post_id:
-    :param token:
+    :param user_id: 토큰의 소셜 id
     :param db:
     :return:
     """
-    token.jwt_required()
-    user_id = get_social_id(token)
-
-    noti_service.mark_notification_as_read(post_id, user_id, db)
+    await noti_service.mark_notification_as_read(post_id, user_id, db)
 
     return {"message": "A notification marked as read"}
@@ -1,15 +1,22 @@
 """
 피드의 포스팅 관련 API
 """
-from typing import List
-from fastapi import APIRouter, Depends
-from fastapi_jwt_auth import AuthJWT
-from sqlalchemy.orm import Session
-
-from app.database.db import get_db
-from app.schemas.post import PostResponse, FamousResponse, LikeToggle, PostCreate, PostUpdate
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.routing import get_read_db, get_write_db
+from app.schemas.post import (
+    PostResponse, PostPage, FamousResponse, LikePage, LikeToggle, PostCreate, PostUpdate,
+    LikeBatchRequest, LikeBatchResponse
+)
 from app.services import post as post_service
-from app.utils.token import get_social_id
+from app.services.version import get_version, hashtag_scope, user_feed_scope
+from app.utils.etag import make_etag, not_modified
+from app.utils.serialization import trusted_response
+from app.utils.image import get_s3_client
+from app.utils.token import current_user
+from app.utils.upload import stream_post_form
 
 router = APIRouter(
     prefix="/posts",
@@ -18,102 +25,173 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=List[PostResponse])
-async def list_posts(user_id: str, token: AuthJWT = Depends(), db: Session = Depends(get_db)):
+View = Literal["full", "compact"]
+
+
+@router.get("", response_model=PostPage)
+async def list_posts(request: Request, response: Response, user_id: str,
+                     limit: int = Query(20, ge=1, le=100), cursor: Optional[str] = None,
+                     view: View = "full", viewer_id: str = Depends(current_user),
+                     db: AsyncSession = Depends(get_read_db)):
     """
-    특정 유저의 전체 게시물 리스팅 API
+    특정 유저의 전체 게시물 리스팅 API (최신순, 커서 페이지네이션)
+    If-None-Match 가 현재 ETag 와 같으면 목록을 조회하지 않고 304
+    :param request:
+    :param response:
     :param user_id:
-    :param token:
+    :param limit: 한 페이지 게시물 수
+    :param cursor: 이전 페이지 응답의 next_cursor
+    :param view: compact 면 liked_by 는 앞쪽 몇 명만, liked_by_me 포함
+    :param viewer_id: 토큰의 소셜 id
     :param db:
     :return:
     """
-    token.jwt_required()
-
-    return post_service.list_posts(user_id, db)
-
-
-@router.get("/hashtag/{hashtag}", response_model=List[PostResponse])
-async def list_posts_with_hashtag(hashtag: str, token: AuthJWT = Depends(), db: Session = Depends(get_db)):
+    compact = view == "compact"
+    scope = user_feed_scope(user_id)
+    etag = make_etag(scope, await get_version(db, scope), limit, cursor, view,
+                     viewer_id if compact else None)
+    if (cached := not_modified(request, response, etag)) is not None:
+        return cached
+
+    page = await post_service.list_posts(user_id, db, limit, cursor, viewer_id, compact)
+    return trusted_response(page, response)
+
+
+@router.get("/hashtag/{hashtag}", response_model=PostPage)
+async def list_posts_with_hashtag(request: Request, response: Response, hashtag: str,
+                                  limit: int = Query(20, ge=1, le=100),
+                                  cursor: Optional[str] = None, view: View = "full",
+                                  viewer_id: str = Depends(current_user),
+                                  db: AsyncSession = Depends(get_read_db)):
     """
-    해시태그 게시물 리스팅 API
+    해시태그 게시물 리스팅 API (최신순, 커서 페이지네이션)
+    If-None-Match 가 현재 ETag 와 같으면 목록을 조회하지 않고 304
+    :param request:
+    :param response:
     :param hashtag:
-    :param token:
+    :param limit: 한 페이지 게시물 수
+    :param cursor: 이전 페이지 응답의 next_cursor
+    :param view: compact 면 liked_by 는 앞쪽 몇 명만, liked_by_me 포함
+    :param viewer_id: 토큰의 소셜 id
     :param db:
     :return:
     """
-    token.jwt_required()
+    compact = view == "compact"
+    scope = hashtag_scope(hashtag)
+    etag = make_etag(scope, await get_version(db, scope), limit, cursor, view,
+                     viewer_id if compact else None)
+    if (cached := not_modified(request, response, etag)) is not None:
+        return cached
 
-    return post_service.list_posts_with_hashtag(hashtag, db)
+    page = await post_service.list_posts_with_hashtag(hashtag, db, limit, cursor, viewer_id,
+                                                      compact)
+    return trusted_response(page, response)
 
 
 @router.post("", response_model=PostResponse)
-async def create_post(post: PostCreate,
-                      token: AuthJWT = Depends(), db: Session = Depends(get_db)):
+async def create_post(post: PostCreate, user_id: str = Depends(current_user),
+                      db: AsyncSession = Depends(get_write_db)):
     """
     게시물 생성 API
     :param post:
-    :param token:
+    :param user_id: 토큰의 소셜 id
+    :param db:
+    :return:
+    """
+    return await post_service.create_post(user_id, db, post)
+
+
+@router.post("/multipart", response_model=PostResponse)
+async def create_post_multipart(request: Request, user_id: str = Depends(current_user),
+                                db: AsyncSession = Depends(get_write_db)):
+    """
+    게시물 생성 API (multipart/form-data)
+    base64 JSON 대신 content 필드와 images 파일 파트로 받아서 바로 S3 로 스트리밍
+    :param request:
+    :param user_id: 토큰의 소셜 id
     :param db:
     :return:
     """
-    token.jwt_required()
-    user_id = get_social_id(token)
-    return post_service.create_post(user_id, db, post)
+    content, s3_urls = await stream_post_form(
+        request.headers.get("content-type", ""), request.stream(), get_s3_client()
+    )
+    return await post_service.create_post_with_images(user_id, db, content, s3_urls)
 
 
 @router.put("/{post_id}", response_model=PostResponse)
-async def update_post(post_id: int, post: PostUpdate,
-                      token: AuthJWT = Depends(), db: Session = Depends(get_db)):
+async def update_post(post_id: int, post: PostUpdate, user_id: str = Depends(current_user),
+                      db: AsyncSession = Depends(get_write_db)):
     """
     본인 게시물 수정 API
     :param post_id:
     :param post:
-    :param token:
+    :param user_id: 토큰의 소셜 id
     :param db:
     :return:
     """
-    token.jwt_required()
-    user_id = get_social_id(token)
-
-    return post_service.update_post(user_id, post_id, db, post)
+    return await post_service.update_post(user_id, post_id, db, post)
 
 
 @router.delete("/{post_id}")
-async def delete_post(post_id: int, token: AuthJWT = Depends(), db: Session = Depends(get_db)):
+async def delete_post(post_id: int, user_id: str = Depends(current_user),
+                      db: AsyncSession = Depends(get_write_db)):
     """
     게시물 삭제 API
     :param post_id:
-    :param token:
+    :param user_id: 토큰의 소셜 id
     :param db:
     :return:
     """
-    token.jwt_required()
-    user_id = get_social_id(token)
-    post_service.delete_post(user_id, post_id, db)
+    await post_service.delete_post(user_id, post_id, db)
 
     return {"message": "Successfully deleted a post"}
 
+@router.post("/likes:batch", response_model=LikeBatchResponse)
+async def likes_batch(batch: LikeBatchRequest, user_id: str = Depends(current_user),
+                      db: AsyncSession = Depends(get_read_db)):
+    """
+    여러 게시물의 좋아요 수와 내가 눌렀는지 일괄 조회 API (타임라인 렌더링용)
+    :param batch: 게시물 ID 목록 (최대 300개)
+    :param user_id: 토큰의 소셜 id
+    :param db:
+    :return:
+    """
+    return trusted_response(await post_service.summarize_likes_batch(batch.post_ids, user_id, db))
+
+@router.get("/{post_id}/likes", response_model=LikePage, dependencies=[Depends(current_user)])
+async def list_likes(post_id: int, limit: int = Query(20, ge=1, le=100),
+                     cursor: Optional[str] = None, db: AsyncSession = Depends(get_read_db)):
+    """
+    게시물 좋아요 누른 유저 리스팅 API (좋아요 순서대로, 커서 페이지네이션)
+    :param post_id: 게시물 ID
+    :param limit: 한 페이지 유저 수
+    :param cursor: 이전 페이지 응답의 next_cursor
+    :param db:
+    :return:
+    """
+    return trusted_response(await post_service.list_post_likes_page(post_id, db, limit, cursor))
+
 @router.post("/{post_id}/likes", response_model=LikeToggle)
-async def toggle_like(post_id: int, token: AuthJWT = Depends(), db: Session = Depends(get_db)):
+async def toggle_like(post_id: int, user_id: str = Depends(current_user),
+                      db: AsyncSession = Depends(get_write_db)):
     """
     게시물 좋아요 토글 API
     :param post_id: 게시물 ID
-    :param token: JWT 토큰
+    :param user_id: 토큰의 소셜 id
     :param db: 데이터베이스 세션
     :return: 토글 결과 메시지와 좋아요 상태
     """
-    token.jwt_required()
-    user_id = get_social_id(token)
-    result = post_service.toggle_post_like(post_id, user_id, db)
+    result = await post_service.toggle_post_like(post_id, user_id, db)
     return result
 
 @router.get("/famous", response_model=List[FamousResponse])
-async def famous_feeds(token: AuthJWT = Depends(), db: Session = Depends(get_db)):
+async def famous_feeds(view: View = "full", viewer_id: str = Depends(current_user),
+                       db: AsyncSession = Depends(get_read_db)):
     """
     인기 멍멍이 피드 추천(총 5명의 강아지 피드 정보를 랜덤하게 반환)
-    :param token:
+    :param view: compact 면 liked_by 는 앞쪽 몇 명만, liked_by_me 포함
+    :param viewer_id: 토큰의 소셜 id
     :param db:
     :return:
     """
-    token.jwt_required()
-    return post_service.famous_posts(db)
\ No newline at end of file
+    return trusted_response(await post_service.famous_posts(db, viewer_id, view == "compact"))
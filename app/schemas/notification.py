@@ -2,7 +2,7 @@
 알림 API 스키마
 """
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -17,4 +17,14 @@ class NotiResponse(BaseModel):
     created_at: datetime
 
     post_id: int
+    unread_count: int = 0
+    last_actor_id: Optional[str] = None
     likes: List[Like]
+
+
+class NotiPage(BaseModel):
+    """
+    알림 리스팅 페이지 모델 (최근 활동순, next_cursor 가 없으면 마지막 페이지)
+    """
+    items: List[NotiResponse]
+    next_cursor: Optional[str] = None
@@ -3,7 +3,7 @@
 """
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, HttpUrl, conlist, validator
 
 class Like(BaseModel):
     """
@@ -21,6 +21,35 @@ class LikeToggle(BaseModel):
     is_liked : bool
     likes_count : int
 
+MAX_BATCH_POST_IDS = 300
+
+class LikeBatchRequest(BaseModel):
+    """
+    좋아요 일괄 조회 요청 모델
+    """
+    post_ids: conlist(int, min_items=1, max_items=MAX_BATCH_POST_IDS)
+
+class LikeSummary(BaseModel):
+    """
+    게시물별 좋아요 수와 내가 눌렀는지
+    """
+    post_id: int
+    like_count: int
+    liked_by_me: bool
+
+class LikeBatchResponse(BaseModel):
+    """
+    좋아요 일괄 조회 반환 모델 (요청한 post_ids 순서, 중복 제거)
+    """
+    items: List[LikeSummary]
+
+class ImageVariants(BaseModel):
+    """
+    이미지 변환본 URL 모델 (WebP, 아직 없거나 만들 수 없는 이미지는 원본 URL)
+    """
+    thumb: HttpUrl # 가로 320px
+    medium: HttpUrl # 가로 1080px
+
 class PostResponse(BaseModel):
     """
     게시물 리스폰스 모델
@@ -28,9 +57,36 @@ class PostResponse(BaseModel):
     post_id: int
     user_id: str
     image_urls: List[HttpUrl]
+    image_variants: List[ImageVariants] = [] # image_urls 와 같은 순서
     content: Optional[str]
     uploaded_at: datetime
-    liked_by: List[Like]
+    liked_by: List[Like] # compact 모드에서는 앞쪽 몇 명만
+    like_count: int = 0
+    liked_by_me: Optional[bool] = None # compact 모드에서만
+
+    @validator("image_variants", always=True)
+    def fill_image_variants(cls, value, values): # pylint: disable=no-self-argument
+        """
+        변환본 정보를 안 넘기면 원본 URL 로 채운다 (만들어진 변환본은 서비스에서 넘긴다)
+        """
+        if value:
+            return value
+        return [ImageVariants(thumb=image_url, medium=image_url)
+                for image_url in values.get("image_urls", [])]
+
+class LikePage(BaseModel):
+    """
+    좋아요 리스팅 페이지 모델 (next_cursor 가 없으면 마지막 페이지)
+    """
+    items: List[Like]
+    next_cursor: Optional[str] = None
+
+class PostPage(BaseModel):
+    """
+    게시물 리스팅 페이지 모델 (next_cursor 가 없으면 마지막 페이지)
+    """
+    items: List[PostResponse]
+    next_cursor: Optional[str] = None
 
 class FamousResponse(BaseModel):
     """
@@ -41,7 +97,8 @@ class FamousResponse(BaseModel):
     user_name: str
     profile_image_url: str # 포스팅에 등록된 이미지가 아니라 유저의 프로필 이미지이므로
     like_count: int
-    liked_by: List[Like]
+    liked_by: List[Like] # compact 모드에서는 앞쪽 몇 명만
+    liked_by_me: Optional[bool] = None # compact 모드에서만
 
 class PostCreate(BaseModel):
     """
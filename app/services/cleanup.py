@@ -0,0 +1,110 @@
+"""
+삭제된 게시물의 S3 오브젝트 지연 정리
+게시물 삭제 트랜잭션에는 키만 기록하고, 실제 삭제는 백그라운드 스위퍼가 delete_objects 로 모아서 한다
+"""
+import asyncio
+import logging
+import os
+from datetime import timedelta
+from typing import Dict, Iterable
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.models.cleanup import S3Cleanup
+from app.utils.clock import utcnow
+from app.utils.image import BUCKET_NAME, get_s3_client, key_from_url, s3_timer
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+S3_DELETE_BATCH_SIZE = 1000  # delete_objects 한 번에 지울 수 있는 최대 개수
+S3_CLEANUP_INTERVAL = float(os.getenv("S3_CLEANUP_INTERVAL_SECONDS", "30"))
+S3_CLEANUP_MAX_ATTEMPTS = int(os.getenv("S3_CLEANUP_MAX_ATTEMPTS", "8"))
+S3_CLEANUP_RETRY_SECONDS = 30  # 재시도 간격 (시도할 때마다 두 배)
+
+CLEANUP_DELETED = Counter("feed_s3_cleanup_deleted_total", "정리 대기열에서 삭제한 S3 오브젝트 수")
+CLEANUP_FAILURES = Counter("feed_s3_cleanup_failures_total", "S3 오브젝트 삭제 실패 횟수 (재시도 예정)")
+CLEANUP_SWEEP_FAILURES = Counter("feed_s3_cleanup_sweep_failures_total", "정리 스위퍼 실행 실패 횟수")
+
+
+def enqueue_image_cleanup(db: AsyncSession, image_urls: Iterable[str]) -> None:
+    """
+    지울 이미지 키를 대기열에 추가 (커밋은 호출하는 쪽 트랜잭션에서)
+    """
+    db.add_all(S3Cleanup(object_key=key_from_url(image_url)) for image_url in image_urls)
+
+
+def _delete_objects(keys, s3_client) -> Dict[str, str]:
+    """
+    delete_objects 한 번 호출, 실패한 키 -> 에러 메시지 반환
+    """
+    with s3_timer("delete"):
+        response = s3_client.delete_objects(
+            Bucket=BUCKET_NAME,
+            Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+        )
+    return {error['Key']: error.get('Message') or error.get('Code', '')
+            for error in response.get('Errors', [])}
+
+
+async def sweep_cleanup_queue(db: AsyncSession, s3_client=None,
+                              batch_size: int = S3_DELETE_BATCH_SIZE) -> int:
+    """
+    재시도 시각이 지난 키를 최대 batch_size(<= 1000)개 가져와 한 번에 삭제
+    실패한 키는 시도 횟수를 올리고 다음 시도를 뒤로 미룬다
+    :return: 삭제한 오브젝트 수
+    """
+    now = utcnow()
+    rows = (await db.scalars(
+        select(S3Cleanup)
+        .where(S3Cleanup.next_attempt_at <= now, S3Cleanup.attempts < S3_CLEANUP_MAX_ATTEMPTS)
+        .order_by(S3Cleanup.next_attempt_at, S3Cleanup.id)
+        .limit(min(batch_size, S3_DELETE_BATCH_SIZE))
+        .with_for_update(skip_locked=True)  # 스위퍼가 여러 프로세스에서 돌아도 같은 키를 나눠 갖지 않도록
+    )).all()
+    if not rows:
+        await db.rollback()
+        return 0
+
+    try:
+        errors = await run_in_threadpool(
+            _delete_objects, sorted({row.object_key for row in rows}), s3_client or get_s3_client()
+        )
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning("Failed to delete S3 objects: %s", e)
+        errors = {row.object_key: str(e) for row in rows}
+
+    deleted_ids = [row.id for row in rows if row.object_key not in errors]
+    for row in rows:
+        if row.object_key in errors:
+            row.attempts += 1
+            row.last_error = errors[row.object_key][:255]
+            backoff = S3_CLEANUP_RETRY_SECONDS * 2 ** (row.attempts - 1)
+            row.next_attempt_at = now + timedelta(seconds=backoff)
+            if row.attempts >= S3_CLEANUP_MAX_ATTEMPTS:
+                logger.error("Giving up deleting S3 object: %s (%s)",
+                             row.object_key, row.last_error)
+    if deleted_ids:
+        await db.execute(delete(S3Cleanup).where(S3Cleanup.id.in_(deleted_ids)))
+    await db.commit()
+
+    CLEANUP_DELETED.inc(len(deleted_ids))
+    CLEANUP_FAILURES.inc(len(rows) - len(deleted_ids))
+    return len(deleted_ids)
+
+
+async def run_cleanup_sweeper(session_factory, interval: float = S3_CLEANUP_INTERVAL) -> None:
+    """
+    대기열이 빌 때까지 배치 단위로 지우고 interval 초 쉬는 백그라운드 루프
+    """
+    while True:
+        try:
+            async with session_factory() as db:
+                while await sweep_cleanup_queue(db) >= S3_DELETE_BATCH_SIZE:
+                    pass
+        except Exception:  # pylint: disable=broad-exception-caught
+            CLEANUP_SWEEP_FAILURES.inc()
+            logger.exception("Failed to sweep S3 cleanup queue")
+        await asyncio.sleep(interval)
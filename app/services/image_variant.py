@@ -0,0 +1,149 @@
+"""
+이미지 변환본 생성 작업 처리
+게시물 생성 트랜잭션에는 작업만 기록하고, 워커가 변환본을 만들어 posts.image_variants 에 반영한다
+프로세스가 죽어도 작업은 테이블에 남아 있어서 다음 워커가 이어서 처리한다
+"""
+import asyncio
+import logging
+import os
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.post import Post as PostTable
+from app.models.variant import ImageVariantJob, VARIANT_FAILED, VARIANT_PENDING, VARIANT_UNSUPPORTED
+from app.services.cleanup import enqueue_image_cleanup
+from app.services.version import bump_versions, post_scopes
+from app.utils.clock import utcnow
+from app.utils.metrics import Counter
+from app.utils.variants import UnsupportedImage, generate_variants
+
+logger = logging.getLogger(__name__)
+
+IMAGE_VARIANT_BATCH_SIZE = int(os.getenv("IMAGE_VARIANT_BATCH_SIZE", "10"))
+IMAGE_VARIANT_POLL_INTERVAL = float(os.getenv("IMAGE_VARIANT_POLL_INTERVAL_SECONDS", "2"))
+IMAGE_VARIANT_MAX_ATTEMPTS = int(os.getenv("IMAGE_VARIANT_MAX_ATTEMPTS", "5"))
+IMAGE_VARIANT_LEASE_SECONDS = 300  # 가져간 작업을 다른 워커가 다시 가져가기까지 (처리 중 죽은 경우)
+IMAGE_VARIANT_RETRY_SECONDS = 30   # 재시도 간격 (시도할 때마다 두 배)
+
+VARIANT_GENERATED = Counter("feed_image_variants_generated_total", "변환본을 만든 이미지 수")
+VARIANT_FAILURES = Counter("feed_image_variant_failures_total", "이미지 변환본 생성 실패 횟수", ("reason",))
+VARIANT_WORKER_FAILURES = Counter("feed_image_variant_worker_failures_total", "변환본 워커 실행 실패 횟수")
+
+
+def enqueue_variants(db: AsyncSession, post: PostTable) -> None:
+    """
+    게시물 이미지마다 변환본 생성 작업 추가 (post 는 flush 되어 id 가 있어야 한다, 커밋은 게시물과 같은 트랜잭션에서)
+    """
+    db.add_all(ImageVariantJob(post_id=post.id, position=position, image_url=image_url)
+               for position, image_url in enumerate(post.image_urls or []))
+
+
+def response_variants(post: PostTable) -> List[Dict[str, str]]:
+    """
+    image_urls 와 같은 순서의 변환본 URL (아직 없거나 실패한 이미지는 원본 URL)
+    """
+    ready = post.image_variants or []
+    return [
+        (ready[position] if position < len(ready) and ready[position]
+         else {"thumb": url, "medium": url})
+        for position, url in enumerate(post.image_urls or [])
+    ]
+
+
+async def _claim(db: AsyncSession, batch_size: int) -> List[ImageVariantJob]:
+    """
+    처리할 작업을 가져가고 바로 커밋 (변환하는 동안 트랜잭션/락을 잡고 있지 않도록 재시도 시각을 lease 만큼 미뤄둔다)
+    """
+    now = utcnow()
+    jobs = (await db.scalars(
+        select(ImageVariantJob)
+        .where(ImageVariantJob.status == VARIANT_PENDING, ImageVariantJob.next_attempt_at <= now)
+        .order_by(ImageVariantJob.next_attempt_at, ImageVariantJob.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)  # 워커가 여러 프로세스에서 돌아도 같은 작업을 나눠 갖지 않도록
+    )).all()
+    for job in jobs:
+        job.attempts += 1
+        job.next_attempt_at = now + timedelta(seconds=IMAGE_VARIANT_LEASE_SECONDS)
+    await db.commit()
+    return list(jobs)
+
+
+async def process_variant_jobs(db: AsyncSession, batch_size: int = IMAGE_VARIANT_BATCH_SIZE) -> int:
+    """
+    대기 중인 작업을 batch_size 개까지 처리
+    성공하면 posts.image_variants 에 URL 을 기록하고 (게시물이 보이는 목록의 버전도 같이) 작업을 지운다,
+    실패하면 뒤로 미뤄 재시도
+    :return: 가져간 작업 수
+    """
+    jobs = await _claim(db, batch_size)
+    if not jobs:
+        return 0
+    results = await asyncio.gather(*(generate_variants(job.image_url) for job in jobs),
+                                   return_exceptions=True)
+
+    posts = {post.id: post for post in (await db.scalars(
+        select(PostTable)
+        .where(PostTable.id.in_({job.post_id for job in jobs}))
+        .with_for_update()  # 같은 게시물의 다른 이미지를 동시에 반영해도 덮어쓰지 않도록
+    )).all()}
+    now = utcnow()
+    done_ids = []
+    changed_scopes = []
+    for job, result in zip(jobs, results):
+        if isinstance(result, BaseException):
+            _record_failure(job, result, now)
+            continue
+        post: Optional[PostTable] = posts.get(job.post_id)
+        if post is None:
+            enqueue_image_cleanup(db, result.values())  # 만드는 사이에 게시물이 지워졌다
+        else:
+            ready = list(post.image_variants or [])
+            ready.extend([None] * (len(post.image_urls or []) - len(ready)))
+            ready[job.position] = result
+            post.image_variants = ready
+            changed_scopes.extend(post_scopes(post.user_id, post.hashtags))
+        done_ids.append(job.id)
+    if done_ids:
+        await db.execute(delete(ImageVariantJob).where(ImageVariantJob.id.in_(done_ids)))
+    await bump_versions(db, changed_scopes)  # 응답의 image_variants 가 바뀌므로 ETag 도 바뀌어야 한다
+    await db.commit()
+
+    VARIANT_GENERATED.inc(len(done_ids))
+    return len(jobs)
+
+
+def _record_failure(job: ImageVariantJob, error: BaseException, now) -> None:
+    job.last_error = str(error)[:255]
+    if isinstance(error, UnsupportedImage):
+        job.status = VARIANT_UNSUPPORTED
+        VARIANT_FAILURES.inc(reason="unsupported")
+        logger.warning("Skipping image variants for unsupported image: %s", job.image_url)
+        return
+    VARIANT_FAILURES.inc(reason="error")
+    if job.attempts >= IMAGE_VARIANT_MAX_ATTEMPTS:
+        job.status = VARIANT_FAILED
+        logger.error("Giving up generating image variants: %s (%s)", job.image_url, job.last_error)
+    else:
+        backoff = IMAGE_VARIANT_RETRY_SECONDS * 2 ** (job.attempts - 1)
+        job.next_attempt_at = now + timedelta(seconds=backoff)
+        logger.warning("Failed to generate image variants: %s (%s)", job.image_url, job.last_error)
+
+
+async def run_variant_worker(session_factory,
+                             interval: float = IMAGE_VARIANT_POLL_INTERVAL) -> None:
+    """
+    대기 작업이 없을 때까지 처리하고 interval 초 쉬는 백그라운드 루프
+    """
+    while True:
+        try:
+            async with session_factory() as db:
+                while await process_variant_jobs(db) >= IMAGE_VARIANT_BATCH_SIZE:
+                    pass
+        except Exception:  # pylint: disable=broad-exception-caught
+            VARIANT_WORKER_FAILURES.inc()
+            logger.exception("Failed to process image variant jobs")
+        await asyncio.sleep(interval)
@@ -0,0 +1,106 @@
+"""
+인기 게시물 후보(상위 100개) 스냅샷 관리
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.post import Post as PostTable
+from app.models.post import UserAbstractProfile
+from app.utils.metrics import Gauge, Counter
+
+logger = logging.getLogger(__name__)
+
+FAMOUS_CANDIDATE_LIMIT = 100
+FAMOUS_REFRESH_INTERVAL = float(os.getenv("FAMOUS_REFRESH_INTERVAL_SECONDS", "60"))
+
+SNAPSHOT_AGE = Gauge("feed_famous_snapshot_age_seconds", "인기 게시물 스냅샷 생성 후 경과 시간")
+REFRESH_DURATION = Gauge("feed_famous_refresh_duration_seconds", "마지막 인기 게시물 스냅샷 생성 소요 시간")
+REFRESH_FAILURES = Counter("feed_famous_refresh_failures_total", "인기 게시물 스냅샷 생성 실패 횟수")
+
+
+class FamousCandidate(NamedTuple):
+    """
+    인기 게시물 후보 (게시물 + 작성자 프로필)
+    """
+    post_id: int
+    user_id: str
+    user_name: str
+    profile_image: str
+    like_count: int
+
+
+class FamousLeaderboard:
+    """
+    좋아요 수 상위 게시물 스냅샷
+    요청마다 집계하지 않고 백그라운드에서 주기적으로 다시 만든다
+    """
+    def __init__(self):
+        self._candidates: List[FamousCandidate] = []
+        self._built_at: Optional[float] = None
+
+    @property
+    def age(self) -> Optional[float]:
+        """
+        스냅샷 생성 후 경과 시간(초), 아직 없으면 None
+        """
+        if self._built_at is None:
+            return None
+        return time.monotonic() - self._built_at
+
+    async def refresh(self, db: AsyncSession) -> List[FamousCandidate]:
+        """
+        상위 게시물 후보를 다시 읽어와 스냅샷 교체
+        """
+        started = time.perf_counter()
+        rows = (await db.execute(
+            select(
+                PostTable.id,
+                PostTable.user_id,
+                UserAbstractProfile.dog_name,   # 피드홈에 등록한 닉네임
+                UserAbstractProfile.photo_path, # 피드홈에 등록한 프로필 이미지
+                PostTable.like_count
+            )
+            .join(
+                UserAbstractProfile,
+                PostTable.user_id == UserAbstractProfile.social_id
+            )
+            .order_by(desc(PostTable.like_count))
+            .limit(FAMOUS_CANDIDATE_LIMIT)
+        )).all()
+        # 리스트를 통째로 교체하므로 읽는 쪽은 락 없이 이전/새 스냅샷 중 하나를 본다
+        self._candidates = [FamousCandidate(*row) for row in rows]
+        self._built_at = time.monotonic()
+        REFRESH_DURATION.set(time.perf_counter() - started)
+        return self._candidates
+
+    async def candidates(self, db: AsyncSession) -> List[FamousCandidate]:
+        """
+        현재 스냅샷 반환 (아직 만들어진 적이 없으면 바로 생성)
+        """
+        if self._built_at is None:
+            return await self.refresh(db)
+        return self._candidates
+
+
+famous_leaderboard = FamousLeaderboard()
+SNAPSHOT_AGE.set_function(lambda: famous_leaderboard.age)
+
+
+async def run_refresher(session_factory, interval: float = FAMOUS_REFRESH_INTERVAL) -> None:
+    """
+    interval 초마다 스냅샷을 다시 만드는 백그라운드 루프
+    """
+    while True:
+        try:
+            async with session_factory() as db:
+                await famous_leaderboard.refresh(db)
+        except Exception:  # pylint: disable=broad-exception-caught
+            REFRESH_FAILURES.inc()
+            logger.exception("Failed to refresh famous posts snapshot")
+        await asyncio.sleep(interval)
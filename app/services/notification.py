@@ -2,79 +2,97 @@
 알림 서비스
 """
 from collections import defaultdict
-from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 
+from sqlalchemy import desc, select, tuple_, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.notification import Notification as NotiTable
 from app.models.post import Like as LikeTable
-from app.models.post import UserAbstractProfile
-from app.schemas.notification import NotiResponse
+from app.schemas.notification import NotiResponse, NotiPage
 from app.schemas.post import Like
+from app.services.profile import profile_cache
+from app.services.version import bump_versions, inbox_scope
+from app.utils.pagination import encode_cursor, decode_cursor
 
 
-def get_notifications(user_id: str, db: Session) -> List[NotiResponse]:
+async def get_notifications(user_id: str, db: AsyncSession,
+                            limit: int = 20, cursor: Optional[str] = None) -> NotiPage:
     """
-    전체 알림 리스트 조회
+    전체 알림 리스트 조회 (게시물 단위로 묶어서 최근 활동순)
     """
-    notifications: List[NotiTable] = db.query(NotiTable).filter(NotiTable.user_id == user_id).all()
+    # 알림은 아웃박스 워커가 (유저, 게시물) 당 한 행으로 합쳐 두므로 그대로 페이지네이션
+    query = (
+        select(
+            NotiTable.post_id,
+            NotiTable.created_at,
+            NotiTable.is_read,
+            NotiTable.unread_count,
+            NotiTable.last_actor_id,
+        )
+        .where(NotiTable.user_id == user_id)
+    )
+    after = decode_cursor(cursor)
+    if after is not None:
+        query = query.where(tuple_(NotiTable.created_at, NotiTable.post_id) < after)
+    groups = (await db.execute(
+        query.order_by(desc(NotiTable.created_at), desc(NotiTable.post_id))
+        .limit(limit + 1)
+    )).all()
+    next_cursor = None
+    if len(groups) > limit:
+        groups = groups[:limit]
+        next_cursor = encode_cursor(groups[-1].created_at, groups[-1].post_id)
 
-    post_notifications = defaultdict(list)
-    for notification in notifications:
-        post_notifications[notification.post_id].append(notification)
+    # 페이지에 포함된 게시물들의 좋아요 누른 유저는 한 번의 쿼리로
+    likes_by_post: Dict[int, List[Like]] = defaultdict(list)
+    if groups:
+        likers = (await db.execute(
+            select(LikeTable.post_id, LikeTable.user_id)
+            .where(LikeTable.post_id.in_([group.post_id for group in groups]))
+            .order_by(LikeTable.id)
+        )).all()
+        # 닉네임/프로필 이미지는 프로필 캐시에서
+        profiles = await profile_cache.get_many(db, (liker.user_id for liker in likers))
+        for liker in likers:
+            profile = profiles.get(liker.user_id)
+            if profile is None:
+                continue
+            likes_by_post[liker.post_id].append(Like.construct(
+                user_id=liker.user_id,
+                nickname=profile.nickname,
+                profile_image_url=profile.profile_image_url
+            ))
 
     noti_response: List[NotiResponse] = []
-    for post_id, notifications in post_notifications.items():
-        likes: List[Like] = []
-        is_read: bool = True
-        created_at_list: List[datetime] = []
-
-        for notification in notifications:
-            like: LikeTable = (
-                db.query(
-                    LikeTable.user_id,
-                    UserAbstractProfile.dog_name.label('nickname'),   # 피드홈에 등록한 닉네임
-                    UserAbstractProfile.photo_path.label('profile_image_url'), # 피드홈에 등록한 프로필 이미지
-                )
-                .join(
-                    UserAbstractProfile,
-                    LikeTable.user_id == UserAbstractProfile.social_id
-                )
-                .filter(
-                    LikeTable.id == notification.like_id
-                ).first()
-            )
-            likes.append(Like(
-                user_id=like.user_id,
-                nickname=like.nickname,
-                profile_image_url=like.profile_image_url
-            ))
-            if not notification.is_read:
-                is_read = False
-            created_at_list.append(notification.created_at)
-        noti_response.append(NotiResponse(
-            is_read=is_read,
-            created_at=max(created_at_list),
-            post_id=post_id,
-            likes=likes
+    for group in groups:
+        # DB 에서 읽은 값이라 검증 없이 construct
+        noti_response.append(NotiResponse.construct(
+            is_read=bool(group.is_read),
+            created_at=group.created_at,
+            post_id=group.post_id,
+            unread_count=group.unread_count,
+            last_actor_id=group.last_actor_id,
+            likes=likes_by_post[group.post_id]
         ))
 
-    return noti_response
+    return NotiPage.construct(items=noti_response, next_cursor=next_cursor)
 
 
-def mark_notification_as_read(post_id: int, user_id: str, db: Session) -> None:
+async def mark_notification_as_read(post_id: int, user_id: str, db: AsyncSession) -> None:
     """
     특정 알림을 읽음 상태로 변경
     """
-    notifications: List[NotiTable] = (db.query(NotiTable).
-                                      filter(NotiTable.post_id == post_id,
-                                             NotiTable.user_id == user_id).all())
-    for notification in notifications:
-        notification.is_read = True
-
     try:
-        db.commit()
+        result = await db.execute(
+            update(NotiTable)
+            .where(NotiTable.post_id == post_id, NotiTable.user_id == user_id,
+                   NotiTable.is_read.is_not(True))
+            .values(is_read=True, unread_count=0)
+        )
+        if result.rowcount:
+            await bump_versions(db, [inbox_scope(user_id)])
+        await db.commit()
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise
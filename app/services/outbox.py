@@ -0,0 +1,125 @@
+"""
+아웃박스 이벤트 처리 (좋아요 -> 알림)
+좋아요 요청은 이벤트만 같은 트랜잭션에 남기고, 알림 생성은 워커가 배치로 한다
+"""
+import asyncio
+import logging
+import os
+from typing import Dict, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import Notification as NotiTable
+from app.models.outbox import OutboxEvent
+from app.models.post import Like as LikeTable
+from app.services.version import bump_versions, inbox_scope, upsert_insert
+from app.utils.clock import utcnow
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+LIKE_CREATED = "like.created"
+
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "500"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "1"))
+
+OUTBOX_EVENTS = Counter("feed_outbox_events_total", "처리한 아웃박스 이벤트 수")
+OUTBOX_NOTIFICATIONS = Counter("feed_outbox_notifications_total", "아웃박스 이벤트로 갱신한 알림 행 수")
+OUTBOX_FAILURES = Counter("feed_outbox_failures_total", "아웃박스 워커 실행 실패 횟수")
+
+
+def add_like_event(db: AsyncSession, like: LikeTable, recipient_id: str) -> None:
+    """
+    좋아요 이벤트 기록 (커밋은 좋아요와 같은 트랜잭션에서)
+    """
+    db.add(OutboxEvent(
+        event_type=LIKE_CREATED,
+        post_id=like.post_id,
+        like_id=like.id,
+        actor_id=like.user_id,
+        recipient_id=recipient_id,
+        created_at=utcnow(),  # DateTime 컬럼은 naive 라 tzinfo 없는 UTC (asyncpg 는 aware 값을 거부)
+    ))
+
+
+async def process_outbox(db: AsyncSession, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+    """
+    오래된 이벤트부터 batch_size 개를 알림으로 바꾸고 지운다
+    같은 좋아요의 중복 이벤트와 그 사이 취소된 좋아요는 건너뛰고,
+    남은 좋아요는 (받는 유저, 게시물) 별로 묶어 알림 한 행에 개수와 마지막 유저를 upsert 한다
+    :return: 처리한 이벤트 수
+    """
+    events = (await db.scalars(
+        select(OutboxEvent)
+        .order_by(OutboxEvent.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)  # 워커가 여러 개 떠 있어도 같은 이벤트를 나눠 갖지 않도록
+    )).all()
+    if not events:
+        await db.rollback()
+        return 0
+
+    like_events: Dict[int, OutboxEvent] = {}
+    for outbox_event in events:
+        if outbox_event.event_type == LIKE_CREATED:
+            like_events.setdefault(outbox_event.like_id, outbox_event)
+        else:
+            logger.warning("Unknown outbox event type: %s", outbox_event.event_type)
+
+    live_like_ids = set()
+    if like_events:
+        live_like_ids = set((await db.scalars(
+            select(LikeTable.id).where(LikeTable.id.in_(like_events))
+        )).all())
+    # 이벤트는 id 순이라 뒤에 나온 좋아요가 마지막 유저
+    notifications: Dict[Tuple[str, int], dict] = {}
+    for like_id, like_event in like_events.items():
+        if like_id not in live_like_ids:
+            continue
+        key = (like_event.recipient_id, like_event.post_id)
+        noti = notifications.setdefault(key, {
+            'user_id': like_event.recipient_id,
+            'post_id': like_event.post_id,
+            'is_read': False,
+            'unread_count': 0,
+        })
+        noti['unread_count'] += 1
+        noti['created_at'] = like_event.created_at
+        noti['last_actor_id'] = like_event.actor_id
+    if notifications:
+        # 행 락 순서가 항상 같도록 정렬해서 한 문장으로 upsert
+        rows = [notifications[key] for key in sorted(notifications)]
+        statement = upsert_insert(db)(NotiTable).values(rows)
+        await db.execute(statement.on_conflict_do_update(
+            index_elements=[NotiTable.user_id, NotiTable.post_id],
+            set_={
+                'is_read': False,
+                'created_at': statement.excluded.created_at,
+                'unread_count': NotiTable.unread_count + statement.excluded.unread_count,
+                'last_actor_id': statement.excluded.last_actor_id,
+            },
+        ))
+        await bump_versions(db, (inbox_scope(user_id) for user_id, _ in notifications))
+    await db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_([e.id for e in events])))
+    await db.commit()
+
+    OUTBOX_EVENTS.inc(len(events))
+    OUTBOX_NOTIFICATIONS.inc(len(notifications))
+    return len(events)
+
+
+async def run_outbox_worker(session_factory, interval: float = OUTBOX_POLL_INTERVAL) -> None:
+    """
+    아웃박스를 비울 때까지 처리하고 interval 초 쉬는 백그라운드 루프
+    쉬는 동안 쌓인 같은 게시물의 좋아요는 다음 배치에서 한꺼번에 처리된다
+    """
+    while True:
+        try:
+            async with session_factory() as db:
+                while await process_outbox(db) >= OUTBOX_BATCH_SIZE:
+                    pass
+        except Exception:  # pylint: disable=broad-exception-caught
+            OUTBOX_FAILURES.inc()
+            logger.exception("Failed to process outbox events")
+        await asyncio.sleep(interval)
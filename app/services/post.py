@@ -1,126 +1,183 @@
 """
 게시물 서비스 로직
 """
-from datetime import datetime, UTC
+import os
+from datetime import datetime
+from collections import defaultdict
 from random import sample
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, cast, String
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import Select
+from sqlalchemy import (
+    case, delete, desc, exists, func, literal_column, null, select, tuple_, union_all, update
+)
 from fastapi import HTTPException
 
-from app.schemas.post import PostResponse, FamousResponse, Like, LikeToggle, PostCreate, PostUpdate
+from app.schemas.post import (
+    PostResponse, PostPage, FamousResponse, ImageVariants, Like, LikePage, LikeToggle, PostCreate,
+    PostUpdate, LikeSummary, LikeBatchResponse
+)
 from app.models.post import Post as PostTable
 from app.models.post import Like as LikeTable
-from app.models.post import User as UserTable
-from app.models.post import UserAbstractProfile
+from app.models.post import PostHashtag as PostHashtagTable
 from app.models.notification import Notification as NotiTable
+from app.services.cleanup import enqueue_image_cleanup
+from app.services.image_variant import enqueue_variants, response_variants
+from app.services.leaderboard import famous_leaderboard
+from app.services.outbox import add_like_event
+from app.services.profile import profile_cache
+from app.services.version import bump_versions, inbox_scope, post_scopes
 from app.utils.parser import extract_hashtags
-from app.utils.image import upload_image_to_s3, create_s3_client
+from app.utils.image import upload_images_to_s3, cleanup_uploaded_images
+from app.utils.pagination import encode_cursor, decode_cursor, encode_id_cursor, decode_id_cursor
+from app.utils.variants import variant_urls
 
-def list_posts(user_id: str, db: Session) -> List[PostResponse]:
+# compact 모드에서 게시물마다 보여줄 좋아요 누른 유저 수
+COMPACT_LIKERS = int(os.getenv("COMPACT_LIKERS", "3"))
+
+async def _paginate(db: AsyncSession, query: Select, limit: int, cursor: Optional[str],
+                    uploaded_at_column=PostTable.uploaded_at,
+                    id_column=PostTable.id) -> Tuple[List[PostTable], Optional[str]]:
     """
-    유저 포스트 리스팅 로직
+    (uploaded_at, id) 내림차순 키셋 페이지네이션
+    OFFSET 과 달리 인덱스에서 커서 위치부터 바로 읽으므로 뒤쪽 페이지도 비용이 같다
     """
-    # 유저 id 기반으로 게시물 db 긁어오기
-    posts: List[PostTable] = db.query(PostTable).filter(PostTable.user_id == user_id).all()
-    post_list = []
-    for post in posts:
-        likes = list_post_likes(post.id, db)
-        post_list.append(PostResponse(
+    after = decode_cursor(cursor)
+    if after is not None:
+        query = query.where(tuple_(uploaded_at_column, id_column) < after)
+    posts: List[PostTable] = list((await db.scalars(
+        query.order_by(desc(uploaded_at_column), desc(id_column))
+        .limit(limit + 1) # 다음 페이지 존재 여부 확인용으로 하나 더
+    )).all())
+    if len(posts) <= limit:
+        return posts, None
+    posts = posts[:limit]
+    return posts, encode_cursor(posts[-1].uploaded_at, posts[-1].id)
+
+async def _get_post(post_id: int, db: AsyncSession,
+                    with_hashtags: bool = False) -> Optional[PostTable]:
+    """
+    게시물 조회 (해시태그 인덱스를 같이 고쳐야 하면 미리 로딩)
+    """
+    query = select(PostTable).where(PostTable.id == post_id)
+    if with_hashtags:
+        query = query.options(selectinload(PostTable.hashtag_index))
+    return (await db.scalars(query)).first()
+
+def sync_hashtag_index(post: PostTable, hashtags: List[str]) -> None:
+    """
+    posts.hashtags 변경 내용을 post_hashtags 인덱스 테이블에 반영 (커밋은 호출한 쪽에서)
+    기존 게시물이면 hashtag_index 가 미리 로딩되어 있어야 한다
+    """
+    wanted = dict.fromkeys(hashtags)  # 순서 유지하면서 중복 제거
+    post.hashtag_index = [row for row in post.hashtag_index if row.hashtag in wanted]
+    indexed = {row.hashtag for row in post.hashtag_index}
+    for hashtag in wanted:
+        if hashtag not in indexed:
+            post.hashtag_index.append(
+                PostHashtagTable(hashtag=hashtag, uploaded_at=post.uploaded_at)
+            )
+
+async def _post_responses(posts: List[PostTable], db: AsyncSession, viewer_id: Optional[str] = None,
+                          compact: bool = False) -> List[PostResponse]:
+    """
+    게시물 목록 -> 리스폰스 (좋아요는 게시물 수와 상관없이 한 번의 쿼리로)
+    compact 면 전체 좋아요 대신 앞쪽 COMPACT_LIKERS 명과 liked_by_me 만
+    """
+    post_ids = [post.id for post in posts]
+    liked_by_me: Set[int] = set()
+    if compact:
+        likes_by_post, liked_by_me = await summarize_likes_by_post_ids(post_ids, viewer_id, db)
+    else:
+        likes_by_post = await list_likes_by_post_ids(post_ids, db)
+    # DB 에서 읽은 값이라 검증 없이 construct (목록이 길어지면 HttpUrl 검증 비용이 크다)
+    return [
+        PostResponse.construct(
             post_id=post.id,
             user_id=post.user_id,
             image_urls=post.image_urls,  # S3 URL 리스트
+            image_variants=[ImageVariants.construct(**urls) for urls in response_variants(post)],
             content=post.content,
             uploaded_at=post.uploaded_at,
-            liked_by=likes,
-        ))
-    return post_list
+            liked_by=likes_by_post[post.id],
+            like_count=post.like_count,
+            liked_by_me=(post.id in liked_by_me) if compact else None,
+        )
+        for post in posts
+    ]
 
-def famous_posts(db: Session) -> List[FamousResponse]:
+async def list_posts(user_id: str, db: AsyncSession, limit: int = 20, cursor: Optional[str] = None,
+                     viewer_id: Optional[str] = None, compact: bool = False) -> PostPage:
     """
-    좋아요 수 기준 상위 5개의 인기 게시물 반환 (사용자 이름 포함)
+    유저 포스트 리스팅 로직
     """
-    # posts = (
-    #     db.query(
-    #         PostTable,
-    #         UserTable.name.label('user_name'),
-    #         # pylint: disable=not-callable # SQLAlchemy 2.0.0 이후로 업그레이드된 이후 발생하는 pylint의 문제라고 합니다
-    #         func.count(LikeTable.post_id).label('like_count')
-    #     )
-    #     .join(
-    #         UserTable, PostTable.user_id == cast(UserTable.social_id, String)
-    #     )
-    #     .outerjoin(LikeTable, PostTable.id == LikeTable.post_id)
-    #     .group_by(PostTable.id, UserTable.name)
-    #     .order_by(desc('like_count'))
-    #     .limit(100) # 상위 100개를 가져오고
-    #     .all()
-    # )
-    posts = (
-        db.query(
-            PostTable,                      # 포스팅의 ID, 등록한 유저의 social_id 추출 가능
-            UserAbstractProfile.dog_name.label('user_name'),   # 피드홈에 등록한 닉네임
-            UserAbstractProfile.photo_path.label('profile_image'), # 피드홈에 등록한 프로필 이미지
-            # pylint: disable=not-callable # SQLAlchemy 2.0.0 이후로 업그레이드된 이후 발생하는 pylint의 문제라고 합니다
-            func.count(LikeTable.post_id).label('like_count')
-        )
-        .join(
-            UserAbstractProfile,
-            PostTable.user_id == UserAbstractProfile.social_id
-        )
-        .outerjoin(LikeTable, PostTable.id == LikeTable.post_id)
-        .group_by(
-            PostTable.id,
-            UserAbstractProfile.dog_name,
-            UserAbstractProfile.photo_path
-        )
-        .order_by(desc('like_count'))
-        .limit(100) # 상위 100개를 가져오고
-        .all()
+    # 유저 id 기반으로 게시물 db 긁어오기
+    posts, next_cursor = await _paginate(
+        db, select(PostTable).where(PostTable.user_id == user_id), limit, cursor
     )
-    random_posts = sample(posts, min(5, len(posts))) # 5개를 랜덤하게 추출
+    items = await _post_responses(posts, db, viewer_id, compact)
+    return PostPage.construct(items=items, next_cursor=next_cursor)
+
+async def famous_posts(db: AsyncSession, viewer_id: Optional[str] = None,
+                       compact: bool = False) -> List[FamousResponse]:
+    """
+    좋아요 수 기준 상위 5개의 인기 게시물 반환 (사용자 이름 포함)
+    """
+    # 상위 100개 후보는 백그라운드에서 주기적으로 갱신되는 스냅샷에서 가져오고
+    candidates = await famous_leaderboard.candidates(db)
+    random_posts = sample(candidates, min(5, len(candidates))) # 5개를 랜덤하게 추출
+    post_ids = [post.post_id for post in random_posts]
+    liked_by_me: Set[int] = set()
+    if compact:
+        likes_by_post, liked_by_me = await summarize_likes_by_post_ids(post_ids, viewer_id, db)
+    else:
+        likes_by_post = await list_likes_by_post_ids(post_ids, db)
 
     post_list = []
-    for post, user_name, profile_image, _ in random_posts:  # user_name 추가
-        likes = list_post_likes(post.id, db)
-        post_list.append(FamousResponse(
-            post_id=post.id,
+    for post in random_posts:
+        post_list.append(FamousResponse.construct(
+            post_id=post.post_id,
             user_id=post.user_id,   # post 등록한 유저의 social_id
-            user_name=user_name,    # 유저의 닉네임
-            profile_image_url=profile_image, # 유저의 프로필 이미지
-            like_count=len(likes),
-            liked_by=likes
+            user_name=post.user_name,    # 유저의 닉네임
+            profile_image_url=post.profile_image, # 유저의 프로필 이미지
+            like_count=post.like_count,
+            liked_by=likes_by_post[post.post_id],
+            liked_by_me=(post.post_id in liked_by_me) if compact else None,
         ))
     return post_list
 
-def create_post(user_id: str, db: Session, post_create: PostCreate) -> PostResponse:
+async def create_post(user_id: str, db: AsyncSession, post_create: PostCreate) -> PostResponse:
     """
     새 게시물 생성 로직
     """
-    try:
-        # base64 이미지들을 S3에 업로드
-        s3_urls = []
-        for base64_image in post_create.image_urls:
-            s3_client = create_s3_client()
-            s3_url = upload_image_to_s3(base64_image, s3_client)
-            s3_urls.append(s3_url)
+    # base64 이미지들을 S3에 동시에 업로드 (실패하면 올라간 것까지 정리됨)
+    s3_urls = await upload_images_to_s3(post_create.image_urls)
+    return await create_post_with_images(user_id, db, post_create.content, s3_urls)
 
+async def create_post_with_images(user_id: str, db: AsyncSession, content: Optional[str],
+                                  s3_urls: List[str]) -> PostResponse:
+    """
+    이미 S3 에 올라간 이미지로 게시물 생성 (DB 저장에 실패하면 이미지도 정리)
+    """
+    try:
         # 해시태그 추출 및 게시물 생성
-        hashtags = extract_hashtags(post_create.content)
+        hashtags = extract_hashtags(content or "")
         post = PostTable(
             user_id=user_id,
-            content=post_create.content,
+            content=content,
             uploaded_at=datetime.now(),
             image_urls=s3_urls,  # S3 URL 리스트 저장
             hashtags=hashtags
         )
+        sync_hashtag_index(post, hashtags)
 
         db.add(post)
-        db.commit()
-        db.refresh(post)
-
-        likes = list_post_likes(post.id, db)
+        await db.flush()
+        enqueue_variants(db, post) # 썸네일/WebP 변환본은 워커가 만든다 (그 전까지 응답은 원본 URL)
+        await bump_versions(db, post_scopes(user_id, hashtags))
+        await db.commit()
 
         return PostResponse(
             post_id=post.id,
@@ -128,35 +185,41 @@ def create_post(user_id: str, db: Session, post_create: PostCreate) -> PostRespo
             image_urls=post.image_urls,
             content=post.content,
             uploaded_at=post.uploaded_at,
-            liked_by=likes,
+            liked_by=[], # 새 게시물에는 좋아요가 없다
+            like_count=0,
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
+        await cleanup_uploaded_images(s3_urls) # DB 저장에 실패하면 올린 이미지도 정리
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-def update_post(user_id: str, post_id: int, db: Session, post_update: PostUpdate) -> PostResponse:
+async def update_post(user_id: str, post_id: int, db: AsyncSession,
+                      post_update: PostUpdate) -> PostResponse:
     """
     게시물 내용 수정 로직
     """
-    post: PostTable = db.query(PostTable).filter(PostTable.id == post_id).first()
-    if user_id != post.user_id:
-        raise HTTPException(status_code=403, detail="Forbidden user")
-
+    post = await _get_post(post_id, db, with_hashtags=True)
     if post is None:
         raise HTTPException(status_code=404, detail="Post not found")
 
+    if user_id != post.user_id:
+        raise HTTPException(status_code=403, detail="Forbidden user")
+
     hashtags = extract_hashtags(post_update.content)
+    # 빠진 해시태그 피드도
+    changed_scopes = post_scopes(post.user_id, set(post.hashtags or []) | set(hashtags))
     post.content = post_update.content
     post.hashtags = hashtags
+    sync_hashtag_index(post, hashtags)
     try:
-        db.commit()
-        db.refresh(post)
+        await bump_versions(db, changed_scopes)
+        await db.commit()
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise
 
-    likes = list_post_likes(post.id, db)
+    likes = await list_post_likes(post.id, db)
 
     return PostResponse(
         post_id=post.id,
@@ -164,136 +227,270 @@ def update_post(user_id: str, post_id: int, db: Session, post_update: PostUpdate
         image_urls=post.image_urls,
         content=post.content,
         uploaded_at=post.uploaded_at,
+        image_variants=response_variants(post),
         liked_by=likes,
+        like_count=post.like_count,
     )
 
 
-def delete_post(user_id: str, post_id: int, db: Session) -> None:
+async def delete_post(user_id: str, post_id: int, db: AsyncSession) -> None:
     """게시물 삭제 로직"""
-    post = db.query(PostTable).filter(PostTable.id == post_id).first()
+    post = await _get_post(post_id, db)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     if user_id != post.user_id:
         raise HTTPException(status_code=403, detail="Forbidden user")
 
     try:
-        db.delete(post) # DB에서 먼저 삭제 시도
-        # S3 이미지 삭제 시도
-        s3_client = create_s3_client()
-        for image_url in post.image_urls:
-            try:
-                key = image_url.split('.com/')[-1]
-                s3_client.delete_object(Bucket='balm-bucket', Key=key)
-            except Exception as e:
-                db.rollback() # 이미지 삭제 실패시 DB 롤백
-                raise HTTPException(status_code=500, detail=f"Failed to delete image: {str(e)}") from e
-        db.commit() # 모든 작업 성공시 커밋
-
+        # S3 이미지(변환본 포함)는 같은 트랜잭션에서 정리 대기열에 넣고 스위퍼가 지운다
+        image_urls = list(post.image_urls or [])
+        for image_url in post.image_urls or []:
+            image_urls.extend(variant_urls(image_url).values())
+        enqueue_image_cleanup(db, image_urls)
+        await bump_versions(
+            db, post_scopes(post.user_id, post.hashtags) + [inbox_scope(post.user_id)]
+        )
+        await db.delete(post)
+        await db.commit()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-def list_posts_with_hashtag(hashtag: str, db: Session) -> List[PostResponse]:
-    posts: List[PostTable] = db.query(PostTable).filter(PostTable.hashtags.contains([hashtag])).all()
-
-    post_list = []
-    for post in posts:
-        # 게시물 좋아요 리스트 긁어오기
-        likes = list_post_likes(post.id, db)
-
-        # 리스폰스 생성
-        post_list.append(PostResponse(
-            post_id=post.id,
-            user_id=post.user_id,
-            image_urls=post.image_urls,
-            content=post.content,
-            uploaded_at=post.uploaded_at,
-            liked_by=likes,
-        ))
+async def list_posts_with_hashtag(hashtag: str, db: AsyncSession,
+                                  limit: int = 20, cursor: Optional[str] = None,
+                                  viewer_id: Optional[str] = None,
+                                  compact: bool = False) -> PostPage:
+    """
+    해시태그 게시물 리스팅 로직
+    """
+    # post_hashtags (hashtag, uploaded_at, post_id) 인덱스 범위 스캔
+    posts, next_cursor = await _paginate(
+        db,
+        select(PostTable)
+        .join(PostHashtagTable, PostHashtagTable.post_id == PostTable.id)
+        .where(PostHashtagTable.hashtag == hashtag),
+        limit,
+        cursor,
+        uploaded_at_column=PostHashtagTable.uploaded_at,
+        id_column=PostHashtagTable.post_id,
+    )
 
-    return post_list
+    items = await _post_responses(posts, db, viewer_id, compact)
+    return PostPage.construct(items=items, next_cursor=next_cursor)
 
-def get_post_likes_count(post_id: int, db: Session) -> int:
-    return db.query(LikeTable).filter(LikeTable.post_id == post_id).count()
+async def _add_post_like_count(post_id: int, delta: int, db: AsyncSession) -> int:
+    """
+    posts.like_count 를 원자적으로 증감하고 바뀐 값을 반환 (커밋은 호출한 쪽에서)
+    """
+    return (await db.execute(
+        update(PostTable)
+        .where(PostTable.id == post_id)
+        .values(like_count=PostTable.like_count + delta)
+        .returning(PostTable.like_count)
+    )).scalar_one()
 
-def toggle_post_like(post_id: int, user_id: str, db: Session) -> LikeToggle:
+async def toggle_post_like(post_id: int, user_id: str, db: AsyncSession) -> LikeToggle:
     """
     게시물 좋아요 토글 로직
     """
-    post: PostTable = db.query(PostTable).filter(PostTable.id == post_id).first()
+    post = await _get_post(post_id, db)
 
     if post is None:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    existing_like = (db.query(LikeTable).filter(
+    existing_like: Optional[LikeTable] = (await db.scalars(select(LikeTable).where(
         LikeTable.post_id == post_id,
         LikeTable.user_id == user_id
-    ).first())
+    ))).first()
 
     try:
         if existing_like:
-            # 좋아요가 있으면 좋아요와 알림 삭제
-            notification = db.query(NotiTable).filter(NotiTable.like_id == existing_like.id).first()
-            if notification:
-                db.delete(notification)
-            db.delete(existing_like)
-            db.commit()
+            # 좋아요가 있으면 좋아요 삭제 (알림의 좋아요 목록에서도 빠진다)
+            # 같은 유저의 동시 취소 요청이 먼저 지웠으면 지운 행이 없으므로 카운터/버전/알림은 그대로
+            deleted = (await db.execute(
+                delete(LikeTable)
+                .where(LikeTable.post_id == post_id, LikeTable.user_id == user_id)
+                .returning(LikeTable.id)
+            )).first()
+            if deleted is None:
+                await db.rollback()
+                likes_count = await db.scalar(
+                    select(PostTable.like_count).where(PostTable.id == post_id)
+                )
+            else:
+                likes_count = await _add_post_like_count(post_id, -1, db)
+                if likes_count == 0:
+                    # 남은 좋아요가 없으면 게시물 알림도 삭제
+                    await db.execute(delete(NotiTable).where(
+                        NotiTable.user_id == post.user_id,
+                        NotiTable.post_id == post_id,
+                    ))
+                # liked_by 가 바뀌는 목록들과 알림함
+                await bump_versions(
+                    db, post_scopes(post.user_id, post.hashtags) + [inbox_scope(post.user_id)]
+                )
+                await db.commit()
             return LikeToggle(
                 message="Successfully unliked a post",
                 is_liked=False,
-                likes_count=get_post_likes_count(post_id, db)
+                likes_count=likes_count or 0
             )
-        # 좋아요가 없으면 좋아요와 알림 추가
+        # 좋아요가 없으면 좋아요 추가
         like = LikeTable(
             post_id=post_id,
             user_id=user_id,
         )
         db.add(like)
-        db.commit()
-        db.refresh(like)
+        await db.flush()
+        # 카운터 증가와 알림 이벤트까지 한 트랜잭션으로 커밋 (알림은 아웃박스 워커가 만든다)
+        likes_count = await _add_post_like_count(post_id, 1, db)
+        add_like_event(db, like, post.user_id)
+        await bump_versions(db, post_scopes(post.user_id, post.hashtags))
+        await db.commit()
+    except IntegrityError:
+        # 같은 유저의 동시 요청이 먼저 좋아요를 넣었으면 (post_id, user_id) 유니크 제약에 걸린다
+        # 카운터는 건드리지 않고 이미 좋아요한 상태로 응답
+        await db.rollback()
+        if existing_like:
+            raise
+        likes_count = await db.scalar(select(PostTable.like_count).where(PostTable.id == post_id))
+        if likes_count is None:
+            raise HTTPException(status_code=404, detail="Post not found") from None
 
-        notification = NotiTable(
-            user_id=post.user_id,
-            is_read=False,
-            created_at=datetime.now(UTC),
-            post_id=post_id,
-            like_id=like.id
+    return LikeToggle(
+        message="Successfully liked a post",
+        is_liked=True,
+        likes_count=likes_count
+    )
+
+async def list_post_likes(post_id: int, db: AsyncSession) -> List[Like]:
+    """
+    게시물의 좋아요 리스팅
+    """
+    return (await list_likes_by_post_ids([post_id], db))[post_id]
+
+
+async def list_post_likes_page(post_id: int, db: AsyncSession,
+                              limit: int = 20, cursor: Optional[str] = None) -> LikePage:
+    """
+    게시물의 좋아요 리스팅 (좋아요 순서대로, 커서 페이지네이션)
+    """
+    if await db.scalar(select(PostTable.id).where(PostTable.id == post_id)) is None:
+        raise HTTPException(status_code=404, detail="Post not found")
+
+    query = (select(LikeTable.id, LikeTable.post_id, LikeTable.user_id)
+             .where(LikeTable.post_id == post_id))
+    after = decode_id_cursor(cursor)
+    if after is not None:
+        query = query.where(LikeTable.id > after)
+    rows = (await db.execute(query.order_by(LikeTable.id).limit(limit + 1))).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_id_cursor(rows[-1].id)
+    likes = (await _likes_with_profiles(rows, db))[post_id]
+    return LikePage.construct(items=likes, next_cursor=next_cursor)
+
+
+async def _likes_with_profiles(rows, db: AsyncSession) -> Dict[int, List[Like]]:
+    """
+    (post_id, user_id) 행들에 프로필을 붙여 게시물 ID 별로 묶는다
+    닉네임/프로필 이미지는 조인 대신 프로필 캐시에서 (없는 유저만 한 번에 조회)
+    """
+    likes_by_post: Dict[int, List[Like]] = defaultdict(list)
+    profiles = await profile_cache.get_many(db, (row.user_id for row in rows))
+    for row in rows:
+        profile = profiles.get(row.user_id)
+        if profile is None:  # 프로필 없는 유저는 제외 (기존 조인과 동일)
+            continue
+        likes_by_post[row.post_id].append(Like.construct(
+            user_id=row.user_id,
+            nickname=profile.nickname,
+            profile_image_url=profile.profile_image_url
+        ))
+    return likes_by_post
+
+
+async def list_likes_by_post_ids(post_ids: Iterable[int],
+                                 db: AsyncSession) -> Dict[int, List[Like]]:
+    """
+    여러 게시물의 좋아요를 한 번의 쿼리로 리스팅 (게시물 ID 별로 묶어서 반환)
+    """
+    post_ids = set(post_ids)
+    if not post_ids:
+        return defaultdict(list)
+
+    likes = (await db.execute(
+        select(LikeTable.post_id, LikeTable.user_id)
+        .where(LikeTable.post_id.in_(post_ids))
+        .order_by(LikeTable.id)
+    )).all()
+    return await _likes_with_profiles(likes, db)
+
+
+async def summarize_likes_by_post_ids(post_ids: Iterable[int], viewer_id: Optional[str],
+                                      db: AsyncSession, likers: int = COMPACT_LIKERS
+                                      ) -> Tuple[Dict[int, List[Like]], Set[int]]:
+    """
+    게시물마다 앞쪽 likers 명의 좋아요와 viewer 가 좋아요 누른 게시물 ID 를 한 번의 쿼리로
+    게시물별로 likes(post_id, id) 인덱스를 ORDER BY id LIMIT likers 로 읽고,
+    viewer 는 (post_id, user_id) 유니크 키로 EXISTS 만 확인해서 좋아요가 많아도 비용이 같다
+    """
+    post_ids = sorted(set(post_ids))
+    if not post_ids:
+        return defaultdict(list), set()
+
+    # LATERAL 이 없는 SQLite 에서도 돌도록 게시물별 LIMIT 쿼리를 UNION ALL 로
+    branches = []
+    for post_id in post_ids if likers > 0 else []:
+        first = (
+            select(LikeTable.post_id, LikeTable.user_id, LikeTable.id)
+            .where(LikeTable.post_id == post_id)
+            .order_by(LikeTable.id)
+            .limit(likers)
+            .subquery()
         )
-        db.add(notification)
-        db.commit()
-        db.refresh(notification)
-        
-        return LikeToggle(
-            message="Successfully liked a post",
-            is_liked=True,
-            likes_count=get_post_likes_count(post_id, db)
+        branches.append(select(first.c.post_id, first.c.user_id, first.c.id,
+                               literal_column('0').label('mine')))
+    if viewer_id is not None:
+        branches.append(
+            select(PostTable.id, null(), null(), literal_column('1'))
+            .where(
+                PostTable.id.in_(post_ids),
+                exists().where(LikeTable.post_id == PostTable.id, LikeTable.user_id == viewer_id),
+            )
         )
-    except IntegrityError:
-        db.rollback()
-        raise
+    if not branches:
+        return defaultdict(list), set()
+    rows = (await db.execute(union_all(*branches))).all()
+    liked_by_me = {row.post_id for row in rows if row.mine}
+    first_likes = sorted((row for row in rows if not row.mine),
+                         key=lambda row: (row.post_id, row.id))
+    return await _likes_with_profiles(first_likes, db), liked_by_me
 
-def list_post_likes(post_id: int, db: Session) -> List[Like]:
+
+async def summarize_likes_batch(post_ids: List[int], user_id: str,
+                                db: AsyncSession) -> LikeBatchResponse:
     """
-    게시물의 좋아요 리스팅
+    여러 게시물의 좋아요 수와 user_id 가 눌렀는지를 한 번의 GROUP BY 로
+    likes(post_id, user_id) 인덱스만 읽는다
     """
-    likes = (
-        db.query(
-            LikeTable.user_id,
-            UserAbstractProfile.dog_name,
-            UserAbstractProfile.photo_path
+    post_ids = list(dict.fromkeys(post_ids))  # 순서 유지하면서 중복 제거
+    rows = (await db.execute(
+        select(
+            LikeTable.post_id,
+            func.count().label('like_count'),  # pylint: disable=not-callable
+            func.max(case((LikeTable.user_id == user_id, 1), else_=0)).label('liked_by_me'),
         )
-        .join(
-            UserAbstractProfile,
-            LikeTable.user_id == UserAbstractProfile.social_id
+        .where(LikeTable.post_id.in_(post_ids))
+        .group_by(LikeTable.post_id)
+    )).all()
+    by_post = {row.post_id: row for row in rows}
+    return LikeBatchResponse.construct(items=[
+        LikeSummary.construct(
+            post_id=post_id,
+            like_count=by_post[post_id].like_count if post_id in by_post else 0,
+            liked_by_me=bool(by_post[post_id].liked_by_me) if post_id in by_post else False,
         )
-        .filter(LikeTable.post_id == post_id)
-        .all()
-    )
-    like_responses = []
-    for like in likes:
-        like_responses.append(Like(
-            user_id=like.user_id,
-            nickname=like.dog_name,
-            profile_image_url=like.photo_path
-        ))
-    return like_responses
+        for post_id in post_ids
+    ])
@@ -0,0 +1,95 @@
+"""
+피드홈 프로필(닉네임, 프로필 이미지) 조회 캐시
+좋아요/알림 리스팅마다 users_profile 을 조인하지 않고 프로세스 안에서 TTL 동안 재사용한다
+"""
+import os
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.post import UserAbstractProfile
+from app.utils.cache import TTLCache
+from app.utils.metrics import Counter, Gauge
+
+PROFILE_CACHE_SIZE = int(os.getenv("PROFILE_CACHE_SIZE", "10000"))
+PROFILE_CACHE_TTL = float(os.getenv("PROFILE_CACHE_TTL_SECONDS", "300"))
+
+PROFILE_CACHE_REQUESTS = Counter(
+    "feed_profile_cache_requests_total", "프로필 캐시 조회 수 (유저 단위)", ("result",)
+)
+PROFILE_CACHE_ENTRIES = Gauge("feed_profile_cache_entries", "프로필 캐시에 들어 있는 유저 수")
+
+
+class Profile(NamedTuple):
+    """
+    피드홈에 등록한 닉네임과 프로필 이미지
+    """
+    nickname: str
+    profile_image_url: Optional[str]
+
+
+class ProfileCache:
+    """
+    social_id -> Profile TTL LRU 캐시
+    """
+    def __init__(self, maxsize: int = PROFILE_CACHE_SIZE, ttl: float = PROFILE_CACHE_TTL):
+        self.ttl = ttl
+        self._cache: TTLCache[Profile] = TTLCache(maxsize)
+
+    async def get_many(self, db: AsyncSession, social_ids: Iterable[str]) -> Dict[str, Profile]:
+        """
+        여러 유저의 프로필 반환 (캐시에 없는 유저만 IN 쿼리 한 번으로 읽는다)
+        프로필이 없는 유저는 결과에서 빠진다
+        """
+        profiles: Dict[str, Profile] = {}
+        misses = set()
+        for social_id in set(social_ids):
+            profile = self._cache.get(social_id)
+            if profile is None:
+                misses.add(social_id)
+            else:
+                profiles[social_id] = profile
+        PROFILE_CACHE_REQUESTS.inc(len(profiles), result="hit")
+        PROFILE_CACHE_REQUESTS.inc(len(misses), result="miss")
+        if not misses:
+            return profiles
+
+        rows = (await db.execute(
+            select(
+                UserAbstractProfile.social_id,
+                UserAbstractProfile.dog_name,   # 피드홈에 등록한 닉네임
+                UserAbstractProfile.photo_path, # 피드홈에 등록한 프로필 이미지
+            )
+            .where(UserAbstractProfile.social_id.in_(misses))
+        )).all()
+        expires_at = self._cache.clock() + self.ttl
+        for row in rows:
+            profile = Profile(row.dog_name, row.photo_path)
+            self._cache.put(row.social_id, profile, expires_at)
+            profiles[row.social_id] = profile
+        return profiles
+
+    def invalidate(self, *social_ids: str) -> None:
+        """
+        프로필이 바뀐 유저를 캐시에서 제거 (프로필 수정 쪽에서 호출)
+        """
+        for social_id in social_ids:
+            self._cache.invalidate(social_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+profile_cache = ProfileCache()
+PROFILE_CACHE_ENTRIES.set_function(lambda: len(profile_cache))
+
+
+def invalidate_profiles(*social_ids: str) -> None:
+    """
+    프로필 변경 시 호출하는 무효화 훅
+    """
+    profile_cache.invalidate(*social_ids)
@@ -0,0 +1,66 @@
+"""
+목록 버전 관리 (조건부 GET 용)
+게시물/좋아요/알림을 쓰는 트랜잭션 안에서 영향받는 목록의 버전을 올리고,
+조회 API 는 목록 쿼리 전에 버전만 읽어서 ETag 를 비교한다
+"""
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.version import FeedVersion
+
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def upsert_insert(db: AsyncSession):
+    """
+    현재 DB 방언의 insert (on_conflict_do_update 용)
+    """
+    return _UPSERT_INSERTS[db.get_bind().dialect.name]
+
+
+def user_feed_scope(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+def hashtag_scope(hashtag: str) -> str:
+    return f"hashtag:{hashtag}"
+
+
+def inbox_scope(user_id: str) -> str:
+    return f"inbox:{user_id}"
+
+
+def post_scopes(user_id: str, hashtags: Iterable[str]) -> list:
+    """
+    게시물이 보이는 목록들 (작성자 피드 + 해시태그 피드)
+    """
+    return [user_feed_scope(user_id)] + [hashtag_scope(hashtag) for hashtag in hashtags or []]
+
+
+async def bump_versions(db: AsyncSession, scopes: Iterable[str]) -> None:
+    """
+    목록 버전 올리기 (없으면 1로 생성, 커밋은 호출하는 쪽 트랜잭션에서)
+    행 락 순서가 항상 같도록 정렬해서 한 문장으로 upsert
+    """
+    scopes = sorted(set(scopes))
+    if not scopes:
+        return
+    insert = upsert_insert(db)
+    statement = insert(FeedVersion).values([{'scope': scope, 'version': 1} for scope in scopes])
+    await db.execute(statement.on_conflict_do_update(
+        index_elements=[FeedVersion.scope],
+        set_={'version': FeedVersion.version + 1},
+    ))
+
+
+async def get_version(db: AsyncSession, scope: str) -> int:
+    """
+    목록 버전 조회 (한 번도 안 바뀐 목록은 0)
+    """
+    return await db.scalar(select(FeedVersion.version).where(FeedVersion.scope == scope)) or 0
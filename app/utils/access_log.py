@@ -0,0 +1,160 @@
+"""
+응답 본문을 버퍼링하지 않는 접근 로그 미들웨어
+"""
+import logging
+import os
+import random
+import time
+import uuid
+from typing import Dict, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette_context import context
+
+from app.database.query_stats import QueryStats, track_queries
+from app.utils.metrics import Gauge, Histogram
+
+logger = logging.getLogger("app.access")
+
+UNMATCHED_ROUTE = "<unmatched>"  # 404 경로가 그대로 라벨이 되지 않도록
+
+REQUEST_DURATION = Histogram(
+    "feed_http_request_duration_seconds", "요청 처리 시간 (응답 본문 전송 완료까지)", ("method", "route", "status"),
+)
+REQUESTS_IN_FLIGHT = Gauge("feed_http_requests_in_flight", "처리 중인 요청 수")
+REQUEST_DB_TIME = Histogram(
+    "feed_http_request_db_seconds", "요청 하나가 DB 쿼리에 쓴 시간", ("method", "route"),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "feed_http_request_db_queries", "요청 하나가 실행한 쿼리 수", ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+
+
+def parse_sample_rates(raw: Optional[str]) -> Dict[str, float]:
+    """
+    "GET /feed/posts=0.01,/feed/metrics=0" -> {"GET /feed/posts": 0.01, "/feed/metrics": 0.0}
+    키는 "메서드 경로 템플릿" 또는 "경로 템플릿"
+    """
+    rates: Dict[str, float] = {}
+    for item in (raw or "").split(","):
+        if not item.strip():
+            continue
+        key, _, rate = item.rpartition("=")
+        rates[key.strip()] = float(rate)
+    return rates
+
+
+class AccessLogMiddleware:
+    """
+    응답은 그대로 흘려보내면서 지연 시간, 상태 코드, 바이트 수, 쿼리 수, DB 시간을 로그와 메트릭에 기록한다
+    본문은 샘플링된 요청만, 앞부분 body_max_bytes 까지만 남긴다
+    query_headers 면 응답에 X-DB-Query-Count / Server-Timing(db) 헤더도 붙인다
+    (헤더는 응답 시작 시점까지의 값, 로그는 스트리밍이 끝난 뒤의 값)
+    """
+    def __init__(self, app: ASGIApp, body_max_bytes: Optional[int] = None,
+                 sample_rate: Optional[float] = None,
+                 route_sample_rates: Optional[Dict[str, float]] = None,
+                 query_headers: Optional[bool] = None):
+        self.app = app
+        self.query_headers = (query_headers if query_headers is not None
+                              else os.getenv("QUERY_STATS_HEADERS", "false").lower()
+                              in ("1", "true", "yes", "on"))
+        self.body_max_bytes = (body_max_bytes if body_max_bytes is not None
+                               else int(os.getenv("LOG_BODY_MAX_BYTES", "1024")))
+        self.sample_rate = (sample_rate if sample_rate is not None
+                            else float(os.getenv("LOG_BODY_SAMPLE_RATE", "1.0")))
+        self.route_sample_rates = (route_sample_rates if route_sample_rates is not None
+                                   else parse_sample_rates(os.getenv("LOG_BODY_SAMPLE_RATES")))
+
+    def body_sample_rate(self, method: str, route: str) -> float:
+        """
+        라우트별 본문 로깅 비율 ("메서드 경로" > "경로" > 기본값 순서)
+        """
+        rate = self.route_sample_rates.get(f"{method} {route}")
+        if rate is None:
+            rate = self.route_sample_rates.get(route, self.sample_rate)
+        return rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        state = {"status": 500, "bytes": 0, "capture": False}
+        body = bytearray()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                if self.query_headers:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-DB-Query-Count", str(stats.count))
+                    headers.append("Server-Timing", f"db;dur={stats.milliseconds}")
+                # 라우팅이 끝난 뒤라 scope 에 매칭된 라우트가 들어있다
+                rate = self.body_sample_rate(scope["method"], route_template(scope))
+                state["capture"] = self.body_max_bytes > 0 and rate > 0 and random.random() < rate
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                state["bytes"] += len(chunk)
+                if state["capture"] and len(body) < self.body_max_bytes:
+                    body.extend(chunk[:self.body_max_bytes - len(body)])
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                REQUESTS_IN_FLIGHT.dec()
+                elapsed = time.perf_counter() - started
+                observe_request(scope, state["status"], elapsed, stats)
+                self._log(scope, state, body, elapsed, stats)
+
+    def _log(self, scope: Scope, state: dict, body: bytearray, elapsed: float,
+             stats: QueryStats) -> None:
+        log_uuid = str(uuid.uuid1())[:8]
+        path = scope["path"]
+        if scope.get("query_string"):
+            path += f"?{scope['query_string'].decode()}"
+        fields = {
+            "log_id": log_uuid,
+            "method": scope["method"],
+            "path": path,
+            "route": route_template(scope),
+            "status": state["status"],
+            "latency_ms": round(elapsed * 1000, 2),
+            "bytes": state["bytes"],
+            "db_queries": stats.count,
+            "db_time_ms": stats.milliseconds,
+        }
+        logger.info("Log ID : %s - %s %s %s %.2fms %dB %d queries %.2fms db",
+                    log_uuid, fields["method"], path, fields["status"], fields["latency_ms"],
+                    fields["bytes"], fields["db_queries"], fields["db_time_ms"], extra=fields)
+        if context.exists() and "request_body" in context:
+            logger.info("Log ID : %s - Request Body : %s", log_uuid, context["request_body"])
+        if state["capture"]:
+            truncated = "..." if state["bytes"] > len(body) else ""
+            logger.info("Log ID : %s - Response Body : %s%s", log_uuid, bytes(body), truncated)
+
+
+def observe_request(scope: Scope, status: int, elapsed: float, stats: QueryStats) -> None:
+    """
+    요청 메트릭 기록 (라벨 조합이 처음 나올 때만 락을 잡는다)
+    """
+    method = scope["method"]
+    route = route_template(scope) if scope.get("route") is not None else UNMATCHED_ROUTE
+    REQUEST_DURATION.observe(elapsed, method=method, route=route, status=str(status))
+    REQUEST_DB_TIME.observe(stats.seconds, method=method, route=route)
+    REQUEST_DB_QUERIES.observe(stats.count, method=method, route=route)
+
+
+def route_template(scope: Scope) -> str:
+    """
+    매칭된 라우트의 경로 템플릿 (/feed/posts/{post_id}), 없으면 실제 경로
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or scope["path"]
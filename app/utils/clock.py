@@ -0,0 +1,11 @@
+"""
+시각 유틸
+"""
+from datetime import datetime, UTC
+
+
+def utcnow() -> datetime:
+    """
+    tzinfo 없는 UTC 현재 시각 (DateTime 컬럼과 비교/저장용, DB 서버 시간대와 무관)
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
@@ -0,0 +1,36 @@
+"""
+ETag / If-None-Match 처리
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(scope: str, version: int, *params) -> str:
+    """
+    목록 버전 + 쿼리 파라미터로 weak ETag 생성
+    """
+    digest = hashlib.sha1(repr((scope, params)).encode()).hexdigest()[:16]
+    return f'W/"{digest}-{version}"'
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # 비교는 weak 비교 (W/ 접두어 무시)
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    If-None-Match 가 맞으면 304 응답, 아니면 응답에 ETag 를 달고 None
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
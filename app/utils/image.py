@@ -1,30 +1,86 @@
 """
 이미지 처리와 관련된 유틸 함수
 """
+import asyncio
 import base64
+import contextlib
 import io
+import logging
 import os
+import time
 import uuid
-import boto3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List
+
 from fastapi import HTTPException
-from dotenv import load_dotenv
-load_dotenv()
+
+from app.utils.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+S3_REQUEST_DURATION = Histogram(
+    "feed_s3_request_duration_seconds", "S3 요청 소요 시간", ("operation", "outcome"),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+BUCKET_NAME = 'balm-bucket'
+S3_UPLOAD_WORKERS = int(os.getenv("S3_UPLOAD_WORKERS", "4"))
 
 def create_s3_client():
-    """S3 클라이언트 생성"""
+    """S3 클라이언트 생성 (boto3 는 import 가 무거워서 처음 만들 때 불러온다)"""
+    import boto3  # pylint: disable=import-outside-toplevel
+    from botocore.config import Config  # pylint: disable=import-outside-toplevel
+
     return boto3.client(
         's3',
         aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
         aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name='ap-northeast-2'
+        region_name='ap-northeast-2',
+        # 동시 업로드 수만큼은 커넥션을 재사용할 수 있도록
+        config=Config(max_pool_connections=max(10, S3_UPLOAD_WORKERS)),
     )
 
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """
+    프로세스 전체에서 같이 쓰는 S3 클라이언트 (boto3 클라이언트는 스레드 안전)
+    """
+    return create_s3_client()
+
+@lru_cache(maxsize=1)
+def _upload_executor() -> ThreadPoolExecutor:
+    """
+    S3 업로드 전용 스레드풀 (동시 업로드 수 제한)
+    """
+    return ThreadPoolExecutor(max_workers=S3_UPLOAD_WORKERS, thread_name_prefix="s3-upload")
+
+@contextlib.contextmanager
+def s3_timer(operation: str):
+    """
+    with 구간의 S3 요청 시간을 operation(upload/upload_part/delete ...) 과 성공 여부별로 기록
+    """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        S3_REQUEST_DURATION.observe(time.perf_counter() - started,
+                                    operation=operation, outcome=outcome)
+
+def key_from_url(image_url: str) -> str:
+    """
+    S3 URL 에서 오브젝트 키 추출
+    """
+    return image_url.split('.com/')[-1]
+
 def upload_image_to_s3(base64_string: str, s3_client) -> str:
     """
     Base64 이미지를 S3에 업로드하고 URL 반환
     """
     try:
-        bucket_name = 'balm-bucket'
+        bucket_name = BUCKET_NAME
 
         # base64 디코딩
         if 'base64,' in base64_string:
@@ -35,16 +91,64 @@ def upload_image_to_s3(base64_string: str, s3_client) -> str:
         # S3에 업로드
         file_id = str(uuid.uuid4())
         key = f"images/feed/{file_id}.jpg"
-        s3_client.upload_fileobj(
-            io.BytesIO(image_bytes),
-            bucket_name,
-            key,
-            ExtraArgs={
-                'ContentType': 'image/jpeg',
-                'CacheControl': 'max-age=31536000'
-            }
-        )
+        with s3_timer("upload"):
+            s3_client.upload_fileobj(
+                io.BytesIO(image_bytes),
+                bucket_name,
+                key,
+                ExtraArgs={
+                    'ContentType': 'image/jpeg',
+                    'CacheControl': 'max-age=31536000'
+                }
+            )
         return f"https://{bucket_name}.s3.ap-northeast-2.amazonaws.com/{key}"
-    
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to upload image: {str(e)}") from e
+
+def delete_images_from_s3(image_urls: List[str], s3_client) -> None:
+    """
+    S3 이미지 삭제 (delete_objects 한 번에 최대 1000개)
+    """
+    keys = [key_from_url(image_url) for image_url in image_urls]
+    for start in range(0, len(keys), 1000):
+        with s3_timer("delete"):
+            s3_client.delete_objects(
+                Bucket=BUCKET_NAME,
+                Delete={'Objects': [{'Key': key} for key in keys[start:start + 1000]],
+                        'Quiet': True}
+            )
+
+async def cleanup_uploaded_images(image_urls: List[str]) -> None:
+    """
+    실패한 요청에서 이미 올라간 이미지 정리 (정리 실패는 원래 에러를 가리지 않도록 로그만)
+    """
+    if not image_urls:
+        return
+    try:
+        await asyncio.get_running_loop().run_in_executor(
+            _upload_executor(), delete_images_from_s3, image_urls, get_s3_client()
+        )
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception("Failed to clean up uploaded images: %s", image_urls)
+
+async def upload_images_to_s3(base64_images: List[str]) -> List[str]:
+    """
+    여러 이미지를 스레드풀에서 동시에 업로드하고 순서대로 URL 반환
+    하나라도 실패하면 이미 올라간 이미지는 지우고 첫 번째 에러를 그대로 올린다
+    """
+    if not base64_images:
+        return []
+    loop = asyncio.get_running_loop()
+    s3_client = get_s3_client()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(_upload_executor(), upload_image_to_s3, image, s3_client)
+          for image in base64_images),
+        return_exceptions=True,
+    )
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        uploaded = [result for result in results if isinstance(result, str)]
+        await cleanup_uploaded_images(uploaded)
+        raise failures[0]
+    return results
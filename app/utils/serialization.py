@@ -0,0 +1,34 @@
+"""
+신뢰할 수 있는 (서버가 DB 에서 직접 만든) 응답의 빠른 직렬화
+pydantic 검증(.construct())과 response_model 재검증을 건너뛰고 orjson 으로 바로 인코딩한다
+"""
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(value: Any) -> Any:
+    # pydantic v1 모델은 필드 값만 __dict__ 에 들고 있다 (중첩 모델도 orjson 이 재귀로 처리)
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class TrustedJSONResponse(ORJSONResponse):
+    """
+    pydantic 모델(.construct() 로 만든 것 포함)을 .dict() 변환 없이 바로 orjson 으로 인코딩하는 응답
+    """
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def trusted_response(content: Any, response: Optional[Response] = None) -> TrustedJSONResponse:
+    """
+    라우터에서 서비스 결과를 그대로 돌려줄 때 사용 (FastAPI 의 response_model 검증/인코딩을 건너뛴다)
+    response 에 미리 달아 둔 헤더(ETag 등)는 옮겨 준다
+    """
+    headers = dict(response.headers) if response is not None else None
+    return TrustedJSONResponse(content, headers=headers)
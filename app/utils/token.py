@@ -1,28 +1,69 @@
 """
 토큰 관련 util 함수
 """
+import hashlib
 import os
+import time
 from datetime import datetime, UTC, timedelta
+from typing import Dict
 
 import jwt
-from fastapi import HTTPException, Depends
+from fastapi import HTTPException, Request
 from fastapi_jwt_auth import AuthJWT
+from fastapi_jwt_auth.exceptions import AuthJWTException
 
+from app.utils.cache import TTLCache
+from app.utils.metrics import Counter
 
-def get_social_id(token: AuthJWT = Depends()) -> str:
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+# 캐시에서 꺼낸 토큰은 denylist 를 다시 보지 않으므로, 폐기된 토큰이 통과할 수 있는 시간의 상한
+TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
+
+TOKEN_CACHE_REQUESTS = Counter(
+    "feed_token_cache_requests_total", "검증된 토큰 캐시 조회 수", ("result",)
+)
+
+# 서명 검증이 끝난 토큰의 claims 를 exp 와 TOKEN_CACHE_TTL 중 이른 시각까지 보관 (키는 헤더 해시)
+verified_tokens: TTLCache[Dict] = TTLCache(TOKEN_CACHE_SIZE, clock=time.time)
+
+
+def _verify_access_token(auth: AuthJWT) -> Dict:
+    """
+    서명/만료/토큰 종류/denylist 를 검증하고 claims 반환
     """
-    토큰 까서 소셜 id 가져오기
+    auth.jwt_required()
+    return auth.get_raw_jwt()
+
+
+async def current_user(request: Request) -> str:
+    """
+    요청당 한 번만 토큰을 검증해서 소셜 id 반환하는 dependency
+    최근에 검증한 토큰은 캐시에서 바로 꺼내 서명 검증을 건너뛴다
     """
-    try:
-        token.jwt_required()
-        claims = token.get_raw_jwt()
-        social_id = claims.get("social_id")
-        if social_id is None:
-            raise HTTPException(status_code=401, detail="Missing social_id")
-        return social_id
-    except Exception as exc:
-        print(exc)
-        raise HTTPException(status_code=401, detail="Invalid authentication credentials") from exc
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        raise HTTPException(status_code=401, detail="Missing Authorization Header")
+
+    key = hashlib.sha256(authorization.encode()).digest()
+    claims = verified_tokens.get(key)
+    if claims is None:
+        TOKEN_CACHE_REQUESTS.inc(result="miss")
+        try:
+            claims = _verify_access_token(AuthJWT(req=request))
+        except AuthJWTException as exc:
+            raise HTTPException(
+                status_code=401, detail="Invalid authentication credentials"
+            ) from exc
+        if isinstance(claims.get("exp"), (int, float)):  # exp 없는 토큰은 캐시하지 않는다
+            expires_at = min(claims["exp"], verified_tokens.clock() + TOKEN_CACHE_TTL)
+            verified_tokens.put(key, claims, expires_at)
+    else:
+        TOKEN_CACHE_REQUESTS.inc(result="hit")
+
+    social_id = claims.get("social_id")
+    if social_id is None:
+        raise HTTPException(status_code=401, detail="Missing social_id")
+    return social_id
 
 
 def create_jwt_access_token(user_id: str) -> str:
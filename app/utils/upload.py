@@ -0,0 +1,288 @@
+"""
+multipart/form-data 게시물 업로드를 버퍼링 없이 S3 로 흘려보내는 유틸
+"""
+import logging
+import os
+import uuid
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+
+from app.utils.image import BUCKET_NAME, cleanup_uploaded_images, s3_timer
+
+logger = logging.getLogger(__name__)
+
+MAX_IMAGE_BYTES = int(os.getenv("MAX_IMAGE_BYTES", str(10 * 1024 * 1024)))
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(50 * 1024 * 1024)))
+MAX_IMAGES_PER_POST = int(os.getenv("MAX_IMAGES_PER_POST", "10"))
+MAX_CONTENT_BYTES = 64 * 1024  # 본문 텍스트 필드 최대 크기
+S3_PART_SIZE = 5 * 1024 * 1024  # S3 multipart 최소 파트 크기
+
+IMAGE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+    "image/gif": "gif",
+}  # 받는 이미지 타입 허용 목록 (image/svg+xml 처럼 스크립트를 담을 수 있는 타입은 거부)
+
+
+class S3StreamingUpload:
+    """
+    청크를 받아 S3 multipart upload 로 올린다 (메모리에는 파트 하나 크기까지만 보관)
+    파트 하나 크기를 넘지 않는 작은 파일은 put_object 한 번으로 올린다
+    """
+    def __init__(self, s3_client, content_type: str, part_size: int = S3_PART_SIZE):
+        self.s3_client = s3_client
+        self.content_type = content_type
+        self.part_size = part_size
+        extension = IMAGE_EXTENSIONS.get(content_type, 'jpg')
+        self.key = f"images/feed/{uuid.uuid4()}.{extension}"
+        self.size = 0
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: List[Dict] = []
+
+    @property
+    def url(self) -> str:
+        return f"https://{BUCKET_NAME}.s3.ap-northeast-2.amazonaws.com/{self.key}"
+
+    async def write(self, data: bytes) -> None:
+        self.size += len(data)
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[:self.part_size])
+            del self._buffer[:self.part_size]
+            await self._upload_part(part)
+
+    async def _upload_part(self, body: bytes) -> None:
+        if self._upload_id is None:
+            response = await run_in_threadpool(
+                self.s3_client.create_multipart_upload,
+                Bucket=BUCKET_NAME, Key=self.key, ContentType=self.content_type,
+                CacheControl='max-age=31536000',
+            )
+            self._upload_id = response["UploadId"]
+        part_number = len(self._parts) + 1
+        with s3_timer("upload_part"):
+            response = await run_in_threadpool(
+                self.s3_client.upload_part,
+                Bucket=BUCKET_NAME, Key=self.key, UploadId=self._upload_id,
+                PartNumber=part_number, Body=body,
+            )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    async def complete(self) -> str:
+        if self._upload_id is None:
+            with s3_timer("upload"):
+                await run_in_threadpool(
+                    self.s3_client.put_object,
+                    Bucket=BUCKET_NAME, Key=self.key, Body=bytes(self._buffer),
+                    ContentType=self.content_type, CacheControl='max-age=31536000',
+                )
+        else:
+            if self._buffer:
+                await self._upload_part(bytes(self._buffer))
+            with s3_timer("complete_upload"):
+                await run_in_threadpool(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=BUCKET_NAME, Key=self.key, UploadId=self._upload_id,
+                    MultipartUpload={"Parts": self._parts},
+                )
+        self._buffer.clear()
+        return self.url
+
+    async def abort(self) -> None:
+        self._buffer.clear()
+        if self._upload_id is not None:
+            await run_in_threadpool(
+                self.s3_client.abort_multipart_upload,
+                Bucket=BUCKET_NAME, Key=self.key, UploadId=self._upload_id,
+            )
+            self._upload_id = None
+
+
+class _Part:
+    """
+    파싱 중인 multipart 파트 하나
+    """
+    def __init__(self, headers: Dict[bytes, bytes]):
+        _, options = parse_options_header(headers.get(b"content-disposition", b""))
+        self.name = options.get(b"name", b"").decode()
+        self.filename = options.get(b"filename")
+        content_type, _ = parse_options_header(
+            headers.get(b"content-type", b"application/octet-stream")
+        )
+        self.content_type = content_type.decode().lower()
+        self.upload: Optional[S3StreamingUpload] = None
+        self.text = bytearray()
+
+
+def _form_boundary(content_type: str) -> bytes:
+    """
+    Content-Type 헤더에서 multipart/form-data boundary 를 꺼낸다
+    """
+    mimetype, options = parse_options_header(content_type)
+    boundary = options.get(b"boundary")
+    if mimetype != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=415, detail="multipart/form-data required")
+    return boundary
+
+
+class _MultipartReader:
+    """
+    multipart 파서의 동기 콜백을 (종류, 값) 이벤트로 모아 청크마다 돌려준다
+    - begin: 파트 헤더 dict
+    - data: 파트 본문 조각
+    - end: 파트 끝
+    """
+    def __init__(self, boundary: bytes):
+        self._events: List[Tuple[str, object]] = []
+        self._field = bytearray()
+        self._value = bytearray()
+        self._headers: Dict[bytes, bytes] = {}
+        self._parser = MultipartParser(boundary, callbacks={
+            "on_header_field": lambda data, start, end: self._field.extend(data[start:end]),
+            "on_header_value": lambda data, start, end: self._value.extend(data[start:end]),
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": lambda: self._events.append(("end", None)),
+        })
+
+    def _on_header_end(self):
+        self._headers[bytes(self._field).lower()] = bytes(self._value)
+        self._field.clear()
+        self._value.clear()
+
+    def _on_headers_finished(self):
+        self._events.append(("begin", self._headers))
+        self._headers = {}
+
+    def _on_part_data(self, data, start, end):
+        self._events.append(("data", bytes(data[start:end])))
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, object]]:
+        """
+        청크 하나를 파싱하고 그 사이 생긴 이벤트를 돌려준다
+        """
+        try:
+            self._parser.write(chunk)
+        except MultipartParseError as e:
+            raise HTTPException(status_code=400, detail="Malformed multipart body") from e
+        events, self._events = self._events, []
+        return events
+
+    def finalize(self) -> None:
+        """
+        본문이 끝났음을 파서에 알린다
+        """
+        self._parser.finalize()
+
+
+def _validate_image_part(part: _Part, image_count: int) -> None:
+    """
+    파일 파트는 images 필드의 허용된 이미지 타입만, 게시물당 MAX_IMAGES_PER_POST 개까지 받는다
+    """
+    if part.name != "images" or part.content_type not in IMAGE_EXTENSIONS:
+        raise HTTPException(status_code=415, detail="Only image files are allowed")
+    if image_count >= MAX_IMAGES_PER_POST:
+        raise HTTPException(status_code=413, detail="Too many images")
+
+
+class _PostFormUpload:
+    """
+    파트 이벤트를 받아 본문 텍스트는 모으고 이미지는 S3 로 흘려보낸다
+    """
+    def __init__(self, s3_client, part_size: int):
+        self.s3_client = s3_client
+        self.part_size = part_size
+        self.content: Optional[str] = None
+        self.urls: List[str] = []
+        self._part: Optional[_Part] = None
+
+    async def handle(self, kind: str, payload) -> None:
+        """
+        _MultipartReader 이벤트 하나를 처리한다
+        """
+        if kind == "begin":
+            self._begin(payload)
+        elif kind == "data":
+            await self._write(payload)
+        elif kind == "end":
+            await self._end()
+
+    def _begin(self, headers: Dict[bytes, bytes]) -> None:
+        part = _Part(headers)
+        if part.filename is not None:
+            _validate_image_part(part, len(self.urls))
+            part.upload = S3StreamingUpload(self.s3_client, part.content_type, self.part_size)
+        self._part = part
+
+    async def _write(self, data: bytes) -> None:
+        part = self._part
+        if part.upload is not None:
+            if part.upload.size + len(data) > MAX_IMAGE_BYTES:
+                raise HTTPException(status_code=413, detail="Image too large")
+            await part.upload.write(data)
+        else:
+            part.text.extend(data)
+            if len(part.text) > MAX_CONTENT_BYTES:
+                raise HTTPException(status_code=413, detail="Field too large")
+
+    async def _end(self) -> None:
+        part = self._part
+        if part.upload is not None:
+            self.urls.append(await part.upload.complete())
+        elif part.name == "content":
+            self.content = part.text.decode()
+        self._part = None
+
+    def finish(self) -> None:
+        """
+        본문이 파트 중간에 끝났으면 400
+        """
+        if self._part is not None:
+            raise HTTPException(status_code=400, detail="Incomplete multipart body")
+
+    async def cleanup(self) -> None:
+        """
+        올리던 multipart upload 를 중단하고 이미 올린 이미지를 지운다
+        """
+        part = self._part
+        if part is not None and part.upload is not None:
+            try:
+                await part.upload.abort()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Failed to abort multipart upload: %s", part.upload.key)
+        await cleanup_uploaded_images(self.urls)
+
+
+async def stream_post_form(content_type: str, chunks: AsyncIterator[bytes], s3_client,
+                           part_size: int = S3_PART_SIZE) -> Tuple[Optional[str], List[str]]:
+    """
+    multipart/form-data 요청 본문을 읽으면서 이미지 파트는 바로 S3 로 올린다
+    - content: 게시물 본문 텍스트 필드
+    - images: 이미지 파일 파트 (여러 개)
+    용량 제한은 읽는 도중에 검사하고, 실패하면 올리던/올린 이미지를 모두 정리한다
+    :return: (content, S3 URL 리스트)
+    """
+    reader = _MultipartReader(_form_boundary(content_type))
+    form = _PostFormUpload(s3_client, part_size)
+    total = 0
+    try:
+        async for chunk in chunks:
+            total += len(chunk)
+            if total > MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail="Request body too large")
+            # 파서 콜백은 동기라 이벤트를 모아뒀다가 여기서 비동기로 처리
+            for kind, payload in reader.feed(chunk):
+                await form.handle(kind, payload)
+        reader.finalize()
+        form.finish()
+    except BaseException:
+        await form.cleanup()
+        raise
+    return form.content, form.urls
@@ -0,0 +1,119 @@
+"""
+피드 이미지 리사이즈/WebP 변환본 생성
+원본 images/feed/{uuid}.jpg 옆에 images/feed/{uuid}_{name}.webp 로 저장한다
+"""
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.utils.image import BUCKET_NAME, get_s3_client, key_from_url, s3_timer
+
+logger = logging.getLogger(__name__)
+
+# 변환본 이름 -> 최대 가로 길이(px)
+VARIANT_WIDTHS = {
+    "thumb": 320,
+    "medium": 1080,
+}
+VARIANT_FORMAT = "webp"
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", "2"))
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+class UnsupportedImage(ValueError):
+    """
+    Pillow 가 읽을 수 없는 이미지 (다시 시도해도 소용없다)
+    """
+
+
+def variant_key(key: str, name: str) -> str:
+    """
+    images/feed/{uuid}.jpg -> images/feed/{uuid}_{name}.webp
+    """
+    stem = key.rsplit(".", 1)[0]
+    return f"{stem}_{name}.{VARIANT_FORMAT}"
+
+
+def variant_urls(image_url: str) -> Dict[str, str]:
+    """
+    원본 이미지 URL 로 변환본 URL 계산 (실제로 만들어졌는지는 posts.image_variants 로 확인)
+    """
+    prefix = image_url[:len(image_url) - len(key_from_url(image_url))]
+    return {name: prefix + variant_key(key_from_url(image_url), name) for name in VARIANT_WIDTHS}
+
+
+def render_variants(image_bytes: bytes) -> Dict[str, bytes]:
+    """
+    원본 이미지로 변환본 생성 (CPU 작업이라 프로세스 풀에서 실행, Pillow 는 여기서만 불러온다)
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError  # pylint: disable=import-outside-toplevel
+
+    try:
+        original = Image.open(io.BytesIO(image_bytes))
+    except (UnidentifiedImageError, Image.DecompressionBombError) as e:
+        raise UnsupportedImage(str(e)) from None
+    with original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        rendered = {}
+        for name, width in VARIANT_WIDTHS.items():
+            variant = image.copy()
+            variant.thumbnail((width, width * 4))  # 가로 기준 축소, 원본보다 키우지는 않는다
+            buffer = io.BytesIO()
+            variant.save(buffer, format=VARIANT_FORMAT, quality=80, method=4)
+            rendered[name] = buffer.getvalue()
+        return rendered
+
+
+def _executor_instance() -> ProcessPoolExecutor:
+    global _executor  # pylint: disable=global-statement
+    if _executor is None:
+        # 이벤트 루프와 스레드풀이 돌고 있는 프로세스를 fork 하지 않도록 spawn 으로 새로 띄운다
+        _executor = ProcessPoolExecutor(max_workers=IMAGE_VARIANT_WORKERS,
+                                        mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+def _download(key: str) -> bytes:
+    with s3_timer("download"):
+        return get_s3_client().get_object(Bucket=BUCKET_NAME, Key=key)["Body"].read()
+
+
+def _upload(key: str, body: bytes) -> None:
+    with s3_timer("upload_variant"):
+        get_s3_client().put_object(
+            Bucket=BUCKET_NAME, Key=key, Body=body,
+            ContentType=f"image/{VARIANT_FORMAT}", CacheControl='max-age=31536000',
+        )
+
+
+async def generate_variants(image_url: str) -> Dict[str, str]:
+    """
+    S3 원본을 내려받아 변환본을 만들고 같은 폴더에 올린다
+    변환할 수 없는 이미지면 UnsupportedImage
+    """
+    key = key_from_url(image_url)
+    original = await run_in_threadpool(_download, key)
+    loop = asyncio.get_running_loop()
+    rendered = await loop.run_in_executor(_executor_instance(), render_variants, original)
+    for name, body in rendered.items():
+        await run_in_threadpool(_upload, variant_key(key, name), body)
+    return variant_urls(image_url)
+
+
+async def shutdown() -> None:
+    """
+    프로세스 풀 종료 (끝내지 못한 작업은 image_variant_jobs 에 남아 다음에 다시 처리된다)
+    """
+    global _executor  # pylint: disable=global-statement
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
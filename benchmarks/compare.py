@@ -0,0 +1,45 @@
+"""
+benchmarks.load 결과 JSON 두 개 비교
+
+    python -m benchmarks.compare benchmarks/results/<before>.json benchmarks/results/<after>.json
+"""
+import argparse
+import json
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "rps")
+
+
+def _change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare(before: dict, after: dict) -> list:
+    """
+    라우트별 (route, metric, before, after, 변화율) 목록
+    """
+    rows = []
+    for route in sorted(set(before["routes"]) | set(after["routes"])):
+        old, new = before["routes"].get(route), after["routes"].get(route)
+        if old is None or new is None:
+            rows.append((route, "-", old and "present", new and "present", "added" if old is None else "removed"))
+            continue
+        for metric in METRICS:
+            rows.append((route, metric, old[metric], new[metric], _change(old[metric], new[metric])))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    with open(args.before, encoding="utf-8") as file:
+        before_result = json.load(file)
+    with open(args.after, encoding="utf-8") as file:
+        after_result = json.load(file)
+    print(f"before={before_result['meta'].get('commit')} after={after_result['meta'].get('commit')}")
+    for row in compare(before_result, after_result):
+        print(f"{row[0]:<42} {row[1]:>7} {str(row[2]):>10} {str(row[3]):>10} {row[4]:>8}")
@@ -0,0 +1,109 @@
+"""
+동시 요청 수에 따른 처리량 측정 (비동기 DB 경로가 이벤트 루프를 막지 않는지 확인용)
+
+    python -m benchmarks.concurrency [--db-latency-ms 5] [--requests 400]
+
+로컬 SQLite 파일 DB 를 쓰고, 실제 DB 네트워크 왕복을 흉내 내기 위해 쿼리마다 지연을 넣는다.
+이벤트 루프가 막히지 않으면 동시 요청 수(커넥션 풀 크기까지)에 비례해서 처리량이 늘어난다.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+async def _seed(session_factory, posts: int, likers: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from datetime import datetime, timedelta
+    from app.models.post import Post, Like, User, UserAbstractProfile
+
+    async with session_factory() as db:
+        for idx in range(likers + 1):
+            db.add(User(name=f"user_{idx}", social_id=f"user_{idx}"))
+            db.add(UserAbstractProfile(social_id=f"user_{idx}", dog_name=f"dog_{idx}",
+                                       photo_path="https://img.com/p.jpg"))
+        for idx in range(posts):
+            post = Post(user_id="user_0", content=f"#bench {idx}", image_urls=["https://img.com/a.jpg"],
+                        hashtags=["bench"], uploaded_at=datetime(2024, 1, 1) + timedelta(minutes=idx),
+                        like_count=likers)
+            db.add(post)
+            await db.flush()
+            for liker in range(1, likers + 1):
+                db.add(Like(post_id=post.id, user_id=f"user_{liker}"))
+        await db.commit()
+
+
+def _add_db_latency(latency: float) -> None:
+    """
+    aiosqlite 의 모든 DB 호출 앞에 비동기 지연을 넣는다 (원격 DB 왕복 시간 흉내)
+    """
+    # pylint: disable=import-outside-toplevel,protected-access
+    import aiosqlite.core
+
+    original = aiosqlite.core.Connection._execute
+
+    async def _execute(self, fn, *args, **kwargs):
+        await asyncio.sleep(latency)
+        return await original(self, fn, *args, **kwargs)
+
+    aiosqlite.core.Connection._execute = _execute
+
+
+async def _run_level(client, path: str, headers, concurrency: int, total: int) -> float:
+    queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            response = await client.get(path, headers=headers)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return total / (time.perf_counter() - started)
+
+
+async def main(args) -> None:
+    # pylint: disable=import-outside-toplevel
+    import httpx
+    from app.database import db
+    from app.main import app
+    from app.utils.token import create_jwt_access_token
+
+    session_factory = db.session_factory()
+    async with db.engine.begin() as conn:
+        await conn.run_sync(db.Base.metadata.create_all)
+    await _seed(session_factory, args.posts, args.likers)
+    _add_db_latency(args.db_latency_ms / 1000)
+
+    headers = {"Authorization": f"Bearer {create_jwt_access_token('user_0')}"}
+    path = f"/feed/posts?user_id=user_0&limit={args.limit}"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await _run_level(client, path, headers, 1, 5)  # 워밍업
+        print(f"GET {path} (db latency {args.db_latency_ms}ms per call)")
+        print(f"{'in-flight':>10} {'req/s':>10}")
+        for concurrency in args.concurrency:
+            rps = await _run_level(client, path, headers, concurrency, args.requests)
+            print(f"{concurrency:>10} {rps:>10.1f}")
+    await db.dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="동시 요청 수별 처리량 측정")
+    parser.add_argument("--db-latency-ms", type=float, default=5.0)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--likers", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    arguments = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="feed-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.setdefault("JWT_SECRET_KEY", "test_token")
+    os.environ.setdefault("JWT_EXPIRATION_DELTA", "60")
+    asyncio.run(main(arguments))
@@ -0,0 +1,220 @@
+"""
+벤치마크용 합성 데이터 생성 (시드 고정이라 같은 옵션이면 항상 같은 데이터)
+
+    python -m benchmarks.datagen --database-url sqlite:///bench.db [--users 2000] [--posts 10000] [--seed 42]
+
+쏠림(skew)은 Zipf 비슷한 가중치로 흉내 낸다.
+- 게시물 작성: 소수의 헤비 업로더가 대부분의 글을 쓴다 (--author-skew)
+- 좋아요: 소수의 바이럴 게시물에 좋아요가 몰리고 (--like-skew), 소수의 헤비 유저가 좋아요를 많이 누른다 (--liker-skew)
+- 해시태그: 몇 개의 인기 태그와 긴 꼬리 (--hashtag-skew)
+"""
+import argparse
+import asyncio
+import itertools
+import random
+from bisect import bisect
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+BASE_TIME = datetime(2024, 1, 1)
+BATCH_SIZE = 5000
+
+
+class DatasetSpec(NamedTuple):
+    """
+    생성할 데이터 규모와 쏠림 정도 (skew 는 Zipf 지수, 0 이면 균등)
+    """
+    users: int = 1000
+    posts: int = 5000
+    likes: int = 50000
+    hashtags: int = 500
+    seed: int = 42
+    author_skew: float = 1.1
+    like_skew: float = 1.2
+    liker_skew: float = 1.0
+    hashtag_skew: float = 1.1
+    read_ratio: float = 0.7          # 알림 중 읽음 비율
+    profile_ratio: float = 0.98      # 프로필이 있는 유저 비율
+
+
+class Dataset(NamedTuple):
+    """
+    생성 결과 요약 (드라이버가 요청 대상을 고를 때 사용)
+    """
+    spec: DatasetSpec
+    user_ids: List[str]
+    post_ids: List[int]
+    posts_by_author: Dict[str, List[int]]
+    hashtags: List[str]          # 인기순
+    like_counts: Dict[int, int]
+
+
+class _Zipf:
+    """
+    0..n-1 중 하나를 1/(rank+1)^s 가중치로 뽑는다
+    """
+    def __init__(self, n: int, s: float, rng: random.Random):
+        self.rng = rng
+        self.cumulative = list(itertools.accumulate(1.0 / (rank + 1) ** s for rank in range(n)))
+
+    def sample(self) -> int:
+        return bisect(self.cumulative, self.rng.random() * self.cumulative[-1])
+
+
+def _user_id(idx: int) -> str:
+    return f"bench_user_{idx}"
+
+
+async def _bulk_insert(db: AsyncSession, table, rows: List[dict]) -> None:
+    for start in range(0, len(rows), BATCH_SIZE):
+        await db.execute(insert(table), rows[start:start + BATCH_SIZE])
+
+
+async def _reset_sequences(db: AsyncSession, tables) -> None:
+    """
+    id 를 직접 넣었으므로 PostgreSQL 시퀀스를 최대 id 뒤로 옮긴다 (SQLite 는 필요 없음)
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    for table in tables:
+        name = table.__tablename__
+        await db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), COALESCE((SELECT MAX(id) FROM {name}), 1))"
+        ))
+
+
+async def generate(db: AsyncSession, spec: DatasetSpec = DatasetSpec()) -> Dataset:
+    """
+    유저, 프로필, 게시물(+해시태그 인덱스), 좋아요, 알림을 만들어 커밋
+    """
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    from app.models.notification import Notification
+    from app.models.post import Like, Post, PostHashtag, User, UserAbstractProfile
+
+    rng = random.Random(spec.seed)
+    user_ids = [_user_id(idx) for idx in range(spec.users)]
+    # 유저 순서를 섞어서 헤비 업로더와 헤비 좋아요 유저가 같은 사람이 되지 않도록
+    authors_by_rank = rng.sample(user_ids, len(user_ids))
+    likers_by_rank = rng.sample(user_ids, len(user_ids))
+    hashtags = [f"tag{idx}" for idx in range(spec.hashtags)]
+
+    await _bulk_insert(db, User, [{"id": idx + 1, "name": user_id, "social_id": user_id, "is_active": True}
+                                  for idx, user_id in enumerate(user_ids)])
+    await _bulk_insert(db, UserAbstractProfile, [
+        {"id": idx + 1, "social_id": user_id, "dog_name": f"dog_{idx}",
+         "photo_path": f"https://img.com/profile/{idx}.jpg"}
+        for idx, user_id in enumerate(user_ids) if rng.random() < spec.profile_ratio
+    ])
+
+    author_zipf = _Zipf(len(user_ids), spec.author_skew, rng)
+    hashtag_zipf = _Zipf(len(hashtags), spec.hashtag_skew, rng)
+    posts, post_hashtags = [], []
+    posts_by_author: Dict[str, List[int]] = {}
+    for post_id in range(1, spec.posts + 1):
+        author = authors_by_rank[author_zipf.sample()]
+        tags = list(dict.fromkeys(hashtags[hashtag_zipf.sample()] for _ in range(rng.randint(0, 3))))
+        uploaded_at = BASE_TIME + timedelta(seconds=post_id * 60 + rng.randint(0, 59))
+        posts.append({
+            "id": post_id, "user_id": author, "uploaded_at": uploaded_at,
+            "content": " ".join(f"#{tag}" for tag in tags) + f" 게시물 {post_id}",
+            "image_urls": [f"https://balm-bucket.s3.ap-northeast-2.amazonaws.com/images/feed/{post_id}-{i}.jpg"
+                           for i in range(rng.randint(1, 3))],
+            "hashtags": tags, "like_count": 0,
+        })
+        post_hashtags.extend({"hashtag": tag, "post_id": post_id, "uploaded_at": uploaded_at} for tag in tags)
+        posts_by_author.setdefault(author, []).append(post_id)
+
+    # 게시물도 섞어서 바이럴 게시물이 특정 시간대에 몰리지 않도록
+    posts_by_rank = rng.sample(range(1, spec.posts + 1), spec.posts)
+    post_zipf = _Zipf(spec.posts, spec.like_skew, rng)
+    liker_zipf = _Zipf(len(user_ids), spec.liker_skew, rng)
+    seen = set()
+    likes: List[dict] = []
+    notifications: Dict[int, dict] = {}
+    like_counts: Dict[int, int] = {}
+    attempts = 0
+    while len(likes) < spec.likes and attempts < spec.likes * 10:
+        attempts += 1
+        post_id = posts_by_rank[post_zipf.sample()]
+        liker = likers_by_rank[liker_zipf.sample()]
+        if (post_id, liker) in seen:
+            continue
+        seen.add((post_id, liker))
+        like_id = len(likes) + 1
+        likes.append({"id": like_id, "post_id": post_id, "user_id": liker})
+        like_counts[post_id] = like_counts.get(post_id, 0) + 1
+        post = posts[post_id - 1]
+        # 알림은 아웃박스 워커처럼 (작성자, 게시물) 당 한 행으로 합친다
+        is_read = rng.random() < spec.read_ratio
+        created_at = post["uploaded_at"] + timedelta(minutes=rng.randint(1, 60 * 24 * 7))
+        noti = notifications.get(post_id)
+        if noti is None:
+            noti = notifications[post_id] = {
+                "id": len(notifications) + 1, "user_id": post["user_id"], "post_id": post_id,
+                "is_read": True, "unread_count": 0, "created_at": created_at, "last_actor_id": liker,
+            }
+        if not is_read:
+            noti["is_read"] = False
+            noti["unread_count"] += 1
+        if created_at >= noti["created_at"]:
+            noti["created_at"], noti["last_actor_id"] = created_at, liker
+    for post_id, count in like_counts.items():
+        posts[post_id - 1]["like_count"] = count
+
+    await _bulk_insert(db, Post, posts)
+    await _bulk_insert(db, PostHashtag, post_hashtags)
+    await _bulk_insert(db, Like, likes)
+    await _bulk_insert(db, Notification, list(notifications.values()))
+    await _reset_sequences(db, (User, UserAbstractProfile, Post, Like, Notification))
+    await db.commit()
+
+    tag_counts: Dict[str, int] = {}
+    for row in post_hashtags:
+        tag_counts[row["hashtag"]] = tag_counts.get(row["hashtag"], 0) + 1
+    return Dataset(
+        spec=spec,
+        user_ids=user_ids,
+        post_ids=[post["id"] for post in posts],
+        posts_by_author=posts_by_author,
+        hashtags=sorted(tag_counts, key=lambda tag: -tag_counts[tag]),
+        like_counts=like_counts,
+    )
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    DatasetSpec 필드를 CLI 옵션으로 (--users, --like-skew ...)
+    """
+    for name, default in DatasetSpec._field_defaults.items():  # pylint: disable=no-member
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(default), default=default)
+
+
+def spec_from_args(args) -> DatasetSpec:
+    return DatasetSpec(**{name: getattr(args, name) for name in DatasetSpec._fields})
+
+
+async def _main(args) -> None:
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from app.database.db import Base, to_async_url
+    from app import models  # pylint: disable=unused-import
+
+    engine = create_async_engine(to_async_url(args.database_url))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        dataset = await generate(db, spec_from_args(args))
+    await engine.dispose()
+    top = sorted(dataset.like_counts.values(), reverse=True)
+    print(f"users={len(dataset.user_ids)} posts={len(dataset.post_ids)} likes={sum(top)} "
+          f"hashtags={len(dataset.hashtags)} top post likes={top[:5]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--database-url", required=True)
+    add_spec_arguments(parser)
+    asyncio.run(_main(parser.parse_args()))
@@ -0,0 +1,294 @@
+"""
+라우트별 지연시간(p50/p95/p99)과 처리량(RPS) 측정 (네트워크 없이 프로세스 안에서)
+
+    python -m benchmarks.load [--requests 200] [--concurrency 8] [--users 1000 --posts 5000 ...]
+                              [--db-latency-ms 0] [--output benchmarks/results/<commit>.json]
+
+합성 데이터(benchmarks.datagen)를 임시 SQLite 파일에 만들고 (--database-url 로 다른 DB 도 가능),
+httpx ASGITransport 로 app 을 직접 호출한다. S3 는 moto 로 흉내 낸다.
+app/routers/* 의 모든 라우트에 시나리오가 있어야 하며 빠진 라우트가 있으면 바로 실패한다.
+결과 JSON 은 benchmarks.compare 로 커밋 간 비교할 수 있다.
+"""
+import argparse
+import asyncio
+import base64
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from datetime import datetime, UTC
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from benchmarks.datagen import Dataset, DatasetSpec, add_spec_arguments, generate, spec_from_args
+
+BOUNDARY = "bench-boundary"
+JPEG = b"\xff\xd8" + b"\x00" * 2048
+
+
+class Call(NamedTuple):
+    """
+    요청 하나 (user_id 의 토큰으로 보낸다)
+    """
+    user_id: str
+    method: str
+    url: str
+    kwargs: dict = {}
+
+
+class State:
+    """
+    시나리오끼리 공유하는 상태 (생성한 게시물은 삭제 시나리오에서 쓴다)
+    """
+    def __init__(self, dataset: Dataset, rng: random.Random):
+        self.dataset = dataset
+        self.rng = rng
+        self.created: List[tuple] = []  # (작성자, post_id)
+        self.liked_posts = list(dataset.like_counts)
+        self.like_weights = list(dataset.like_counts.values())
+        self.all_posts = [(author, post_id) for author, post_ids in dataset.posts_by_author.items()
+                          for post_id in post_ids]
+
+    def user(self) -> str:
+        return self.rng.choice(self.dataset.user_ids)
+
+    def author_post(self) -> tuple:
+        # 게시물을 균등하게 고르면 작성자는 업로드 수만큼 쏠린다
+        return self.rng.choice(self.all_posts)
+
+    def popular_post(self) -> int:
+        return self.rng.choices(self.liked_posts, weights=self.like_weights)[0]
+
+    def hashtag(self) -> str:
+        tags = self.dataset.hashtags
+        return tags[min(int(self.rng.paretovariate(1.0)) - 1, len(tags) - 1)]
+
+
+def _form_body(content: str) -> bytes:
+    return (
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"content\"\r\n\r\n{content}\r\n"
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"images\"; filename=\"0.jpg\"\r\n"
+        "Content-Type: image/jpeg\r\n\r\n"
+    ).encode() + JPEG + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def _delete_call(state: State) -> Call:
+    author, post_id = state.created.pop()
+    return Call(author, "DELETE", f"/feed/posts/{post_id}")
+
+
+# "METHOD /feed/path" -> 요청 만드는 함수 (생성 시나리오가 삭제보다 먼저 돌도록 순서 유지)
+SCENARIOS: Dict[str, Callable[[State], Call]] = {
+    "GET /feed/posts": lambda s: Call(s.user(), "GET", f"/feed/posts?user_id={s.author_post()[0]}"),
+    "GET /feed/posts/hashtag/{hashtag}": lambda s: Call(s.user(), "GET", f"/feed/posts/hashtag/{s.hashtag()}"),
+    "GET /feed/posts/famous": lambda s: Call(s.user(), "GET", "/feed/posts/famous"),
+    "GET /feed/posts/{post_id}/likes": lambda s: Call(s.user(), "GET", f"/feed/posts/{s.popular_post()}/likes"),
+    "POST /feed/posts/likes:batch": lambda s: Call(
+        s.user(), "POST", "/feed/posts/likes:batch",
+        {"json": {"post_ids": s.rng.sample(s.dataset.post_ids, min(50, len(s.dataset.post_ids)))}}),
+    "POST /feed/posts/{post_id}/likes": lambda s: Call(s.user(), "POST", f"/feed/posts/{s.popular_post()}/likes"),
+    "GET /feed/notifications": lambda s: Call(s.author_post()[0], "GET", "/feed/notifications"),
+    "PUT /feed/notifications/{post_id}/read": lambda s: Call(
+        *(lambda author, post_id: (author, "PUT", f"/feed/notifications/{post_id}/read"))(*s.author_post())),
+    "POST /feed/posts": lambda s: Call(s.user(), "POST", "/feed/posts", {"json": {
+        "image_urls": ["data:image/jpeg;base64," + base64.b64encode(JPEG).decode()],
+        "content": f"#{s.hashtag()} 벤치마크"}}),
+    "POST /feed/posts/multipart": lambda s: Call(s.user(), "POST", "/feed/posts/multipart", {
+        "content": _form_body(f"#{s.hashtag()} 벤치마크"),
+        "headers": {"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}}),
+    "PUT /feed/posts/{post_id}": lambda s: Call(
+        *(lambda author, post_id: (author, "PUT", f"/feed/posts/{post_id}",
+                                   {"json": {"content": f"#{s.hashtag()} 수정"}}))(*s.author_post())),
+    "DELETE /feed/posts/{post_id}": _delete_call,
+}
+
+
+def router_routes() -> List[str]:
+    """
+    app/routers/* 에 등록된 라우트 ("METHOD /feed/path")
+    """
+    # pylint: disable=import-outside-toplevel
+    from fastapi.routing import APIRoute
+    from app.routers import notification, post
+
+    return [f"{method} /feed{route.path}"
+            for router in (post.router, notification.router)
+            for route in router.routes if isinstance(route, APIRoute)
+            for method in sorted(route.methods)]
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    nearest-rank 백분위수
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(fraction * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+async def _run_route(client, tokens: Dict[str, str], state: State, build: Callable[[State], Call],
+                     requests: int, concurrency: int) -> dict:
+    calls = [build(state) for _ in range(requests)]
+    latencies: List[float] = []
+    errors = 0
+    queue = list(reversed(calls))
+
+    async def worker():
+        nonlocal errors
+        while queue:
+            call = queue.pop()
+            headers = {"Authorization": f"Bearer {tokens[call.user_id]}", **call.kwargs.get("headers", {})}
+            kwargs = {key: value for key, value in call.kwargs.items() if key != "headers"}
+            started = time.perf_counter()
+            response = await client.request(call.method, call.url, headers=headers, **kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+            elif call.method == "POST" and call.url in ("/feed/posts", "/feed/posts/multipart"):
+                state.created.append((call.user_id, response.json()["post_id"]))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+    }
+
+
+@contextlib.contextmanager
+def _patched_app(session_factory):
+    """
+    app 의 세션 팩토리를 벤치마크 DB 로 바꾼다 (startup 을 돌리지 않으니 백그라운드 워커는 뜨지 않는다)
+    """
+    # pylint: disable=import-outside-toplevel
+    from app.database import db
+
+    originals = (db.SessionLocal, db.ReadSessionLocal)
+    db.SessionLocal = db.ReadSessionLocal = session_factory
+    try:
+        yield
+    finally:
+        db.SessionLocal, db.ReadSessionLocal = originals
+
+
+async def run_suite(session_factory, dataset: Dataset, requests: int = 200, concurrency: int = 8,
+                    routes: Optional[List[str]] = None) -> Dict[str, dict]:
+    """
+    라우트마다 requests 개를 concurrency 개씩 동시에 보내고 결과 집계
+    """
+    # pylint: disable=import-outside-toplevel
+    import httpx
+    from app.main import app
+    from app.utils.token import create_jwt_access_token
+
+    registered = router_routes()
+    missing = sorted(set(registered) - set(SCENARIOS))
+    if missing:
+        raise RuntimeError(f"No benchmark scenario for routes: {missing}")
+    selected = [route for route in SCENARIOS if route in registered and (not routes or route in routes)]
+
+    state = State(dataset, random.Random(dataset.spec.seed))
+    tokens = {user_id: create_jwt_access_token(user_id) for user_id in dataset.user_ids}
+    results = {}
+    with _patched_app(session_factory):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for route in selected:
+                if route == "DELETE /feed/posts/{post_id}":
+                    count = min(requests, len(state.created))
+                else:
+                    count = requests
+                results[route] = await _run_route(client, tokens, state, SCENARIOS[route], count, concurrency)
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args) -> None:
+    # pylint: disable=import-outside-toplevel
+    from moto import mock_aws
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from app.database.db import Base, to_async_url
+    from app import models  # pylint: disable=unused-import
+    from app.utils import image
+    from benchmarks.concurrency import _add_db_latency
+
+    spec = spec_from_args(args)
+    engine = create_async_engine(to_async_url(args.database_url))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    async with session_factory() as db:
+        dataset = await generate(db, spec)
+    if args.db_latency_ms:
+        _add_db_latency(args.db_latency_ms / 1000)
+
+    with mock_aws():
+        image.get_s3_client.cache_clear()
+        image.get_s3_client().create_bucket(
+            Bucket=image.BUCKET_NAME, CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"}
+        )
+        results = await run_suite(session_factory, dataset, args.requests, args.concurrency, args.routes)
+    await engine.dispose()
+
+    print(f"{'route':<42} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'rps':>9} {'errors':>7}")
+    for route, result in results.items():
+        print(f"{route:<42} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+              f"{result['rps']:>9.1f} {result['errors']:>7}")
+
+    commit = _git_commit()
+    output = args.output or os.path.join("benchmarks", "results", f"{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump({
+            "meta": {
+                "commit": commit,
+                "created_at": datetime.now(UTC).isoformat(),
+                "python": platform.python_version(),
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "db_latency_ms": args.db_latency_ms,
+                "database": args.database_url.split("://")[0],
+                "dataset": spec._asdict(),
+            },
+            "routes": results,
+        }, file, ensure_ascii=False, indent=2)
+    print(f"saved {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="라우트별 지연시간/처리량 측정")
+    parser.add_argument("--database-url", default=None, help="기본값은 임시 SQLite 파일")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    parser.add_argument("--routes", nargs="*", help="일부 라우트만 (e.g. 'GET /feed/posts')")
+    parser.add_argument("--output", default=None)
+    add_spec_arguments(parser)
+    arguments = parser.parse_args()
+
+    if arguments.database_url is None:
+        arguments.database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='feed-bench-'), 'bench.db')}"
+    os.environ.setdefault("DATABASE_URL", arguments.database_url)
+    os.environ.setdefault("JWT_SECRET_KEY", "test_token")
+    os.environ.setdefault("JWT_EXPIRATION_DELTA", "60")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    asyncio.run(main(arguments))
@@ -0,0 +1,117 @@
+"""
+게시물 목록 응답 직렬화 비용 비교 (검증 경로 vs 신뢰 경로)
+
+    python -m benchmarks.serialization [--posts 500] [--likers 5] [--images 3] [--rounds 20]
+
+DB 없이 메모리에서 같은 목록을 만들어 두 경로를 비교한다.
+두 경로 모두 response_variants 로 만든 같은 변환본 URL 을 쓰고, 시간을 재기 전에 두 응답 본문이 같은지 확인한다.
+- validated: PostResponse(...) 로 검증해서 만들고, FastAPI response_model 검증 + stdlib json 인코딩
+- trusted: .construct() 로 만들고 TrustedJSONResponse(orjson) 로 바로 인코딩
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+
+
+def _post(idx: int, images: int):
+    # pylint: disable=import-outside-toplevel
+    from app.models.post import Post as PostTable
+    from app.utils.variants import variant_urls
+
+    image_urls = [f"https://balm-bucket.s3.ap-northeast-2.amazonaws.com/images/feed/{idx}-{i}.jpg"
+                  for i in range(images)]
+    # 변환이 끝난 게시물 (posts.image_variants 에 저장된 값)
+    return PostTable(image_urls=image_urls,
+                     image_variants=[variant_urls(url) for url in image_urls])
+
+
+def _rows(posts: int, likers: int, images: int):
+    # pylint: disable=import-outside-toplevel
+    from app.services.image_variant import response_variants
+
+    base = datetime(2024, 1, 1)
+    stored = [_post(idx, images) for idx in range(posts)]
+    return [
+        {
+            "post_id": idx,
+            "user_id": "user_0",
+            "image_urls": stored[idx].image_urls,
+            "image_variants": response_variants(stored[idx]),
+            "content": f"#bench 게시물 {idx}",
+            "uploaded_at": base + timedelta(minutes=idx),
+            "like_count": likers,
+            "liked_by": [
+                {"user_id": f"user_{liker}", "nickname": f"dog_{liker}",
+                 "profile_image_url": "https://img.com/p.jpg"}
+                for liker in range(1, likers + 1)
+            ],
+        }
+        for idx in range(posts)
+    ]
+
+
+def _validated(rows) -> bytes:
+    # pylint: disable=import-outside-toplevel
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_response_field
+    from app.schemas.post import Like, PostPage, PostResponse
+
+    page = PostPage(items=[
+        PostResponse(**{**row, "liked_by": [Like(**like) for like in row["liked_by"]]})
+        for row in rows
+    ])
+    field = create_response_field(name="response", type_=PostPage)
+    content = asyncio.run(serialize_response(field=field, response_content=page))
+    return JSONResponse(content).body
+
+
+def _trusted(rows) -> bytes:
+    # pylint: disable=import-outside-toplevel
+    from app.schemas.post import ImageVariants, Like, PostPage, PostResponse
+    from app.utils.serialization import TrustedJSONResponse
+
+    page = PostPage.construct(items=[
+        PostResponse.construct(**{
+            **row,
+            "liked_by": [Like.construct(**like) for like in row["liked_by"]],
+            "image_variants": [ImageVariants.construct(**urls) for urls in row["image_variants"]],
+        })
+        for row in rows
+    ], next_cursor=None)
+    return TrustedJSONResponse(page).body
+
+
+def _measure(function, rows, rounds: int):
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        body = function(rows)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), min(timings), len(body)
+
+
+def main(args) -> None:
+    rows = _rows(args.posts, args.likers, args.images)
+    # 워밍업 (import, 스키마 캐시) 겸 두 경로가 같은 본문을 만드는지 확인
+    assert _validated(rows) == _trusted(rows), "validated/trusted payloads differ"
+
+    print(f"{args.posts} posts x {args.images} images x {args.likers} likers, {args.rounds} rounds")
+    print(f"{'path':>10} {'median ms':>10} {'min ms':>10} {'bytes':>10}")
+    results = {}
+    for name, function in (("validated", _validated), ("trusted", _trusted)):
+        median, fastest, size = _measure(function, rows, args.rounds)
+        results[name] = median
+        print(f"{name:>10} {median:>10.2f} {fastest:>10.2f} {size:>10}")
+    print(f"speedup: {results['validated'] / results['trusted']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 비용 비교")
+    parser.add_argument("--posts", type=int, default=500)
+    parser.add_argument("--likers", type=int, default=5)
+    parser.add_argument("--images", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=20)
+    main(parser.parse_args())
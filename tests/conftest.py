@@ -0,0 +1,125 @@
+"""
+pytest 공통 설정
+"""
+import contextlib
+import os
+
+from dotenv import load_dotenv
+
+# 로컬 개발용 .env 가 있으면 그걸 쓰고, 없으면 메모리 SQLite 로 테스트
+load_dotenv(os.path.join(os.path.dirname(__file__), "..", "app", "database", ".env"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# pylint: disable=wrong-import-position
+import boto3
+import httpx
+import pytest
+from moto import mock_aws
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database.db import Base
+from app.database.query_stats import instrument_queries, track_queries
+from app.database.routing import get_read_db, get_write_db
+from app.main import app
+from app import models  # pylint: disable=unused-import
+from app.services.leaderboard import famous_leaderboard
+from app.services.profile import profile_cache
+from app.utils import image
+from app.utils.token import current_user
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db():
+    """
+    테스트마다 새로 만드는 메모리 SQLite 비동기 세션
+    """
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)()
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def fresh_leaderboard(monkeypatch):
+    """
+    테스트 사이에 인기 게시물 스냅샷이 남지 않도록 초기화
+    """
+    monkeypatch.setattr(famous_leaderboard, "_candidates", [])
+    monkeypatch.setattr(famous_leaderboard, "_built_at", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_profile_cache():
+    """
+    테스트 사이에 프로필 캐시가 남지 않도록 초기화
+    """
+    profile_cache.clear()
+    yield
+    profile_cache.clear()
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """
+    moto 로 띄운 로컬 S3 (버킷 생성까지)
+    """
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        image.get_s3_client.cache_clear()
+        client = boto3.client("s3", region_name="ap-northeast-2")
+        client.create_bucket(Bucket=image.BUCKET_NAME,
+                             CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+        yield client
+        image.get_s3_client.cache_clear()
+
+
+@pytest.fixture
+def query_budget(db):
+    """
+    with query_budget(3): ... 구간에서 테스트 DB 쿼리가 3개를 넘으면 실행된 쿼리 목록과 함께 실패
+    """
+    instrument_queries(db.get_bind())
+
+    @contextlib.contextmanager
+    def budget(limit: int):
+        with track_queries(keep_statements=True) as stats:
+            yield stats
+        assert stats.count <= limit, (
+            f"{stats.count} queries exceeded the budget of {limit}:\n" + "\n".join(stats.statements)
+        )
+
+    return budget
+
+
+@pytest.fixture
+def viewer_id():
+    """
+    client 로 보내는 요청의 로그인 유저 (테스트 모듈에서 같은 이름의 fixture 로 바꿀 수 있다)
+    """
+    return "user_0"
+
+
+@pytest.fixture
+async def client(db, viewer_id):
+    """
+    테스트 DB 세션과 viewer_id 로그인으로 app 을 호출하는 httpx 클라이언트
+    """
+    async def override_db():
+        yield db
+
+    for dependency in (get_read_db, get_write_db):
+        app.dependency_overrides[dependency] = override_db
+    app.dependency_overrides[current_user] = lambda: viewer_id
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        yield http
+    app.dependency_overrides.clear()
@@ -0,0 +1,34 @@
+"""
+테스트용 데이터 생성 헬퍼
+"""
+from datetime import datetime, timedelta
+
+from app.models.post import Post, Like, User, UserAbstractProfile
+from app.utils.image import BUCKET_NAME
+
+
+async def seed_users(db, count: int):
+    for idx in range(count):
+        social_id = f"user_{idx}"
+        db.add(User(name=social_id, social_id=social_id))
+        db.add(UserAbstractProfile(social_id=social_id, dog_name=f"dog_{idx}", photo_path="https://img.com/p.jpg"))
+    await db.commit()
+
+
+async def seed_posts(db, post_count: int, likers: int = 3, user_id: str = "user_0", content: str = "#tag"):
+    base = datetime(2024, 1, 1)
+    posts = []
+    for idx in range(post_count):
+        post = Post(user_id=user_id, content=f"{content} {idx}", uploaded_at=base + timedelta(minutes=idx),
+                    image_urls=["https://img.com/a.jpg"], hashtags=["tag"], like_count=likers)
+        db.add(post)
+        await db.flush()
+        for liker in range(1, likers + 1):
+            db.add(Like(post_id=post.id, user_id=f"user_{liker}"))
+        posts.append(post)
+    await db.commit()
+    return posts
+
+
+def stored_keys(s3):
+    return sorted(obj["Key"] for obj in s3.list_objects_v2(Bucket=BUCKET_NAME).get("Contents", []))
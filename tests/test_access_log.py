@@ -0,0 +1,84 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.utils.access_log import (
+    AccessLogMiddleware, REQUEST_DB_QUERIES, REQUEST_DURATION, REQUESTS_IN_FLIGHT, UNMATCHED_ROUTE, parse_sample_rates,
+)
+from app.utils.metrics import REGISTRY
+
+
+def make_app(**options):
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"item_id": item_id, "payload": "x" * 100}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(10):
+                yield b"a" * 1000
+        return StreamingResponse(chunks())
+
+    app.add_middleware(AccessLogMiddleware, **options)
+    return app
+
+
+def access_records(caplog):
+    return [record for record in caplog.records if record.name == "app.access"]
+
+
+def test_logs_structured_fields_and_streams_body(caplog):
+    caplog.set_level(logging.INFO, logger="app.access")
+    client = TestClient(make_app(body_max_bytes=16, sample_rate=1.0, route_sample_rates={}))
+
+    response = client.get("/stream")
+
+    assert response.content == b"a" * 10000
+    summary, body = access_records(caplog)
+    assert (summary.status, summary.bytes, summary.route) == (200, 10000, "/stream")
+    assert summary.latency_ms >= 0
+    assert body.getMessage().endswith("Response Body : " + repr(b"a" * 16) + "...")
+
+
+def test_route_sample_rate_uses_route_template(caplog):
+    caplog.set_level(logging.INFO, logger="app.access")
+    client = TestClient(make_app(body_max_bytes=1024, sample_rate=1.0,
+                                 route_sample_rates=parse_sample_rates("GET /items/{item_id}=0")))
+
+    assert client.get("/items/3").status_code == 200
+
+    [summary] = access_records(caplog)
+    assert summary.route == "/items/{item_id}"
+    assert summary.path == "/items/3"
+
+
+def test_parse_sample_rates():
+    assert parse_sample_rates("GET /feed/posts=0.01, /feed/metrics=0") == {
+        "GET /feed/posts": 0.01,
+        "/feed/metrics": 0.0,
+    }
+    assert not parse_sample_rates(None)
+
+
+def test_request_metrics_use_route_template():
+    client = TestClient(make_app(body_max_bytes=0))
+    before = REQUEST_DURATION.count(method="GET", route="/items/{item_id}", status="200")
+    unmatched = REQUEST_DURATION.count(method="GET", route=UNMATCHED_ROUTE, status="404")
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing/123")
+
+    assert REQUEST_DURATION.count(method="GET", route="/items/{item_id}", status="200") == before + 2
+    assert REQUEST_DURATION.count(method="GET", route=UNMATCHED_ROUTE, status="404") == unmatched + 1
+    assert REQUEST_DB_QUERIES.count(method="GET", route="/items/{item_id}") >= 2
+    assert REQUESTS_IN_FLIGHT.value() == 0
+    rendered = REGISTRY.render()
+    assert 'feed_http_request_duration_seconds_bucket{method="GET",route="/items/{item_id}",status="200",le="+Inf"}' \
+        in rendered
+    assert "/missing/123" not in rendered
@@ -0,0 +1,91 @@
+"""
+벤치마크 데이터 생성기/드라이버 스모크 테스트
+"""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database.db import Base
+from app.models.notification import Notification
+from app.models.post import Like, Post
+from benchmarks.datagen import DatasetSpec, generate
+from benchmarks.load import SCENARIOS, percentile, router_routes, run_suite
+from benchmarks import serialization
+
+pytestmark = pytest.mark.anyio
+
+SPEC = DatasetSpec(users=30, posts=60, likes=300, hashtags=20)
+
+
+def test_every_route_has_a_scenario():
+    assert set(router_routes()) <= set(SCENARIOS)
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_serialization_paths_encode_the_same_payload():
+    # pylint: disable=protected-access
+    rows = serialization._rows(posts=3, likers=2, images=2)
+    assert serialization._validated(rows) == serialization._trusted(rows)
+
+
+async def _table_rows(db):
+    """
+    생성된 게시물/좋아요/알림 행을 비교 가능한 형태로
+    """
+    return [
+        [(row.id, row.user_id, row.post_id) for row in await db.scalars(select(Like).order_by(Like.id))],
+        [(row.id, row.user_id, row.content, row.uploaded_at, row.like_count)
+         for row in await db.scalars(select(Post).order_by(Post.id))],
+        [(row.user_id, row.post_id, row.is_read, row.unread_count, row.last_actor_id, row.created_at)
+         for row in await db.scalars(select(Notification).order_by(Notification.id))],
+    ]
+
+
+async def test_datagen_is_deterministic_and_skewed(db):
+    dataset = await generate(db, SPEC)
+
+    # 같은 seed 로 새 DB 에 다시 만들면 요약과 행이 모두 같다
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, autoflush=False, expire_on_commit=False)() as other:
+        assert await generate(other, SPEC) == dataset
+        assert await _table_rows(other) == await _table_rows(db)
+    await engine.dispose()
+
+    assert len(dataset.post_ids) == 60
+    assert sum(dataset.like_counts.values()) <= 300
+    counts = sorted(dataset.like_counts.values(), reverse=True)
+    # 상위 10% 게시물이 좋아요의 상당 부분을 가져간다
+    assert sum(counts[:6]) > sum(counts) * 0.3
+
+
+async def test_run_suite_covers_all_routes(db, s3, monkeypatch):
+    monkeypatch.setenv("JWT_SECRET_KEY", "test_token")
+    monkeypatch.setenv("JWT_EXPIRATION_DELTA", "60")
+    dataset = await generate(db, SPEC)
+    factory = lambda: _SessionProxy(db)  # noqa: E731  pylint: disable=unnecessary-lambda-assignment
+    results = await run_suite(factory, dataset, requests=3, concurrency=1)
+    assert set(results) == set(router_routes())
+    assert all(result["errors"] == 0 for result in results.values())
+
+
+class _SessionProxy:
+    """
+    테스트 세션을 async with 로 쓰되 닫지는 않는다
+    """
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, *exc):
+        return False
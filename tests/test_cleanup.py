@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.cleanup import S3Cleanup
+from app.services import cleanup
+from app.utils import image
+from app.utils.clock import utcnow
+from tests.seed import stored_keys
+
+pytestmark = pytest.mark.anyio
+
+
+def url(key: str) -> str:
+    return f"https://{image.BUCKET_NAME}.s3.ap-northeast-2.amazonaws.com/{key}"
+
+
+async def queued(db):
+    return (await db.scalars(select(S3Cleanup).order_by(S3Cleanup.id))).all()
+
+
+async def test_sweeper_deletes_in_batches(s3, db):
+    keys = [f"images/feed/{i}.jpg" for i in range(5)]
+    for key in keys:
+        s3.put_object(Bucket=image.BUCKET_NAME, Key=key, Body=b"x")
+    cleanup.enqueue_image_cleanup(db, [url(key) for key in keys] + [url("images/feed/missing.jpg")])
+    await db.commit()
+
+    calls = []
+    original = s3.delete_objects
+    s3.delete_objects = lambda **kwargs: calls.append(kwargs) or original(**kwargs)
+
+    assert await cleanup.sweep_cleanup_queue(db, s3, batch_size=4) == 4
+    assert await cleanup.sweep_cleanup_queue(db, s3, batch_size=4) == 2
+    assert [len(call["Delete"]["Objects"]) for call in calls] == [4, 2]
+    assert stored_keys(s3) == []
+    assert await db.scalar(select(func.count()).select_from(S3Cleanup)) == 0
+
+
+async def test_failed_deletes_are_retried_later(s3, db):
+    cleanup.enqueue_image_cleanup(db, [url("images/feed/a.jpg")])
+    await db.commit()
+
+    def broken(**kwargs):
+        raise ConnectionError("s3 down")
+
+    assert await cleanup.sweep_cleanup_queue(db, SimpleNamespace(delete_objects=broken)) == 0
+    [row] = await queued(db)
+    assert row.created_at <= utcnow()
+    assert row.attempts == 1 and row.last_error == "s3 down"
+    assert row.next_attempt_at > utcnow()
+
+    # 재시도 시각 전에는 건드리지 않는다
+    assert await cleanup.sweep_cleanup_queue(db, s3) == 0
+    row.next_attempt_at = utcnow()
+    await db.commit()
+    assert await cleanup.sweep_cleanup_queue(db, s3) == 1
+    assert await queued(db) == []
+
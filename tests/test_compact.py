@@ -0,0 +1,72 @@
+import pytest
+
+from app.services import post as post_service
+from app.services.leaderboard import famous_leaderboard
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def viewer_id():
+    return "user_2"
+
+
+async def test_compact_listing_returns_top_likers_and_liked_by_me(db, query_budget):
+    await seed_users(db, 8)
+    popular, quiet = await seed_posts(db, 2, likers=6)
+    await post_service.toggle_post_like(quiet.id, "user_6", db)  # user_6 취소
+
+    with query_budget(3) as queries:  # 게시물, 앞쪽 좋아요 + liked_by_me, 캐시에 없는 프로필
+        page = await post_service.list_posts("user_0", db, viewer_id="user_6", compact=True)
+
+    by_id = {post.post_id: post for post in page.items}
+    assert [like.user_id for like in by_id[popular.id].liked_by] == ["user_1", "user_2", "user_3"]
+    assert by_id[popular.id].like_count == 6 and by_id[popular.id].liked_by_me is True
+    assert by_id[quiet.id].like_count == 5 and by_id[quiet.id].liked_by_me is False
+    # 윈도 함수로 게시물의 좋아요 전체를 훑지 않고 게시물별 LIMIT 으로 앞쪽만 읽는다
+    assert " OVER " not in queries.statements[1] and queries.statements[1].count("LIMIT") == 2
+
+
+async def test_full_listing_is_unchanged(db):
+    await seed_users(db, 8)
+    await seed_posts(db, 1, likers=6)
+
+    [post] = (await post_service.list_posts("user_0", db)).items
+
+    assert len(post.liked_by) == 6 and post.like_count == 6 and post.liked_by_me is None
+
+
+async def test_compact_famous_posts(db):
+    await seed_users(db, 5)
+    await seed_posts(db, 2, likers=4)
+    await famous_leaderboard.refresh(db)
+
+    posts = await post_service.famous_posts(db, viewer_id="user_9", compact=True)
+
+    assert all(len(post.liked_by) == 3 and post.liked_by_me is False for post in posts)
+
+
+async def test_likes_endpoint_paginates(db, client):
+    await seed_users(db, 8)
+    [post] = await seed_posts(db, 1, likers=7)
+
+    first = (await client.get(f"/feed/posts/{post.id}/likes?limit=4")).json()
+    second = (await client.get(f"/feed/posts/{post.id}/likes?limit=4&cursor={first['next_cursor']}")).json()
+
+    assert [like["user_id"] for like in first["items"] + second["items"]] == [f"user_{i}" for i in range(1, 8)]
+    assert second["next_cursor"] is None
+    assert (await client.get("/feed/posts/999/likes")).status_code == 404
+
+
+async def test_compact_view_over_http(db, client):
+    await seed_users(db, 8)
+    await seed_posts(db, 1, likers=6)
+
+    full = await client.get("/feed/posts?user_id=user_0")
+    compact = await client.get("/feed/posts?user_id=user_0&view=compact")
+
+    assert compact.headers["etag"] != full.headers["etag"]
+    [item] = compact.json()["items"]
+    assert len(item["liked_by"]) == 3 and item["liked_by_me"] is True
+    assert (await client.get("/feed/posts?user_id=user_0&view=tiny")).status_code == 422
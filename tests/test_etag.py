@@ -0,0 +1,80 @@
+import pytest
+
+from app.services import post as post_service
+from app.services import image_variant
+from app.services import notification as noti_service
+from app.services.outbox import process_outbox
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+
+@pytest.mark.parametrize("path", ["/feed/posts?user_id=user_0", "/feed/posts/hashtag/tag"])
+async def test_unchanged_listing_returns_304_without_listing_queries(db, client, query_budget, path):
+    await seed_users(db, 4)
+    post = await post_service.create_post_with_images("user_0", db, "#tag", [])
+
+    first = await client.get(path)
+    etag = first.headers["etag"]
+    with query_budget(1) as queries:  # 버전만 읽는다
+        cached = await client.get(path, headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304 and cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert "feed_versions" in queries.statements[0]
+
+    await post_service.toggle_post_like(post.post_id, "user_1", db)  # liked_by 가 바뀌면 버전도 바뀐다
+    changed = await client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert len(changed.json()["items"][0]["liked_by"]) == 1
+
+
+async def test_etag_changes_when_image_variants_are_ready(db, client, monkeypatch):
+    async def fake_variants(image_url):
+        return {"thumb": image_url + ".thumb.webp", "medium": image_url + ".medium.webp"}
+
+    monkeypatch.setattr(image_variant, "generate_variants", fake_variants)
+    await seed_users(db, 1)
+    await post_service.create_post_with_images("user_0", db, "#tag", ["https://bucket.example.com/a.jpg"])
+    paths = ["/feed/posts?user_id=user_0", "/feed/posts/hashtag/tag"]
+    etags = {}
+    for path in paths:
+        first = await client.get(path)
+        assert first.json()["items"][0]["image_variants"][0]["thumb"] == "https://bucket.example.com/a.jpg"  # 아직 원본
+        etags[path] = first.headers["etag"]
+
+    assert await image_variant.process_variant_jobs(db) == 1
+
+    for path in paths:
+        changed = await client.get(path, headers={"If-None-Match": etags[path]})
+        assert changed.status_code == 200
+        assert changed.json()["items"][0]["image_variants"][0]["thumb"] == "https://bucket.example.com/a.jpg.thumb.webp"
+
+
+async def test_etag_depends_on_page_parameters(db, client):
+    await seed_users(db, 1)
+    await seed_posts(db, 3, likers=0)
+
+    first = await client.get("/feed/posts?user_id=user_0&limit=1")
+    other = await client.get("/feed/posts?user_id=user_0&limit=2",
+                             headers={"If-None-Match": first.headers["etag"]})
+
+    assert other.status_code == 200 and other.headers["etag"] != first.headers["etag"]
+
+
+async def test_inbox_version_bumped_by_notifications_and_reads(db, client):
+    await seed_users(db, 2)
+    [post] = await seed_posts(db, 1, likers=0)
+    empty = (await client.get("/feed/notifications")).headers["etag"]
+
+    await post_service.toggle_post_like(post.id, "user_1", db)
+    assert (await client.get("/feed/notifications", headers={"If-None-Match": empty})).status_code == 304
+
+    await process_outbox(db)
+    response = await client.get("/feed/notifications", headers={"If-None-Match": empty})
+    assert response.status_code == 200 and len(response.json()["items"]) == 1
+
+    unread = response.headers["etag"]
+    await noti_service.mark_notification_as_read(post.id, "user_0", db)
+    assert (await client.get("/feed/notifications", headers={"If-None-Match": unread})).status_code == 200
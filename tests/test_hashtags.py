@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.commands.backfill_hashtags import backfill_hashtags
+from app.models.post import PostHashtag
+from app.schemas.post import PostCreate, PostUpdate
+from app.services import post as post_service
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+async def hashtags_of(db, post_id):
+    return set((await db.scalars(select(PostHashtag.hashtag).where(PostHashtag.post_id == post_id))).all())
+
+
+async def hashtag_rows(db):
+    # pylint: disable=not-callable
+    return await db.scalar(select(func.count()).select_from(PostHashtag))
+
+
+async def test_hashtag_index_follows_create_update_delete(db):
+    await seed_users(db, 1)
+
+    created = await post_service.create_post("user_0", db, PostCreate(image_urls=[], content="#dog #walk #dog"))
+    assert await hashtags_of(db, created.post_id) == {"dog", "walk"}
+    page = await post_service.list_posts_with_hashtag("walk", db)
+    assert [p.post_id for p in page.items] == [created.post_id]
+
+    await post_service.update_post("user_0", created.post_id, db, PostUpdate(content="#dog #park"))
+    assert await hashtags_of(db, created.post_id) == {"dog", "park"}
+    assert (await post_service.list_posts_with_hashtag("walk", db)).items == []
+
+    await post_service.delete_post("user_0", created.post_id, db)
+    assert await hashtags_of(db, created.post_id) == set()
+
+
+async def test_backfill_populates_index_from_existing_posts(db):
+    await seed_users(db, 2)
+    post_ids = [post.id for post in await seed_posts(db, 5, likers=1)]
+    assert await hashtag_rows(db) == 0
+
+    assert await backfill_hashtags(db, batch_size=2) == 5
+    assert await backfill_hashtags(db, batch_size=2) == 5  # 다시 돌려도 중복 없음
+
+    assert await hashtag_rows(db) == 5
+    page = await post_service.list_posts_with_hashtag("tag", db, limit=3)
+    assert [p.post_id for p in page.items] == post_ids[::-1][:3]
+    next_page = await post_service.list_posts_with_hashtag("tag", db, limit=3, cursor=page.next_cursor)
+    assert [p.post_id for p in next_page.items] == post_ids[1::-1]
@@ -0,0 +1,53 @@
+import base64
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.post import PostCreate
+from app.services import post as post_service
+from app.services.cleanup import sweep_cleanup_queue
+from app.utils import image
+from tests.seed import seed_users, stored_keys
+
+pytestmark = pytest.mark.anyio
+
+IMAGE = "data:image/jpeg;base64," + base64.b64encode(b"\xff\xd8fake-jpeg").decode()
+
+
+async def test_uploads_concurrently_with_shared_client(s3):
+    urls = await image.upload_images_to_s3([IMAGE] * 10)
+
+    assert len(urls) == 10
+    assert stored_keys(s3) == sorted(image.key_from_url(url) for url in urls)
+    assert image.get_s3_client() is image.get_s3_client()
+
+
+async def test_s3_latency_metrics(s3):
+    uploads = image.S3_REQUEST_DURATION.count(operation="upload", outcome="ok")
+    deletes = image.S3_REQUEST_DURATION.count(operation="delete", outcome="ok")
+
+    urls = await image.upload_images_to_s3([IMAGE] * 2)
+    await image.cleanup_uploaded_images(urls)
+
+    assert image.S3_REQUEST_DURATION.count(operation="upload", outcome="ok") == uploads + 2
+    assert image.S3_REQUEST_DURATION.count(operation="delete", outcome="ok") == deletes + 1
+
+
+async def test_partial_uploads_are_cleaned_up_on_failure(s3):
+    with pytest.raises(HTTPException):
+        await image.upload_images_to_s3([IMAGE, IMAGE, "not base64!", IMAGE])
+
+    assert stored_keys(s3) == []
+
+
+async def test_create_and_delete_post_with_images(s3, db):
+    await seed_users(db, 1)
+
+    created = await post_service.create_post("user_0", db, PostCreate(image_urls=[IMAGE] * 3, content="#s3"))
+    assert len(stored_keys(s3)) == 3
+
+    await post_service.delete_post("user_0", created.post_id, db)
+    assert len(stored_keys(s3)) == 3  # 커밋 시점에는 대기열에만 기록
+
+    assert await sweep_cleanup_queue(db) == 9  # 원본 + 변환본 키
+    assert stored_keys(s3) == []
@@ -0,0 +1,39 @@
+import pytest
+
+from app.services import post as post_service
+from app.services.leaderboard import famous_leaderboard
+from app.utils.metrics import REGISTRY
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_famous_posts_reads_snapshot_and_batches_likes(db, query_budget):
+    await seed_users(db, 4)
+    await seed_posts(db, 10)
+    await famous_leaderboard.refresh(db)
+
+    with query_budget(2):  # 좋아요 일괄 조회, 캐시에 없는 프로필 조회
+        posts = await post_service.famous_posts(db)
+
+    assert len(posts) == 5
+    assert all(post.user_name == "dog_0" and len(post.liked_by) == 3 for post in posts)
+
+
+async def test_snapshot_is_stale_until_refreshed(db):
+    await seed_users(db, 4)
+    await seed_posts(db, 2, likers=1)
+    assert len(await famous_leaderboard.candidates(db)) == 2
+
+    await seed_posts(db, 1, likers=3)
+    assert len(await famous_leaderboard.candidates(db)) == 2
+    assert (await famous_leaderboard.refresh(db))[0].like_count == 3
+
+
+async def test_snapshot_metrics_exposed(db):
+    await famous_leaderboard.refresh(db)
+
+    rendered = REGISTRY.render()
+
+    assert "feed_famous_snapshot_age_seconds " in rendered
+    assert "feed_famous_refresh_duration_seconds " in rendered
@@ -0,0 +1,33 @@
+import pytest
+
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def viewer_id():
+    return "user_2"
+
+
+async def test_batch_answers_counts_and_liked_by_me_in_one_query(db, client, query_budget):
+    await seed_users(db, 4)
+    liked = await seed_posts(db, 3, likers=3)
+    [unliked] = await seed_posts(db, 1, likers=1)
+
+    post_ids = [unliked.id, 999] + [post.id for post in liked] + [unliked.id]
+    with query_budget(1) as queries:
+        response = await client.post("/feed/posts/likes:batch", json={"post_ids": post_ids})
+
+    assert response.status_code == 200
+    assert response.json()["items"] == (
+        [{"post_id": unliked.id, "like_count": 1, "liked_by_me": False},
+         {"post_id": 999, "like_count": 0, "liked_by_me": False}]
+        + [{"post_id": post.id, "like_count": 3, "liked_by_me": True} for post in liked]
+    )
+    assert "GROUP BY" in queries.statements[0]
+
+
+async def test_batch_size_is_limited(client):
+    assert (await client.post("/feed/posts/likes:batch", json={"post_ids": []})).status_code == 422
+    assert (await client.post("/feed/posts/likes:batch", json={"post_ids": list(range(301))})).status_code == 422
@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import delete, false, func, select, update
+
+from app.commands.reconcile_like_counts import reconcile_like_counts
+from app.models.post import Like, Post
+from app.services import post as post_service
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_toggle_keeps_like_count_in_sync(db):
+    await seed_users(db, 3)
+    post_id = (await seed_posts(db, 1, likers=0))[0].id
+
+    assert (await post_service.toggle_post_like(post_id, "user_1", db)).likes_count == 1
+    assert (await post_service.toggle_post_like(post_id, "user_2", db)).likes_count == 2
+    result = await post_service.toggle_post_like(post_id, "user_1", db)
+
+    assert result.is_liked is False
+    assert result.likes_count == 1
+    assert (await db.get(Post, post_id, populate_existing=True)).like_count == 1
+
+
+async def test_concurrent_like_is_treated_as_already_liked(db, monkeypatch):
+    await seed_users(db, 2)
+    post_id = (await seed_posts(db, 1, likers=1))[0].id  # user_1 이 이미 좋아요
+    scalars = db.scalars
+
+    async def stale_scalars(statement, *args, **kwargs):
+        # 동시 요청이 아직 커밋 전이라 "좋아요 안 함" 으로 보인 상황
+        if statement.get_final_froms()[0].name == "likes":
+            statement = statement.where(false())
+        return await scalars(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db, "scalars", stale_scalars)
+    result = await post_service.toggle_post_like(post_id, "user_1", db)
+
+    assert result.is_liked is True and result.likes_count == 1
+    assert await db.scalar(select(func.count()).select_from(Like)) == 1  # pylint: disable=not-callable
+    assert (await db.get(Post, post_id, populate_existing=True)).like_count == 1
+
+
+async def test_concurrent_unlike_decrements_once(db, monkeypatch):
+    await seed_users(db, 2)
+    post_id = (await seed_posts(db, 1, likers=1))[0].id  # user_1 이 좋아요
+    scalars = db.scalars
+
+    async def racing_scalars(statement, *args, **kwargs):
+        result = await scalars(statement, *args, **kwargs)
+        if statement.get_final_froms()[0].name == "likes":
+            # 좋아요를 읽은 직후 같은 유저의 다른 취소 요청이 먼저 커밋
+            await db.execute(delete(Like).where(Like.post_id == post_id))
+            await db.execute(update(Post).where(Post.id == post_id).values(like_count=Post.like_count - 1))
+            await db.commit()
+        return result
+
+    monkeypatch.setattr(db, "scalars", racing_scalars)
+    result = await post_service.toggle_post_like(post_id, "user_1", db)
+
+    assert result.is_liked is False and result.likes_count == 0
+    assert await db.scalar(select(func.count()).select_from(Like)) == 0  # pylint: disable=not-callable
+    assert (await db.get(Post, post_id, populate_existing=True)).like_count == 0
+
+
+async def test_famous_posts_ranked_by_like_count(db):
+    await seed_users(db, 4)
+    await seed_posts(db, 3, likers=1)
+    top = (await seed_posts(db, 1, likers=3))[0].id
+
+    posts = await post_service.famous_posts(db)
+
+    assert max(posts, key=lambda post: post.like_count).post_id == top
+
+
+async def test_reconcile_repairs_drift(db):
+    await seed_users(db, 4)
+    post_ids = [post.id for post in await seed_posts(db, 3, likers=2)]
+    (await db.get(Post, post_ids[0])).like_count = 7
+    (await db.get(Post, post_ids[1])).like_count = -1
+    await db.commit()
+
+    assert await reconcile_like_counts(db) == 2
+    counts = [(await db.get(Post, post_id, populate_existing=True)).like_count for post_id in post_ids]
+    assert counts == [2, 2, 2]
+    assert await reconcile_like_counts(db) == 0
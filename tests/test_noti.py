@@ -1,11 +1,25 @@
+import asyncio
+
 from fastapi.testclient import TestClient
+from app.database.db import session_factory
 from app.main import app
+from app.services.outbox import process_outbox
 from tests.test_setting import my_token, friend_token
 from tests.test_posts import test_like_post, test_unlike_post
 
 client = TestClient(app)
 
 
+def process_notifications():
+    """
+    알림은 아웃박스 워커가 만들기 때문에 테스트에서는 직접 처리
+    """
+    async def run():
+        async with session_factory()() as db:
+            await process_outbox(db)
+    asyncio.run(run())
+
+
 def test_get_notifications(my_token):
     response = client.get(
         "http://127.0.0.1:8000/feed/notifications",
@@ -18,10 +32,11 @@ def test_get_notifications(my_token):
 
 def test_mark_notification_as_read(my_token, friend_token):
     test_like_post(friend_token)
+    process_notifications()
 
     notifications = test_get_notifications(my_token)
-    assert len(notifications.json()[0]["likes"]) == 2
-    assert notifications.json()[0]['is_read'] is False
+    assert len(notifications.json()["items"][0]["likes"]) == 2
+    assert notifications.json()["items"][0]['is_read'] is False
 
     response = client.put(
         "http://127.0.0.1:8000/feed/notifications/6/read",
@@ -30,9 +45,9 @@ def test_mark_notification_as_read(my_token, friend_token):
     assert response.status_code == 200
 
     notifications = test_get_notifications(my_token)
-    assert notifications.json()[0]['is_read'] is True
+    assert notifications.json()["items"][0]['is_read'] is True
 
     test_unlike_post(friend_token)
     notifications = test_get_notifications(my_token)
-    assert len(notifications.json()[0]["likes"]) == 1
-    assert notifications.json()[0]['is_read'] is True
+    assert len(notifications.json()["items"][0]["likes"]) == 1
+    assert notifications.json()["items"][0]['is_read'] is True
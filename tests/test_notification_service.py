@@ -0,0 +1,46 @@
+import pytest
+
+from app.services import notification as noti_service
+from app.services import post as post_service
+from app.services.outbox import process_outbox
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+async def like_posts(db, post_ids, likers):
+    for post_id in post_ids:
+        for liker in likers:
+            await post_service.toggle_post_like(post_id, liker, db)
+    await process_outbox(db)
+
+
+async def test_notifications_grouped_in_two_queries(db, query_budget):
+    await seed_users(db, 5)
+    post_ids = [post.id for post in await seed_posts(db, 6, likers=0)]
+    await like_posts(db, post_ids, ["user_1", "user_2", "user_3", "user_4"])
+
+    with query_budget(3):  # 게시물별 알림, 좋아요 누른 유저, 캐시에 없는 프로필
+        page = await noti_service.get_notifications("user_0", db, limit=10)
+
+    assert [noti.post_id for noti in page.items] == post_ids[::-1]
+    assert all(len(noti.likes) == 4 and noti.is_read is False for noti in page.items)
+    assert all(noti.unread_count == 4 and noti.last_actor_id == "user_4" for noti in page.items)
+    assert page.next_cursor is None
+
+
+async def test_notifications_paginated_by_recent_activity(db):
+    await seed_users(db, 3)
+    post_ids = [post.id for post in await seed_posts(db, 3, likers=0)]
+    await like_posts(db, post_ids, ["user_1"])
+    await like_posts(db, [post_ids[0]], ["user_2"])  # 가장 최근 활동
+    await noti_service.mark_notification_as_read(post_ids[1], "user_0", db)
+
+    first = await noti_service.get_notifications("user_0", db, limit=2)
+    second = await noti_service.get_notifications("user_0", db, limit=2, cursor=first.next_cursor)
+
+    assert [noti.post_id for noti in first.items] == [post_ids[0], post_ids[2]]
+    assert [noti.post_id for noti in second.items] == [post_ids[1]]
+    assert second.items[0].is_read is True
+    assert second.items[0].unread_count == 0
+    assert second.next_cursor is None
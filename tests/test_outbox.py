@@ -0,0 +1,94 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app.models.notification import Notification as NotiTable
+from app.models.outbox import OutboxEvent
+from app.services import notification as noti_service
+from app.services import post as post_service
+from app.services.outbox import process_outbox
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+async def count(db, table):
+    return await db.scalar(select(func.count()).select_from(table))
+
+
+async def test_like_commits_once_with_outbox_event(db):
+    await seed_users(db, 2)
+    [post] = await seed_posts(db, 1, likers=0)
+
+    commits = []
+    event.listen(db.sync_session, "after_commit", lambda session: commits.append(session))
+    await post_service.toggle_post_like(post.id, "user_1", db)
+
+    assert len(commits) == 1
+    assert await count(db, OutboxEvent) == 1
+    assert await count(db, NotiTable) == 0
+
+
+async def test_worker_merges_burst_into_one_notification(db, query_budget):
+    await seed_users(db, 5)
+    [post] = await seed_posts(db, 1, likers=0)
+    for liker in ["user_1", "user_2", "user_3", "user_4"]:
+        await post_service.toggle_post_like(post.id, liker, db)
+    await post_service.toggle_post_like(post.id, "user_4", db)  # 처리 전에 취소
+
+    with query_budget(5) as queries:  # 이벤트, 살아있는 좋아요, 알림 upsert, 버전, 이벤트 삭제
+        assert await process_outbox(db) == 4
+
+    assert sum(statement.startswith("INSERT INTO feed_notifications") for statement in queries.statements) == 1
+    [noti] = (await db.scalars(select(NotiTable))).all()
+    assert (noti.user_id, noti.post_id, noti.unread_count, noti.last_actor_id) == ("user_0", post.id, 3, "user_3")
+    assert await count(db, OutboxEvent) == 0
+    assert await process_outbox(db) == 0
+
+
+async def test_later_likes_update_the_same_notification(db):
+    await seed_users(db, 4)
+    [post] = await seed_posts(db, 1, likers=0)
+    await post_service.toggle_post_like(post.id, "user_1", db)
+    await process_outbox(db)
+    await noti_service.mark_notification_as_read(post.id, "user_0", db)
+
+    await post_service.toggle_post_like(post.id, "user_2", db)
+    await post_service.toggle_post_like(post.id, "user_3", db)
+    await process_outbox(db)
+
+    [noti] = (await db.scalars(select(NotiTable).execution_options(populate_existing=True))).all()
+    assert (noti.is_read, noti.unread_count, noti.last_actor_id) == (False, 2, "user_3")
+
+
+async def test_notification_removed_when_last_like_is_cancelled(db):
+    await seed_users(db, 2)
+    [post] = await seed_posts(db, 1, likers=0)
+    await post_service.toggle_post_like(post.id, "user_1", db)
+    await process_outbox(db)
+
+    await post_service.toggle_post_like(post.id, "user_1", db)
+
+    assert await count(db, NotiTable) == 0
+
+
+async def test_stored_timestamps_are_naive_utc(db):
+    # asyncpg 는 naive DateTime 컬럼에 tzinfo 있는 값을 넣으면 DataError 라서 바인딩 값을 직접 확인
+    await seed_users(db, 2)
+    [post] = await seed_posts(db, 1, likers=0)
+    bound = []
+
+    def collect(conn, clauseelement, multiparams, params, execution_options):  # pylint: disable=unused-argument
+        if getattr(getattr(clauseelement, "table", None), "name", None) in ("feed_outbox", "feed_notifications"):
+            values = [clauseelement.compile(dialect=conn.dialect).params, params]
+            values += multiparams if isinstance(multiparams, list) else [multiparams]
+            bound.extend(value for row in values if row for value in row.values())
+
+    event.listen(db.get_bind(), "before_execute", collect)
+    await post_service.toggle_post_like(post.id, "user_1", db)
+    await process_outbox(db)
+
+    timestamps = [value for value in bound if isinstance(value, datetime)]
+    assert len(timestamps) >= 2  # 아웃박스 이벤트, 알림 upsert
+    assert all(value.tzinfo is None for value in timestamps)
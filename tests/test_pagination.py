@@ -0,0 +1,39 @@
+import pytest
+from fastapi import HTTPException
+
+from app.services import post as post_service
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_list_posts_walks_all_pages_newest_first(db):
+    await seed_users(db, 2)
+    posts = await seed_posts(db, 7, likers=1)
+
+    seen = []
+    cursor = None
+    while True:
+        page = await post_service.list_posts("user_0", db, limit=3, cursor=cursor)
+        seen.extend(post.post_id for post in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [post.id for post in reversed(posts)]
+
+
+async def test_last_page_has_no_cursor(db):
+    await seed_users(db, 2)
+    await seed_posts(db, 3, likers=1)
+
+    page = await post_service.list_posts("user_0", db, limit=3)
+
+    assert len(page.items) == 3
+    assert page.next_cursor is None
+
+
+async def test_invalid_cursor_is_rejected(db):
+    with pytest.raises(HTTPException) as exc:
+        await post_service.list_posts("user_0", db, cursor="not-a-cursor")
+    assert exc.value.status_code == 400
@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.pool import (
+    InstrumentedPool, instrument_pool, pool_options_from_env,
+    POOL_CHECKED_OUT, POOL_CHECKOUT_WAIT, POOL_OVERFLOW, POOL_TIMEOUTS,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def test_pool_options_from_env(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_POOL_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "300")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+
+    options = pool_options_from_env("postgresql://user:pw@db:5432/balbalm")
+
+    assert options == {
+        "poolclass": InstrumentedPool,
+        "pool_size": 20,
+        "max_overflow": 0,
+        "pool_timeout": 2.5,
+        "pool_recycle": 300,
+        "pool_pre_ping": False,
+    }
+    assert not pool_options_from_env("sqlite://")
+
+
+async def test_pool_metrics(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedPool,
+                                 pool_size=1, max_overflow=1, pool_timeout=0.05)
+    instrument_pool(engine.sync_engine, "test")
+    waits = POOL_CHECKOUT_WAIT.count(pool="test")
+
+    first = await engine.connect()
+    second = await engine.connect()  # overflow 커넥션
+    await second.execute(text("select 1"))
+    assert POOL_CHECKED_OUT.value(pool="test") == 2
+    assert POOL_OVERFLOW.value(pool="test") == 1
+
+    with pytest.raises(exc.TimeoutError):
+        await engine.connect()
+    assert POOL_TIMEOUTS.value(pool="test") == 1
+    assert POOL_CHECKOUT_WAIT.count(pool="test") == waits + 3
+
+    await first.close()
+    await second.close()
+    assert POOL_CHECKED_OUT.value(pool="test") == 0
+    await engine.dispose()
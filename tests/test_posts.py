@@ -30,8 +30,8 @@ def test_list_posts(friend_token):
     )
     print(response.json())
     assert response.status_code == 200
-    assert len(response.json()) == 1
-    assert response.json()[0]["post_id"] == 6
+    assert len(response.json()["items"]) == 1
+    assert response.json()["items"][0]["post_id"] == 6
 
 
 def test_update_post(my_token):
@@ -63,8 +63,8 @@ def test_list_posts_with_hashtag(my_token):
     )
     print(response.json())
     assert response.status_code == 200
-    assert len(response.json()) == 1
-    assert response.json()[0]["post_id"] == 6
+    assert len(response.json()["items"]) == 1
+    assert response.json()["items"][0]["post_id"] == 6
 
 
 def test_like_post(friend_token):
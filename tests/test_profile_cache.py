@@ -0,0 +1,42 @@
+import pytest
+
+from app.models.post import UserAbstractProfile
+from app.services.profile import PROFILE_CACHE_REQUESTS, ProfileCache, Profile
+from tests.seed import seed_users
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_get_many_loads_only_misses_in_one_query(db, query_budget):
+    await seed_users(db, 4)
+    cache = ProfileCache(maxsize=10, ttl=60)
+    hits = PROFILE_CACHE_REQUESTS.value(result="hit")
+
+    with query_budget(2) as queries:
+        first = await cache.get_many(db, ["user_0", "user_1", "nobody"])
+        second = await cache.get_many(db, ["user_0", "user_1", "user_2"])
+
+    assert first == {"user_0": Profile("dog_0", first["user_0"].profile_image_url),
+                     "user_1": Profile("dog_1", first["user_1"].profile_image_url)}
+    assert set(second) == {"user_0", "user_1", "user_2"}
+    assert " IN " in queries.statements[1] and len(cache) == 3
+    assert PROFILE_CACHE_REQUESTS.value(result="hit") - hits == 2
+
+
+async def test_invalidate_and_ttl_reload(db):
+    await seed_users(db, 1)
+    cache = ProfileCache(maxsize=10, ttl=60)
+    await cache.get_many(db, ["user_0"])
+
+    profile = await db.get(UserAbstractProfile, 1)
+    profile.dog_name = "renamed"
+    await db.commit()
+    assert (await cache.get_many(db, ["user_0"]))["user_0"].nickname == "dog_0"
+
+    cache.invalidate("user_0")
+    assert (await cache.get_many(db, ["user_0"]))["user_0"].nickname == "renamed"
+
+    cache.ttl = 0
+    cache.clear()
+    await cache.get_many(db, ["user_0"])
+    assert len(cache) == 1 and cache._cache.get("user_0") is None  # pylint: disable=protected-access
@@ -0,0 +1,81 @@
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.database.query_stats import track_queries
+from app.models.notification import Notification
+from app.models.post import PostHashtag
+from app.services import post as post_service
+from app.utils.access_log import AccessLogMiddleware
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+# 엔드포인트별 쿼리 예산 (인증은 토큰 캐시, 프로필은 캐시가 비어 있는 상태 기준)
+BUDGETS = [
+    ("GET", "/feed/posts?user_id=user_0", None, 4),  # 버전, 게시물, 좋아요, 프로필
+    ("GET", "/feed/posts?user_id=user_0&view=compact", None, 4),
+    ("GET", "/feed/posts/hashtag/tag", None, 4),
+    ("GET", "/feed/posts/famous", None, 3),  # 스냅샷 후보 갱신, 좋아요, 프로필
+    ("GET", "/feed/posts/1/likes", None, 3),  # 게시물 존재 확인, 좋아요, 프로필
+    ("POST", "/feed/posts/likes:batch", {"post_ids": list(range(1, 31))}, 1),
+    ("GET", "/feed/notifications", None, 4),  # 버전, 게시물별 알림, 좋아요 누른 유저, 프로필
+]
+
+
+
+@pytest.mark.parametrize("method, url, body, limit", BUDGETS)
+async def test_endpoint_stays_within_query_budget(db, client, query_budget, method, url, body, limit):
+    await seed_users(db, 6)
+    posts = await seed_posts(db, 30, likers=5)
+    db.add_all(PostHashtag(post_id=post.id, hashtag="tag", uploaded_at=post.uploaded_at) for post in posts)
+    db.add_all(Notification(user_id="user_0", post_id=post.id, unread_count=5) for post in posts)
+    await db.commit()
+
+    with query_budget(limit):
+        response = await client.request(method, url, json=body)
+
+    assert response.status_code == 200
+
+
+async def test_query_budget_reports_statements(db, query_budget):
+    await seed_users(db, 2)
+
+    with pytest.raises(AssertionError, match="exceeded the budget of 0"):
+        with query_budget(0):
+            await post_service.list_posts("user_0", db)
+
+
+async def test_nested_tracking_counts_in_both(db, query_budget):
+    await seed_users(db, 2)
+
+    with query_budget(5) as outer:
+        with track_queries() as inner:
+            await post_service.list_posts("user_0", db)
+        await post_service.list_posts("user_0", db)
+
+    assert inner.count == 1 and outer.count == 2  # 게시물이 없으면 목록 쿼리 하나
+    assert outer.seconds >= inner.seconds > 0
+
+
+async def test_access_log_has_query_fields_and_headers(db, query_budget, caplog):
+    await seed_users(db, 4)
+    await seed_posts(db, 3)
+    small = FastAPI()
+
+    @small.get("/posts")
+    async def posts():
+        return len((await post_service.list_posts("user_0", db)).items)
+
+    small.add_middleware(AccessLogMiddleware, query_headers=True)
+    caplog.set_level(logging.INFO, logger="app.access")
+
+    with query_budget(3):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=small), base_url="http://test") as http:
+            response = await http.get("/posts")
+
+    [summary] = [record for record in caplog.records if hasattr(record, "db_queries")]
+    assert summary.db_queries == int(response.headers["X-DB-Query-Count"]) == 3
+    assert response.headers["Server-Timing"] == f"db;dur={summary.db_time_ms}"
@@ -0,0 +1,35 @@
+import pytest
+
+from app.services import post as post_service
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("post_count", [1, 30])
+async def test_list_posts_query_count_is_constant(db, query_budget, post_count):
+    await seed_users(db, 4)
+    await seed_posts(db, post_count)
+
+    with query_budget(3) as queries:  # 게시물, 좋아요, 캐시에 없는 프로필
+        page = await post_service.list_posts("user_0", db, limit=100)
+
+    assert len(page.items) == post_count
+    assert all(len(post.liked_by) == 3 for post in page.items)
+    assert queries.count == 3
+
+    with query_budget(2):  # 프로필은 캐시에서
+        await post_service.list_posts("user_0", db, limit=100)
+
+
+@pytest.mark.parametrize("post_count", [1, 30])
+async def test_famous_posts_query_count_is_constant(db, query_budget, post_count):
+    await seed_users(db, 4)
+    await seed_posts(db, post_count)
+
+    with query_budget(3) as queries:  # 스냅샷, 좋아요, 캐시에 없는 프로필
+        posts = await post_service.famous_posts(db)
+
+    assert len(posts) == min(5, post_count)
+    assert all(post.like_count == 3 for post in posts)
+    assert queries.count == 3
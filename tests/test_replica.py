@@ -0,0 +1,98 @@
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import db as database
+from app.database.db import Base
+from app.database.routing import READ_ROUTING, STICKY_COOKIE, sticky_primary
+from app.main import app
+from app.services import post as post_service
+from app.utils.token import current_user
+from tests.seed import seed_users
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def databases(tmp_path, monkeypatch):
+    """
+    primary / replica 로 쓸 SQLite 파일 두 개 (복제는 하지 않으므로 replica 는 항상 뒤처진 상태)
+    """
+    factories = []
+    for name in ("primary", "replica"):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factories.append((engine, async_sessionmaker(engine, autoflush=False, expire_on_commit=False)))
+    (primary, primary_factory), (replica, replica_factory) = factories
+    monkeypatch.setattr(database, "SessionLocal", primary_factory)
+    monkeypatch.setattr(database, "ReadSessionLocal", replica_factory)
+    sticky_primary.clear()
+    for factory in (primary_factory, replica_factory):
+        async with factory() as session:
+            await seed_users(session, 2)
+            await post_service.create_post_with_images("user_0", session, "#tag 복제된 글", [])
+    yield primary_factory
+    sticky_primary.clear()
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.fixture
+def login(monkeypatch):
+    def as_user(user_id):
+        app.dependency_overrides[current_user] = lambda: user_id
+    yield as_user
+    app.dependency_overrides.clear()
+
+
+async def test_reads_go_to_replica_until_the_author_writes(databases, login):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        login("user_0")
+        replica_reads = READ_ROUTING.value(target="replica")
+        assert len((await client.get("/feed/posts?user_id=user_0")).json()["items"]) == 1
+        assert READ_ROUTING.value(target="replica") == replica_reads + 1
+
+        created = await client.post("/feed/posts", json={"image_urls": [], "content": "#tag 새 글"})
+        assert created.status_code == 200
+
+        # 쓴 사람은 바로 primary 에서 읽어서 자기 글이 보인다
+        assert len((await client.get("/feed/posts?user_id=user_0")).json()["items"]) == 2
+        assert len((await client.get("/feed/posts/hashtag/tag")).json()["items"]) == 2
+
+        # 다른 유저(다른 클라이언트라 쿠키도 없음)는 계속 복제본에서 읽는다
+        login("user_1")
+        client.cookies.clear()
+        assert len((await client.get("/feed/posts?user_id=user_0")).json()["items"]) == 1
+
+
+async def test_sticky_window_expires(databases, login, monkeypatch):
+    monkeypatch.setattr(sticky_primary, "window", 0)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        login("user_0")
+        await client.post("/feed/posts", json={"image_urls": [], "content": "#tag 새 글"})
+
+        assert len((await client.get("/feed/posts?user_id=user_0")).json()["items"]) == 1
+
+
+async def test_sticky_cookie_covers_other_processes(databases, login):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        login("user_0")
+        created = await client.post("/feed/posts", json={"image_urls": [], "content": "#tag 새 글"})
+        assert STICKY_COOKIE in created.cookies
+
+        sticky_primary.clear()  # 다음 요청이 다른 워커로 간 것처럼
+        assert len((await client.get("/feed/posts?user_id=user_0")).json()["items"]) == 2
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # 쿠키가 없는 클라이언트는 복제본에서 읽는다
+        assert len((await client.get("/feed/posts?user_id=user_0")).json()["items"]) == 1
+
+
+async def test_like_reads_use_replica(databases, login):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        login("user_1")
+        replica_reads = READ_ROUTING.value(target="replica")
+        assert (await client.post("/feed/posts/likes:batch", json={"post_ids": [1]})).status_code == 200
+        assert (await client.get("/feed/posts/1/likes")).status_code == 200
+        assert READ_ROUTING.value(target="replica") == replica_reads + 2
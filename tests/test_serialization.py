@@ -0,0 +1,40 @@
+import json
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.schemas.notification import NotiPage
+from app.schemas.post import PostPage
+from app.services import notification as noti_service
+from app.services import post as post_service
+from app.services.outbox import process_outbox
+from app.utils.serialization import TrustedJSONResponse
+from tests.seed import seed_users, seed_posts
+
+pytestmark = pytest.mark.anyio
+
+
+def validated_json(model_class, page):
+    # 기존 경로: 다시 검증하고 jsonable_encoder 로 변환
+    return jsonable_encoder(model_class(**json.loads(json.dumps(jsonable_encoder(page)))))
+
+
+@pytest.mark.parametrize("compact", [False, True])
+async def test_trusted_post_page_matches_validated_output(db, compact):
+    await seed_users(db, 4)
+    await seed_posts(db, 5)
+
+    page = await post_service.list_posts("user_0", db, limit=3, viewer_id="user_1", compact=compact)
+
+    assert json.loads(TrustedJSONResponse(page).body) == validated_json(PostPage, page)
+
+
+async def test_trusted_notification_page_matches_validated_output(db):
+    await seed_users(db, 3)
+    [post] = await seed_posts(db, 1, likers=0)
+    await post_service.toggle_post_like(post.id, "user_1", db)
+    await process_outbox(db)
+
+    page = await noti_service.get_notifications("user_0", db)
+
+    assert json.loads(TrustedJSONResponse(page).body) == validated_json(NotiPage, page)
@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.database import db
+
+pytestmark = pytest.mark.anyio
+
+# import app.main 목표 시간 (로컬 측정 약 0.55초, 지연 초기화 전 약 0.93초), CI 편차를 감안한 상한
+IMPORT_TIME_BUDGET_SECONDS = 1.5
+# 처음 쓸 때 불러와야 하는 무거운 모듈
+LAZY_MODULES = ("boto3", "botocore", "PIL", "sshtunnel", "paramiko", "aiosqlite", "asyncpg")
+
+SCRIPT = f"""
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+from app.database import db
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": sorted(set(sys.modules) & set({LAZY_MODULES!r})),
+    "engine": db.engine is not None,
+}}))
+"""
+
+
+def _import_app(database_url: str) -> dict:
+    env = {**os.environ, "DATABASE_URL": database_url}
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", SCRIPT], cwd=root, env=env, capture_output=True, text=True,
+                            check=True, timeout=60).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_is_fast_and_side_effect_free(tmp_path):
+    database = tmp_path / "never.db"
+
+    runs = [_import_app(f"sqlite:///{database}") for _ in range(2)]
+
+    assert all(not run["modules"] for run in runs), runs
+    assert not any(run["engine"] for run in runs)
+    assert not database.exists()  # 접속도, 테이블 생성도 하지 않는다
+    assert min(run["seconds"] for run in runs) < IMPORT_TIME_BUDGET_SECONDS, runs
+
+
+async def test_engines_are_created_on_first_use_and_disposed(monkeypatch, tmp_path):
+    await db.dispose_engines()
+    assert db.engine is None and db.SessionLocal is None
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'lazy.db'}")
+
+    factory = db.session_factory()
+
+    assert db.engine.url.database == str(tmp_path / "lazy.db")
+    assert db.SessionLocal is factory and db.session_factory() is factory
+    assert db.read_session_factory() is factory and db.replica_engine is None
+    await db.dispose_engines()
+    assert db.engine is None and db.SessionLocal is None and db.ReadSessionLocal is None
@@ -0,0 +1,72 @@
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app import main  # pylint: disable=unused-import  # AuthJWT 설정(load_config) 로드
+from app.utils import token as token_utils
+from app.utils.cache import TTLCache
+from app.utils.token import create_jwt_access_token, current_user
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("JWT_SECRET_KEY", "test_token")
+    monkeypatch.setenv("JWT_EXPIRATION_DELTA", "60")
+    token_utils.verified_tokens.clear()
+
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(user_id: str = Depends(current_user)):
+        return {"user_id": user_id}
+
+    return TestClient(app)
+
+
+def test_verifies_signature_once_then_uses_cache(client, monkeypatch):
+    calls = []
+    verify = token_utils._verify_access_token  # pylint: disable=protected-access
+    monkeypatch.setattr(token_utils, "_verify_access_token", lambda *args: calls.append(1) or verify(*args))
+    headers = {"Authorization": f"Bearer {create_jwt_access_token('user_0')}"}
+
+    for _ in range(3):
+        response = client.get("/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json() == {"user_id": "user_0"}
+    assert len(calls) == 1
+
+
+def test_cached_token_is_reverified_after_cache_ttl(client, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(token_utils, "verified_tokens", TTLCache(10, clock=lambda: now[0]))
+    monkeypatch.setattr(token_utils, "TOKEN_CACHE_TTL", 30)
+    calls = []
+    verify = token_utils._verify_access_token  # pylint: disable=protected-access
+    monkeypatch.setattr(token_utils, "_verify_access_token", lambda *args: calls.append(1) or verify(*args))
+    headers = {"Authorization": f"Bearer {create_jwt_access_token('user_0')}"}
+
+    assert client.get("/me", headers=headers).status_code == 200
+    now[0] += 29
+    assert client.get("/me", headers=headers).status_code == 200
+    now[0] += 2  # exp 는 한참 남았어도 TTL 이 지나면 다시 검증 (denylist 포함)
+    assert client.get("/me", headers=headers).status_code == 200
+    assert len(calls) == 2
+
+
+def test_rejects_missing_and_invalid_tokens(client):
+    assert client.get("/me").status_code == 401
+    assert client.get("/me", headers={"Authorization": "Bearer not-a-jwt"}).status_code == 401
+    assert len(token_utils.verified_tokens) == 0
+
+
+def test_cache_is_bounded_and_evicts_expired():
+    cache = TTLCache(maxsize=2)
+    cache.put("a", 1, expires_at=100)
+    cache.put("b", 2, expires_at=200)
+    cache.get("a", now=50)
+    cache.put("c", 3, expires_at=300)
+
+    assert cache.get("b", now=50) is None  # 가장 오래 안 쓴 것부터 밀려남
+    assert cache.get("a", now=150) is None  # 만료되면 제거
+    assert cache.get("c", now=150) == 3
+    assert len(cache) == 1
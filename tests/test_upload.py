@@ -0,0 +1,83 @@
+import pytest
+from fastapi import HTTPException
+
+from app.utils import upload
+from app.utils.image import get_s3_client, key_from_url
+from tests.seed import stored_keys
+
+pytestmark = pytest.mark.anyio
+
+BOUNDARY = "feedboundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def form_body(content, images):
+    body = bytearray()
+    body += (f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"content\"\r\n\r\n{content}\r\n").encode()
+    for idx, data in enumerate(images):
+        body += (f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"images\"; filename=\"{idx}.jpg\"\r\n"
+                 "Content-Type: image/jpeg\r\n\r\n").encode()
+        body += data + b"\r\n"
+    body += f"--{BOUNDARY}--\r\n".encode()
+    return bytes(body)
+
+
+async def chunked(body, size=64 * 1024):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+async def test_streams_images_to_s3(s3):
+    small = b"\xff\xd8" + b"s" * 1000
+    large = b"\xff\xd8" + b"l" * (6 * 1024 * 1024)  # 파트 두 개로 나뉘는 multipart upload
+
+    content, urls = await upload.stream_post_form(
+        CONTENT_TYPE, chunked(form_body("#walk 산책", [small, large])), get_s3_client()
+    )
+
+    assert content == "#walk 산책"
+    assert stored_keys(s3) == sorted(key_from_url(url) for url in urls)
+    stored = [s3.get_object(Bucket="balm-bucket", Key=key_from_url(url))["Body"].read() for url in urls]
+    assert stored == [small, large]
+
+
+async def test_image_size_limit_enforced_while_streaming(s3, monkeypatch):
+    monkeypatch.setattr(upload, "MAX_IMAGE_BYTES", 2048)
+
+    with pytest.raises(HTTPException) as exc:
+        await upload.stream_post_form(
+            CONTENT_TYPE, chunked(form_body("hi", [b"a" * 100, b"b" * 4096]), size=512), get_s3_client()
+        )
+
+    assert exc.value.status_code == 413
+    assert stored_keys(s3) == []  # 먼저 올라간 이미지도 정리
+
+
+async def test_request_size_limit_aborts_multipart_upload(s3, monkeypatch):
+    monkeypatch.setattr(upload, "MAX_UPLOAD_BYTES", 7 * 1024 * 1024)
+
+    with pytest.raises(HTTPException) as exc:
+        await upload.stream_post_form(
+            CONTENT_TYPE, chunked(form_body("hi", [b"c" * (8 * 1024 * 1024)])), get_s3_client()
+        )
+
+    assert exc.value.status_code == 413
+    assert s3.list_multipart_uploads(Bucket="balm-bucket").get("Uploads", []) == []
+
+
+async def test_rejects_non_multipart(s3):
+    with pytest.raises(HTTPException) as exc:
+        await upload.stream_post_form("application/json", chunked(b"{}"), get_s3_client())
+    assert exc.value.status_code == 415
+
+
+@pytest.mark.parametrize("image_type", ["image/svg+xml", "image/heic", "text/html"])
+async def test_rejects_image_types_outside_allow_list(s3, image_type):
+    body = form_body("hi", [b"\xff\xd8" + b"a" * 100, b"<svg onload=alert(1)/>"])
+    body = body.replace(b"image/jpeg\r\n\r\n<svg", f"{image_type}\r\n\r\n<svg".encode())
+
+    with pytest.raises(HTTPException) as exc:
+        await upload.stream_post_form(CONTENT_TYPE, chunked(body), get_s3_client())
+
+    assert exc.value.status_code == 415
+    assert stored_keys(s3) == []  # 앞서 올라간 jpeg 도 정리
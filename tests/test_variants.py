@@ -0,0 +1,105 @@
+import io
+
+import pytest
+from PIL import Image
+from sqlalchemy import select
+
+from app.models.post import Post
+from app.models.variant import ImageVariantJob, VARIANT_UNSUPPORTED
+from app.schemas.post import PostResponse
+from app.services import image_variant
+from app.services import post as post_service
+from app.utils import image, variants
+from tests.seed import seed_users, stored_keys
+
+pytestmark = pytest.mark.anyio
+
+URL = "https://balm-bucket.s3.amazonaws.com/images/feed/abc.jpg"
+
+
+def jpeg(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "orange").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def test_variant_urls_sit_next_to_original():
+    assert variants.variant_urls(URL) == {
+        "thumb": "https://balm-bucket.s3.amazonaws.com/images/feed/abc_thumb.webp",
+        "medium": "https://balm-bucket.s3.amazonaws.com/images/feed/abc_medium.webp",
+    }
+
+
+def test_render_resizes_without_upscaling():
+    rendered = variants.render_variants(jpeg(2000, 1000))
+    assert Image.open(io.BytesIO(rendered["thumb"])).size == (320, 160)
+    assert Image.open(io.BytesIO(rendered["medium"])).size == (1080, 540)
+
+    small = variants.render_variants(jpeg(200, 100))
+    assert Image.open(io.BytesIO(small["medium"])).size == (200, 100)
+    assert Image.open(io.BytesIO(small["medium"])).format == "WEBP"
+
+
+def test_post_response_falls_back_to_original_url():
+    response = PostResponse(post_id=1, user_id="user_0", image_urls=[URL], content=None,
+                            uploaded_at="2024-01-01T00:00:00", liked_by=[])
+
+    assert response.image_variants[0].thumb == URL and response.image_variants[0].medium == URL
+
+
+def test_executor_spawns_workers():
+    try:
+        assert variants._executor_instance()._mp_context.get_start_method() == "spawn"  # pylint: disable=protected-access
+    finally:
+        variants._executor_instance().shutdown()  # pylint: disable=protected-access
+        variants._executor = None  # pylint: disable=protected-access
+
+
+async def jobs(db):
+    return (await db.scalars(select(ImageVariantJob).order_by(ImageVariantJob.id))).all()
+
+
+async def test_variants_are_listed_only_after_the_worker_made_them(s3, db):
+    await seed_users(db, 1)
+    bad_url = URL.replace("abc.jpg", "bad.jpg")
+    s3.put_object(Bucket=image.BUCKET_NAME, Key="images/feed/abc.jpg", Body=jpeg(1600, 1200))
+    s3.put_object(Bucket=image.BUCKET_NAME, Key="images/feed/bad.jpg", Body=b"not an image")
+
+    created = await post_service.create_post_with_images("user_0", db, "#v", [URL, bad_url])
+    assert [variant.thumb for variant in created.image_variants] == [URL, bad_url]  # 아직 원본
+    assert [job.position for job in await jobs(db)] == [0, 1]
+
+    try:
+        assert await image_variant.process_variant_jobs(db) == 2
+    finally:
+        await variants.shutdown()
+
+    [listed] = (await post_service.list_posts("user_0", db)).items
+    assert listed.image_variants[0].thumb == variants.variant_urls(URL)["thumb"]
+    assert listed.image_variants[1].thumb == bad_url  # 만들 수 없는 이미지는 원본 URL
+    [unsupported] = await jobs(db)
+    assert unsupported.position == 1 and unsupported.status == VARIANT_UNSUPPORTED
+    assert "images/feed/abc_thumb.webp" in stored_keys(s3)
+
+
+async def test_failed_jobs_are_retried_later(s3, db):  # pylint: disable=unused-argument
+    await seed_users(db, 1)
+    await post_service.create_post_with_images("user_0", db, None, [URL])  # S3 에 원본이 없다
+
+    assert await image_variant.process_variant_jobs(db) == 1
+    [job] = await jobs(db)
+    assert job.attempts == 1 and job.status == "pending" and job.last_error
+    assert await image_variant.process_variant_jobs(db) == 0  # 재시도 시각 전
+    assert (await db.scalar(select(Post))).image_variants is None
+
+
+async def test_generate_variants_uploads_to_s3(s3):
+    s3.put_object(Bucket=image.BUCKET_NAME, Key="images/feed/abc.jpg", Body=jpeg(1600, 1200))
+
+    try:
+        urls = await variants.generate_variants(URL)
+    finally:
+        await variants.shutdown()
+
+    assert urls == variants.variant_urls(URL)
+    assert stored_keys(s3) == ["images/feed/abc.jpg", "images/feed/abc_medium.webp", "images/feed/abc_thumb.webp"]